@@ -9,17 +9,32 @@
 
 import sys
 
-# Проверка платформы
-if sys.platform == 'win32':
-    try:
-        import win32com.client
-        COM_AVAILABLE = True
-    except ImportError:
-        print("⚠️ pywin32 не установлен. Установите: pip install pywin32")
-        COM_AVAILABLE = False
-else:
-    print("⚠️ Этот код работает только на Windows")
-    COM_AVAILABLE = False
+# Проверка платформы выполняется при первом подключении, а не при импорте
+_COM_ДОСТУПЕН = None
+
+
+def com_доступен():
+    """
+    Проверяет, можно ли использовать COM (Windows и установленный pywin32)
+
+    Результат запоминается, предупреждение печатается только один раз.
+
+    Returns:
+        bool: True если win32com можно импортировать
+    """
+    global _COM_ДОСТУПЕН
+    if _COM_ДОСТУПЕН is None:
+        if sys.platform != 'win32':
+            print("⚠️ Этот код работает только на Windows")
+            _COM_ДОСТУПЕН = False
+        else:
+            try:
+                import win32com.client  # noqa: F401
+                _COM_ДОСТУПЕН = True
+            except ImportError:
+                print("⚠️ pywin32 не установлен. Установите: pip install pywin32")
+                _COM_ДОСТУПЕН = False
+    return _COM_ДОСТУПЕН
 
 
 def подключиться_к_rastrwin():
@@ -29,10 +44,12 @@ def подключиться_к_rastrwin():
     Returns:
         Объект RasterWin или None если не удалось подключиться
     """
-    if not COM_AVAILABLE:
+    if not com_доступен():
         print("❌ COM недоступен на этой платформе")
         return None
     
+    import win32com.client
+    
     try:
         # Способ 1: Использование ProgID (рекомендуемый способ)
         # Это то, что используется в реальных проектах
@@ -0,0 +1,124 @@
+"""
+ПРИМЕР: Проверка времени импорта модулей (python -X importtime)
+
+Короткоживущие рабочие процессы и запуски из командной строки платят за
+импорт до того, как сделают что-то полезное. openpyxl, pandas и win32com
+должны загружаться только в функциях, которым они нужны. Этот скрипт
+импортирует каждый модуль Примеры/ в отдельном интерпретаторе с
+-X importtime, показывает время импорта и тяжелые зависимости и
+завершается с кодом 1, если модуль тянет запрещенную зависимость или
+превышает предел времени. Его можно запускать в CI как защиту от
+регрессий.
+
+Запуск:
+    python пример_время_импорта.py
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ПАПКА_ПРИМЕРОВ = Path(__file__).resolve().parent
+
+# Зависимости, которые не должны загружаться при импорте модулей
+ЗАПРЕЩЕННЫЕ_ПРИ_ИМПОРТЕ = ("openpyxl", "pandas", "win32com", "pythoncom")
+
+# Предел времени импорта одного модуля, мс (numpy занимает большую часть)
+ПРЕДЕЛ_МС = 500.0
+
+# Строка вывода -X importtime: "import time:  self [us] | cumulative | имя"
+_СТРОКА_ВРЕМЕНИ = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def модули_примеров(папка=ПАПКА_ПРИМЕРОВ):
+    """Имена модулей пример_*.py в папке (без этого скрипта)"""
+    return sorted(
+        путь.stem for путь in папка.glob("пример_*.py") if путь.stem != Path(__file__).stem
+    )
+
+
+def измерить_импорт(модуль, папка=ПАПКА_ПРИМЕРОВ):
+    """
+    Импортирует модуль в отдельном интерпретаторе с -X importtime
+
+    Args:
+        модуль: Имя модуля
+        папка: Папка, из которой запускается интерпретатор
+
+    Returns:
+        dict: {"Время_мс": float, "Модули": set, "Ошибка": str или None}
+    """
+    процесс = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {модуль}"],
+        cwd=папка, capture_output=True, text=True, encoding="utf-8",
+    )
+
+    время_мс = 0.0
+    модули = set()
+    for строка in процесс.stderr.splitlines():
+        совпадение = _СТРОКА_ВРЕМЕНИ.match(строка)
+        if совпадение is None:
+            continue
+        имя = совпадение.group(4)
+        модули.add(имя.split(".")[0])
+        if имя == модуль:
+            время_мс = int(совпадение.group(2)) / 1000
+
+    ошибка = None
+    if процесс.returncode != 0:
+        ошибка = (процесс.stderr.strip().splitlines() or ["неизвестная ошибка"])[-1]
+    return {"Время_мс": время_мс, "Модули": модули, "Ошибка": ошибка}
+
+
+def проверить_импорт(модули=None, предел_мс=ПРЕДЕЛ_МС, повторов=3):
+    """
+    Проверяет время импорта и отсутствие тяжелых зависимостей
+
+    Args:
+        модули: Список модулей (по умолчанию все пример_*.py)
+        предел_мс: Предел времени импорта одного модуля, мс
+        повторов: Сколько раз импортировать (берется минимальное время)
+
+    Returns:
+        list: Нарушения (пустой список - все в порядке)
+    """
+    модули = модули_примеров() if модули is None else модули
+    нарушения = []
+
+    print("="*60)
+    print(f"ВРЕМЯ ИМПОРТА МОДУЛЕЙ (предел {предел_мс:.0f} мс)")
+    print("="*60)
+
+    for модуль in модули:
+        замеры = [измерить_импорт(модуль) for _ in range(повторов)]
+        замер = min(замеры, key=lambda з: з["Время_мс"])
+
+        if замер["Ошибка"]:
+            # Например, не установлен numpy - это не регрессия импорта
+            print(f"  ⚠️ {модуль}: не импортируется ({замер['Ошибка']})")
+            continue
+
+        тяжелые = sorted(set(ЗАПРЕЩЕННЫЕ_ПРИ_ИМПОРТЕ) & замер["Модули"])
+        отметка = "✅"
+        if тяжелые:
+            нарушения.append(f"{модуль}: при импорте загружаются {', '.join(тяжелые)}")
+            отметка = "❌"
+        if замер["Время_мс"] > предел_мс:
+            нарушения.append(f"{модуль}: импорт {замер['Время_мс']:.0f} мс > {предел_мс:.0f} мс")
+            отметка = "❌"
+        print(f"  {отметка} {модуль:<45} {замер['Время_мс']:7.1f} мс"
+              + (f"   тяжелые: {', '.join(тяжелые)}" if тяжелые else ""))
+
+    return нарушения
+
+
+# Пример использования
+if __name__ == "__main__":
+    нарушения = проверить_импорт()
+    if нарушения:
+        print("\n❌ Нарушения:")
+        for нарушение in нарушения:
+            print(f"  - {нарушение}")
+        sys.exit(1)
+    print("\n✅ Все модули импортируются быстро и без тяжелых зависимостей")
@@ -0,0 +1,250 @@
+"""
+ПРИМЕР: Выгрузка результатов по списку контролируемых узлов за один проход
+
+извлечь_данные_из_таблицы_узлов находит один узел выборкой (SetSel +
+FindNextSel) и читает vras, p, q и name по ячейке, возвращая словарь. Для
+сотен контролируемых узлов в каждом сценарии это сотни просмотров таблицы
+и тысячи COM-вызовов. Здесь номера строк берутся из ИндексСтрок, нужные
+колонки читаются за один проход по таблице (ReadSafeArray или кэш объектов
+колонок ЧтениеТаблиц), а результат - структурированный массив NumPy (или
+DataFrame) со строкой на каждый узел.
+"""
+
+import time
+
+import numpy as np
+
+from пример_индекс_строк import ИндексСтрок
+
+# Колонки результатов узла, как в извлечь_данные_из_таблицы_узлов
+КОЛОНКИ_УЗЛА = ("vras", "p", "q", "name")
+
+# Типы полей результата: не зависят от значений и от того, найдены ли узлы.
+# Колонки, которых здесь нет, выгружаются как ТИП_ПО_УМОЛЧАНИЮ.
+ТИПЫ_КОЛОНОК_УЗЛА = {
+    "ny": np.int64,
+    "tip": np.int64,
+    "sta": np.int64,
+    "na": np.int64,
+    "name": "U64",
+    "uhom": np.float64,
+    "vras": np.float64,
+    "delta": np.float64,
+    "p": np.float64,
+    "q": np.float64,
+    "pg": np.float64,
+    "qg": np.float64,
+    "pn": np.float64,
+    "qn": np.float64,
+}
+ТИП_ПО_УМОЛЧАНИЮ = np.float64
+
+# Колонка таблицы node -> ключ словаря извлечь_данные_из_таблицы_узлов
+ИМЕНА_ДАННЫХ_УЗЛА = {
+    "vras": "Напряжение",
+    "p": "Мощность_P",
+    "q": "Мощность_Q",
+    "name": "Название",
+}
+
+
+class ВыгрузкаУзлов:
+    """
+    Выгрузка колонок таблицы node для списка номеров узлов
+
+    Пример:
+        выгрузка = ВыгрузкаУзлов(rastr)
+        результаты = выгрузка.выгрузить([123, 456, 789])
+        print(результаты["vras"], результаты["найден"])
+
+    После Load/NewFile нужно вызвать сбросить() (как у ИндексСтрок).
+    """
+
+    def __init__(self, rastr, колонки=КОЛОНКИ_УЗЛА, типы_колонок=None):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+            колонки: Колонки таблицы node для выгрузки
+            типы_колонок: {колонка: тип NumPy} в дополнение к ТИПЫ_КОЛОНОК_УЗЛА
+        """
+        # ny - всегда первое поле результата
+        self.колонки = [колонка for колонка in колонки if колонка != "ny"]
+        типы = {**ТИПЫ_КОЛОНОК_УЗЛА, **(типы_колонок or {})}
+        self.тип = np.dtype([("ny", np.int64), ("найден", np.bool_)] + [
+            (колонка, типы.get(колонка, ТИП_ПО_УМОЛЧАНИЮ)) for колонка in self.колонки
+        ])
+        self.индекс = ИндексСтрок(rastr)
+        # Общий кэш объектов таблиц и колонок с индексом
+        self.чтение = self.индекс.чтение
+
+    def сбросить(self):
+        """Забывает индекс и объекты колонок (нужно после Load/NewFile)"""
+        self.индекс.сбросить()
+
+    def _прочитать_строки(self, строки):
+        """
+        Значения колонок в заданных строках
+
+        С ReadSafeArray таблица читается одним вызовом и нужные строки
+        выбираются индексированием; без него читаются только нужные ячейки
+        через кэшированные объекты колонок.
+        """
+        таблица = self.чтение.таблица("node")
+        if hasattr(таблица, "ReadSafeArray"):
+            данные = self.чтение.прочитать_колонки("node", self.колонки)
+            return {
+                колонка: [значения[строка] for строка in строки]
+                for колонка, значения in данные.items()
+            }
+        return {
+            колонка: [self.чтение.колонка("node", колонка).Z(строка) for строка in строки]
+            for колонка in self.колонки
+        }
+
+    def выгрузить(self, номера_узлов):
+        """
+        Колонки узлов за один проход по таблице
+
+        Args:
+            номера_узлов: Список или массив номеров узлов (ny)
+
+        Returns:
+            numpy.ndarray: Структурированный массив в порядке номеров_узлов
+                с типом self.тип: поля ny, найден и колонки; у ненайденных
+                узлов вещественные - nan, целые - 0, строки - ""
+        """
+        номера = np.asarray(номера_узлов, dtype=np.int64)
+        # Одна сверка числа строк (Count) на весь список узлов
+        строки = self.индекс.строки("node", номера, проверить=True)
+        найден = строки >= 0
+        данные = self._прочитать_строки(строки[найден].tolist())
+
+        результат = np.zeros(len(номера), dtype=self.тип)
+        результат["ny"] = номера
+        результат["найден"] = найден
+        for колонка in self.колонки:
+            if self.тип[колонка].kind == "f":
+                результат[колонка] = np.nan
+            результат[колонка][найден] = данные[колонка]
+        return результат
+
+    def выгрузить_dataframe(self, номера_узлов):
+        """
+        То же, что выгрузить(), в виде pandas.DataFrame с индексом ny
+
+        Returns:
+            pandas.DataFrame
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.выгрузить(номера_узлов)).set_index("ny")
+
+
+def запись_как_словарь(запись):
+    """
+    Строка результата выгрузить() в формате извлечь_данные_из_таблицы_узлов
+
+    Returns:
+        dict или None, если узел не найден
+    """
+    if not запись["найден"]:
+        return None
+    return {
+        ИМЕНА_ДАННЫХ_УЗЛА.get(колонка, колонка): запись[колонка].item()
+        for колонка in запись.dtype.names if колонка not in ("ny", "найден")
+    }
+
+
+def _данные_узла_выборкой(rastr, выборка_узла):
+    """Реальный путь извлечь_данные_из_таблицы_узлов: выборка и чтение по ячейке"""
+    table_node = rastr.Tables.Item("node")
+    table_node.SetSel(выборка_узла)
+    row = table_node.FindNextSel(-1)
+    if row == -1:
+        return None
+    return {
+        "Напряжение": table_node.Cols("vras").Z(row),
+        "Мощность_P": table_node.Cols("p").Z(row),
+        "Мощность_Q": table_node.Cols("q").Z(row),
+        "Название": table_node.Cols("name").Z(row),
+    }
+
+
+def сравнить_с_поузловым_извлечением(число_узлов=10_000, число_контролируемых=500,
+                                     задержка_вызова=20e-6):
+    """
+    Бенчмарк: словарь на каждый узел (выборка + чтение по ячейке) и
+    выгрузка всех контролируемых узлов за один проход
+
+    Returns:
+        dict: Время и число вызовов для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("\n" + "="*60)
+    print(f"ВЫГРУЗКА УЗЛОВ: {число_контролируемых} из {число_узлов} узлов, "
+          f"{задержка_вызова * 1e6:.0f} мкс на вызов")
+    print("="*60)
+
+    контролируемые = np.random.default_rng(0).choice(
+        np.arange(1, число_узлов + 1), число_контролируемых, replace=False
+    ).tolist()
+
+    сводка = {}
+    результаты = {}
+    for способ in ("По узлу", "Одним проходом", "Повторно (кэш)"):
+        if способ != "Повторно (кэш)":
+            rastr = ИмитаторRastr(число_узлов=число_узлов, задержка_вызова=задержка_вызова)
+            rastr.rgm("p")
+            выгрузка = ВыгрузкаУзлов(rastr)
+        rastr.счетчики_вызовов.clear()
+
+        начало = time.perf_counter()
+        if способ == "По узлу":
+            результаты[способ] = [_данные_узла_выборкой(rastr, f"ny={ny}") for ny in контролируемые]
+        else:
+            результаты[способ] = [запись_как_словарь(запись)
+                                  for запись in выгрузка.выгрузить(контролируемые)]
+        время = time.perf_counter() - начало
+
+        вызовов = sum(rastr.счетчики_вызовов.values())
+        сводка[способ] = {"Время": время, "Вызовов": вызовов}
+        print(f"  {способ:<15} время: {время:7.3f} с   вызовов: {вызовов:6d}")
+
+    assert результаты["По узлу"] == результаты["Одним проходом"] == результаты["Повторно (кэш)"]
+    print(f"\n  Ускорение: {сводка['По узлу']['Время'] / сводка['Одним проходом']['Время']:.0f}x")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Выгрузка контролируемых узлов")
+    print("="*60)
+
+    rastr = ИмитаторRastr(число_узлов=30)
+    rastr.rgm("p")
+
+    выгрузка = ВыгрузкаУзлов(rastr)
+    результаты = выгрузка.выгрузить([12, 5, 999, 27])
+    print()
+    for запись in результаты:
+        if запись["найден"]:
+            print(f"  ny={запись['ny']:<4} {запись['name']:<8} U={запись['vras']:7.2f} кВ  "
+                  f"P={запись['p']:6.1f}  Q={запись['q']:6.1f}")
+        else:
+            print(f"  ny={запись['ny']:<4} не найден")
+    print(f"\nКак словарь: {запись_как_словарь(результаты[0])}")
+
+    # Тип результата один и тот же при любом составе узлов
+    assert выгрузка.выгрузить([999]).dtype == выгрузка.выгрузить([12, 5]).dtype == результаты.dtype
+    print(f"Тип результата: {результаты.dtype}")
+
+    try:
+        print(f"\n{выгрузка.выгрузить_dataframe([12, 5, 27])}")
+    except ImportError:
+        print("\n⚠️ pandas не установлен: DataFrame пропущен")
+
+    сравнить_с_поузловым_извлечением()
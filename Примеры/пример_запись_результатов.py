@@ -5,11 +5,11 @@
 динамической устойчивости в Excel файл.
 """
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from openpyxl.utils import get_column_letter
 from pathlib import Path
 
+# openpyxl импортируется внутри функций: модуль можно импортировать
+# (например, в рабочем процессе) без затрат на загрузку openpyxl
+
 
 def создать_шаблон_результатов(путь_к_файлу):
     """
@@ -18,6 +18,9 @@ def создать_шаблон_результатов(путь_к_файлу):
     Args:
         путь_к_файлу: Путь для сохранения файла
     """
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, Alignment, PatternFill
+
     workbook = Workbook()
     worksheet = workbook.active
     worksheet.title = "Результаты"
@@ -68,6 +71,9 @@ def записать_результаты_генераторов(путь_к_ф
             ...
         ]
     """
+    from openpyxl import load_workbook
+    from openpyxl.styles import Alignment, PatternFill
+
     if not Path(путь_к_файлу).exists():
         создать_шаблон_результатов(путь_к_файлу)
     
@@ -122,6 +128,9 @@ def записать_общие_результаты(путь_к_файлу, о
             ...
         }
     """
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font, PatternFill
+
     if not Path(путь_к_файлу).exists():
         workbook = Workbook()
         workbook.active.title = "Общие результаты"
@@ -174,6 +183,9 @@ def записать_результаты_из_словаря(путь_к_фай
         словарь_результатов: Словарь с результатами (может быть вложенным)
         лист: Название листа
     """
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font
+
     if not Path(путь_к_файлу).exists():
         workbook = Workbook()
         workbook.active.title = лист
@@ -216,6 +228,48 @@ def записать_результаты_из_словаря(путь_к_фай
     print(f"✅ Результаты из словаря записаны в {путь_к_файлу}")
 
 
+def записать_траектории(путь_к_файлу, траектории, лист="Траектории"):
+    """
+    Записывает траектории в Excel: по две колонки (время, значение) на сигнал
+
+    Траектории лучше заранее проредить (см. пример_прореживание_траекторий):
+    время записи пропорционально числу точек.
+
+    Args:
+        путь_к_файлу: Путь к Excel файлу
+        траектории: Траектории или ПрореженныеТраектории (время - вектор
+            или матрица сигналы x точки, значения - матрица сигналы x точки)
+        лист: Название листа
+    """
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font
+
+    if Path(путь_к_файлу).exists():
+        workbook = load_workbook(путь_к_файлу)
+    else:
+        workbook = Workbook()
+        workbook.active.title = лист
+
+    if лист in workbook.sheetnames:
+        del workbook[лист]
+    worksheet = workbook.create_sheet(лист)
+
+    время = траектории.время
+    for номер, сигнал in enumerate(траектории.сигналы):
+        col = 2 * номер + 1
+        worksheet.cell(1, col, "t, с").font = Font(bold=True)
+        worksheet.cell(1, col + 1, ".".join(map(str, сигнал))).font = Font(bold=True)
+
+        время_сигнала = время[номер] if getattr(время, "ndim", 1) == 2 else время
+        for row_idx, (t, значение) in enumerate(
+                zip(время_сигнала.tolist(), траектории.значения[номер].tolist()), start=2):
+            worksheet.cell(row_idx, col, t)
+            worksheet.cell(row_idx, col + 1, значение)
+
+    workbook.save(путь_к_файлу)
+    print(f"✅ Траектории записаны в {путь_к_файлу}")
+
+
 # Пример использования
 if __name__ == "__main__":
     print("="*60)
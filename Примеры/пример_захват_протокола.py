@@ -0,0 +1,218 @@
+"""
+ПРИМЕР: Ограниченный захват событий OnLog с фильтрами
+
+Протокол расчета динамики может содержать сотни тысяч сообщений, и если
+складывать каждое подходящее сообщение в список (как напряжения в
+пример_обработки_протокола), память растет вместе с длиной протокола.
+Здесь события OnLog проверяются скомпилированными фильтрами в момент
+поступления. Подходящие записи попадают в кольцевой буфер фиксированной
+емкости, а для остальных ведутся только счетчики по уровням. Память на
+один расчет постоянна, а буфер можно читать во время расчета.
+"""
+
+import re
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque, namedtuple
+
+СобытиеПротокола = namedtuple(
+    "СобытиеПротокола", ["номер", "категория", "код", "уровень", "таблица", "индекс", "описание"]
+)
+
+# Уровни OnLog (условные, как в имитаторе) -> категория счетчика
+УРОВНИ_ПРОТОКОЛА = {
+    0: "Ошибка",
+    1: "Предупреждение",
+    2: "Сообщение",
+    3: "Информация",
+}
+
+# Фильтры по умолчанию: категория -> выражение для начала описания
+ФИЛЬТРЫ_ПО_УМОЛЧАНИЮ = {
+    "КЗ": r"(?:t=\S+ с: )?Величина остаточного напряжения",
+    "Потеря синхронизма": r"(?:t=\S+ с: )?Выявлено превышение",
+}
+
+
+class ЗахватПротокола:
+    """
+    Обработчик событий OnLog: фильтрация при поступлении, кольцевой буфер
+    подходящих записей и счетчики остальных
+
+    Пример:
+        захват = ЗахватПротокола(емкость=5000)
+        подключить_захват(rastr, захват)
+        fw.Run()
+        for событие in захват.записи("КЗ"):
+            print(событие.описание)
+        print(захват.статистика())
+    """
+
+    def __init__(self, фильтры=None, емкость=10000):
+        """
+        Args:
+            фильтры: {категория: выражение (строка или re.Pattern)};
+                по умолчанию ФИЛЬТРЫ_ПО_УМОЛЧАНИЮ
+            емкость: Сколько последних подходящих записей хранить
+        """
+        фильтры = ФИЛЬТРЫ_ПО_УМОЛЧАНИЮ if фильтры is None else фильтры
+        self.фильтры = [
+            (категория, re.compile(выражение) if isinstance(выражение, str) else выражение)
+            for категория, выражение in фильтры.items()
+        ]
+        self.емкость = емкость
+        self._блокировка = threading.Lock()
+        self.очистить()
+
+    def очистить(self):
+        """Сбрасывает буфер и счетчики (например, перед новым расчетом)"""
+        with self._блокировка:
+            self._буфер = deque(maxlen=self.емкость)
+            self._принято = Counter()
+            self._пропущено = Counter()
+            self._событий = 0
+
+    def _категория(self, описание):
+        for категория, выражение in self.фильтры:
+            if выражение.match(описание):
+                return категория
+        return None
+
+    def OnLog(self, code, level, stage_id, table_name, table_index, description, form_name):
+        """Обработчик события OnLog объекта RasterWin"""
+        категория = self._категория(description)
+        with self._блокировка:
+            номер = self._событий
+            self._событий += 1
+            if категория is None:
+                self._пропущено[УРОВНИ_ПРОТОКОЛА.get(level, f"Уровень {level}")] += 1
+                return
+            self._принято[категория] += 1
+            self._буфер.append(СобытиеПротокола(
+                номер, категория, code, level, table_name, table_index, description
+            ))
+
+    def записи(self, категория=None):
+        """
+        Снимок буфера (можно вызывать во время расчета)
+
+        Args:
+            категория: Только записи этой категории (None - все)
+
+        Returns:
+            list: СобытиеПротокола в порядке поступления
+        """
+        with self._блокировка:
+            снимок = list(self._буфер)
+        if категория is None:
+            return снимок
+        return [событие for событие in снимок if событие.категория == категория]
+
+    def статистика(self):
+        """
+        Returns:
+            dict: {"Событий", "В_буфере", "Вытеснено", "Принято": {...}, "Пропущено": {...}}
+        """
+        with self._блокировка:
+            принято = sum(self._принято.values())
+            return {
+                "Событий": self._событий,
+                "В_буфере": len(self._буфер),
+                "Вытеснено": принято - len(self._буфер),
+                "Принято": dict(self._принято),
+                "Пропущено": dict(self._пропущено),
+            }
+
+
+def подключить_захват(rastr, захват):
+    """
+    Подписывает захват на события OnLog
+
+    У имитатора используется подключить_обработчик, у COM-объекта -
+    win32com.client.WithEvents с классом, передающим вызовы в захват.
+
+    Returns:
+        Объект подписки (для COM его нужно хранить, пока нужны события)
+    """
+    if hasattr(rastr, "подключить_обработчик"):
+        rastr.подключить_обработчик(захват)
+        return захват
+
+    import win32com.client
+
+    class _ОбработчикСобытий:
+        def OnLog(self, *args):
+            захват.OnLog(*args)
+
+    return win32com.client.WithEvents(rastr, _ОбработчикСобытий)
+
+
+class _СписокСообщений:
+    """Прежний подход: все подходящие описания складываются в список"""
+
+    def __init__(self, фильтры=ФИЛЬТРЫ_ПО_УМОЛЧАНИЮ):
+        self.фильтры = [re.compile(выражение) for выражение in фильтры.values()]
+        self.сообщения = []
+
+    def OnLog(self, code, level, stage_id, table_name, table_index, description, form_name):
+        if any(выражение.match(description) for выражение in self.фильтры):
+            self.сообщения.append(description)
+
+
+def сравнить_со_списком(длины_протокола=(10_000, 200_000), емкость=1000):
+    """
+    Бенчмарк: пиковая память (tracemalloc) при накоплении списка сообщений
+    и при кольцевом буфере для протоколов разной длины
+
+    Returns:
+        dict: {длина: {способ: {"Память_КБ", "Время"}}}
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("\n" + "="*60)
+    print(f"ЗАХВАТ ПРОТОКОЛА: список и кольцевой буфер ({емкость} записей)")
+    print("="*60)
+
+    сводка = {}
+    for длина in длины_протокола:
+        сводка[длина] = {}
+        for способ in ("Список", "Кольцевой буфер"):
+            rastr = ИмитаторRastr(событий_протокола=длина)
+            tracemalloc.start()
+            начало = time.perf_counter()
+            обработчик = _СписокСообщений() if способ == "Список" else ЗахватПротокола(емкость=емкость)
+            подключить_захват(rastr, обработчик)
+            rastr.FWDynamic().Run()
+            время = time.perf_counter() - начало
+            _, пик = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            сводка[длина][способ] = {"Память_КБ": пик / 1024, "Время": время}
+            print(f"  {длина:>7} событий  {способ:<16} пик памяти: {пик / 1024:8.0f} КБ   "
+                  f"время: {время:5.2f} с")
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Захват событий OnLog")
+    print("="*60)
+
+    rastr = ИмитаторRastr(событий_протокола=500)
+    захват = ЗахватПротокола(емкость=20)
+    подключить_захват(rastr, захват)
+
+    fw = rastr.FWDynamic()
+    fw.Run()
+
+    print(f"\nСтатистика: {захват.статистика()}")
+    print("\nПоследние записи КЗ:")
+    for событие in захват.записи("КЗ")[-3:]:
+        print(f"  [{событие.номер}] {событие.описание}")
+
+    сравнить_со_списком()
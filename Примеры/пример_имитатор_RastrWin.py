@@ -0,0 +1,725 @@
+"""
+ПРИМЕР: Локальный имитатор RasterWin на чистом Python
+
+RasterWin и pywin32 работают только на Windows, поэтому код из Примеры/
+нельзя запустить на Linux-серверах и в CI. Этот модуль повторяет ту часть
+COM API, которую используют примеры:
+
+    rastr.Tables.Item("node").Cols.Item("vras").Z(row)
+    table.Cols("P").SetZ(row, value)
+    table.SetSel("ny=123"); table.FindNextSel(-1)
+    table.ReadSafeArray(2, "ny,vras", "")  # массовое чтение за один вызов
+    rastr.rgm("p")
+    fw_dynamic = rastr.FWDynamic(); fw_dynamic.Run()
+    fw_dynamic.SyncLossCause, fw_dynamic.TimeReached, fw_dynamic.ResultMessage
+    rastr.GetChainedGraphSnapshot("Generator", "Delta", 0, 0)  # ((значение, время), ...)
+
+Каждому вызову можно задать задержку и вероятность отказа, а rgm и Run
+могут "зависать" на тяжелых режимах. Так поиски, пулы и кэши можно
+измерять, профилировать и проверять при реалистичной стоимости вызовов
+без Windows.
+
+ВАЖНО: Это не расчетная программа. "Физика" здесь условная: режим
+устойчив, если суммарная мощность генераторов меньше предела.
+"""
+
+import math
+import random
+import re
+import time
+from collections import Counter
+
+
+class ОшибкаИмитатора(Exception):
+    """Имитация ошибки COM-вызова (аналог pywintypes.com_error)"""
+
+
+# Условие выборки: "ny=123", "P>100", "name='Узел 1'" (части объединяются "&")
+_УСЛОВИЕ_ВЫБОРКИ = re.compile(r"^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.+?)\s*$")
+
+_ОПЕРАЦИИ = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+}
+
+# Уровни сообщений OnLog (условные)
+УРОВЕНЬ_ОШИБКА = 0
+УРОВЕНЬ_ПРЕДУПРЕЖДЕНИЕ = 1
+УРОВЕНЬ_СООБЩЕНИЕ = 2
+УРОВЕНЬ_ИНФОРМАЦИЯ = 3
+
+# Условный сценарий расчета динамики: КЗ и его отключение, с
+ВРЕМЯ_КЗ = 0.1
+ВРЕМЯ_ОТКЛЮЧЕНИЯ_КЗ = 0.22
+
+# Условная модель сходимости rgm: невязка e -> КОЭФФИЦИЕНТ_СХОДИМОСТИ * e**2
+КОЭФФИЦИЕНТ_СХОДИМОСТИ = 1.5
+МАКСИМУМ_ИТЕРАЦИЙ = 30
+
+
+class _СтоимостьВызовов:
+    """Задержки, отказы и счетчики вызовов, общие для всех объектов имитатора"""
+
+    def __init__(self, задержка_вызова, задержки, вероятность_отказа, вероятности_отказа, seed):
+        self.задержка_вызова = задержка_вызова
+        self.задержки = dict(задержки or {})
+        self.вероятность_отказа = вероятность_отказа
+        self.вероятности_отказа = dict(вероятности_отказа or {})
+        self.счетчики = Counter()
+        self._случайные = random.Random(seed)
+
+    def вызов(self, имя_метода):
+        """Учитывает один вызов: счетчик, задержка и случайный отказ"""
+        self.счетчики[имя_метода] += 1
+
+        задержка = self.задержки.get(имя_метода, self.задержка_вызова)
+        if задержка > 0:
+            time.sleep(задержка)
+
+        вероятность = self.вероятности_отказа.get(имя_метода, self.вероятность_отказа)
+        if вероятность > 0 and self._случайные.random() < вероятность:
+            raise ОшибкаИмитатора(f"Имитация отказа при вызове {имя_метода}")
+
+
+class КолонкаИмитатора:
+    """Колонка таблицы: Z(row) и SetZ(row, value)"""
+
+    def __init__(self, таблица, имя):
+        self._таблица = таблица
+        self.Name = имя
+
+    def Z(self, row):
+        self._таблица._стоимость.вызов("Z")
+        return self._таблица._данные[self.Name][row]
+
+    def SetZ(self, row, value):
+        self._таблица._стоимость.вызов("SetZ")
+        self._таблица._данные[self.Name][row] = value
+
+
+class КоллекцияКолонок:
+    """table.Cols: поддерживает и Cols.Item("P"), и Cols("P")"""
+
+    def __init__(self, таблица):
+        self._таблица = таблица
+
+    def Item(self, имя):
+        self._таблица._стоимость.вызов("Cols.Item")
+        if имя not in self._таблица._данные:
+            raise ОшибкаИмитатора(f"Колонка '{имя}' не найдена в таблице '{self._таблица.Name}'")
+        return КолонкаИмитатора(self._таблица, имя)
+
+    __call__ = Item
+
+    @property
+    def Count(self):
+        return len(self._таблица._данные)
+
+
+class ТаблицаИмитатора:
+    """Таблица RasterWin: колонки, число строк и выборки"""
+
+    def __init__(self, имя, данные, стоимость):
+        self.Name = имя
+        self._данные = данные  # {колонка: [значения по строкам]}
+        self._стоимость = стоимость
+        self._выборка = None  # Список отобранных строк или None (все строки)
+        self.Cols = КоллекцияКолонок(self)
+
+    @property
+    def Count(self):
+        return len(next(iter(self._данные.values()), []))
+
+    def SetSel(self, выражение):
+        """Задает выборку: "" - все строки, "ny=123", "P>100&Node=5" и т.п."""
+        self._стоимость.вызов("SetSel")
+        self._выборка = self._отобрать(выражение)
+
+    def _отобрать(self, выражение):
+        """Номера строк, подходящих под выражение (None - все строки)"""
+        if not выражение.strip():
+            return None
+
+        условия = []
+        for часть in выражение.split("&"):
+            совпадение = _УСЛОВИЕ_ВЫБОРКИ.match(часть)
+            if совпадение is None or совпадение.group(1) not in self._данные:
+                raise ОшибкаИмитатора(f"Некорректная выборка: '{выражение}'")
+            колонка, операция, значение = совпадение.groups()
+            условия.append((self._данные[колонка], _ОПЕРАЦИИ[операция], _разобрать_значение(значение)))
+
+        # Как и в RasterWin, выборка - это просмотр всей таблицы
+        return [
+            строка for строка in range(self.Count)
+            if all(операция(колонка[строка], значение) for колонка, операция, значение in условия)
+        ]
+
+    def ReadSafeArray(self, режим, колонки, выборка=""):
+        """
+        Массовое чтение таблицы за один вызов
+
+        Args:
+            режим: Не используется (оставлен для совместимости вызова)
+            колонки: Имена колонок через запятую, например "ny,vras,name"
+            выборка: Выражение как в SetSel ("" - все строки)
+
+        Returns:
+            tuple: Кортеж строк, каждая - кортеж значений колонок
+        """
+        self._стоимость.вызов("ReadSafeArray")
+        имена = [имя.strip() for имя in колонки.split(",")]
+        for имя in имена:
+            if имя not in self._данные:
+                raise ОшибкаИмитатора(f"Колонка '{имя}' не найдена в таблице '{self.Name}'")
+
+        строки = self._отобрать(выборка)
+        значения = [self._данные[имя] for имя in имена]
+        if строки is None:
+            return tuple(zip(*значения))
+        return tuple(tuple(колонка[строка] for колонка in значения) for строка in строки)
+
+    def FindNextSel(self, строка):
+        """Возвращает следующую после 'строка' отобранную строку или -1"""
+        self._стоимость.вызов("FindNextSel")
+        строки = range(self.Count) if self._выборка is None else self._выборка
+        for кандидат in строки:
+            if кандидат > строка:
+                return кандидат
+        return -1
+
+    def AddRow(self):
+        """Добавляет строку в конец таблицы (значения по умолчанию - 0)"""
+        self._стоимость.вызов("AddRow")
+        for значения in self._данные.values():
+            значения.append(0)
+
+    def DelRows(self):
+        """Удаляет отобранные строки (все, если выборка не задана)"""
+        self._стоимость.вызов("DelRows")
+        удаляемые = set(range(self.Count) if self._выборка is None else self._выборка)
+        for колонка, значения in self._данные.items():
+            self._данные[колонка] = [
+                значение for строка, значение in enumerate(значения) if строка not in удаляемые
+            ]
+        self._выборка = None
+
+
+class КоллекцияТаблиц:
+    """rastr.Tables: поддерживает и Tables.Item("node"), и Tables("node")"""
+
+    def __init__(self, rastr):
+        self._rastr = rastr
+
+    def Item(self, имя):
+        self._rastr._стоимость.вызов("Tables.Item")
+        if имя not in self._rastr._таблицы:
+            raise ОшибкаИмитатора(f"Таблица '{имя}' не найдена")
+        return self._rastr._таблицы[имя]
+
+    __call__ = Item
+
+    @property
+    def Count(self):
+        return len(self._rastr._таблицы)
+
+
+class FWDynamicИмитатора:
+    """Расчет переходного режима: Run(), SyncLossCause, TimeReached, ResultMessage"""
+
+    def __init__(self, rastr):
+        self._rastr = rastr
+        self.SyncLossCause = 0
+        self.TimeReached = 0.0
+        self.ResultMessage = None
+
+    def Run(self):
+        self._rastr._стоимость.вызов("Run")
+        return self._расчет()
+
+    def RunEMSmode(self):
+        self._rastr._стоимость.вызов("RunEMSmode")
+        return self._расчет()
+
+    def _расчет(self):
+        rastr = self._rastr
+        rastr._проверить_зависание()
+        мощность = rastr.суммарная_генерация()
+        полное_время = rastr.время_расчета
+
+        if мощность < rastr.предел_устойчивости:
+            self.SyncLossCause = 0
+            self.TimeReached = полное_время
+            self.ResultMessage = "Расчет завершен успешно"
+        else:
+            # Чем больше перегрузка, тем раньше теряется синхронизм
+            self.SyncLossCause = 1
+            self.TimeReached = round(
+                полное_время * (rastr.предел_устойчивости / мощность) ** 8, 3
+            )
+            self.ResultMessage = "Выявлено превышение угла по ветви значения 180°"
+
+        rastr._последняя_динамика = {
+            "Время": self.TimeReached,
+            "Устойчив": self.SyncLossCause == 0,
+            "Загрузка": мощность / rastr.предел_устойчивости,
+        }
+        rastr._протокол_динамики(self.TimeReached)
+        if self.SyncLossCause != 0:
+            rastr._сообщить(УРОВЕНЬ_ОШИБКА, f"t={self.TimeReached:.3f} с: {self.ResultMessage}")
+        return 0
+
+
+class ИмитаторRastr:
+    """
+    Имитатор COM-объекта Astra.Rastr
+
+    Схема генерируется при создании (узлы, ветви, генераторы) и
+    восстанавливается при каждой Load.
+
+    Пример:
+        rastr = ИмитаторRastr(задержки={"rgm": 0.05, "Run": 0.2})
+        rastr.Tables.Item("Generator").Cols("P").SetZ(0, 120.0)
+        if rastr.rgm("p") == 0:
+            fw_dynamic = rastr.FWDynamic()
+            fw_dynamic.Run()
+            print(fw_dynamic.SyncLossCause)
+        print(rastr.счетчики_вызовов)
+    """
+
+    def __init__(self, число_узлов=50, число_генераторов=5, задержка_вызова=0.0, задержки=None,
+                 вероятность_отказа=0.0, вероятности_отказа=None, предел_устойчивости=None,
+                 время_расчета=5.0, время_итерации=0.0, время_подготовки=0.0,
+                 зависание_при_загрузке=None, время_зависания=3600.0, событий_протокола=0,
+                 шаг_графика=0.01, seed=0):
+        """
+        Args:
+            число_узлов: Количество узлов схемы
+            число_генераторов: Количество генераторов схемы
+            задержка_вызова: Задержка каждого вызова по умолчанию, с
+            задержки: Задержки отдельных методов, с, например
+                {"Z": 0.0001, "rgm": 0.05, "Run": 0.2, "Load": 1.0}
+            вероятность_отказа: Вероятность ОшибкаИмитатора на любом вызове
+            вероятности_отказа: Вероятности отказа отдельных методов
+            предел_устойчивости: Суммарная генерация, МВт, при которой теряется
+                устойчивость (по умолчанию на 25% больше исходной)
+            время_расчета: Время расчета переходного процесса, с
+            время_итерации: Стоимость одной итерации rgm, с
+            время_подготовки: Стоимость контроля и подготовки данных в rgm, с
+            зависание_при_загрузке: Если генерация больше этой доли предела
+                устойчивости, rgm и Run "зависают" (None - не зависают)
+            время_зависания: Сколько длится зависание, с
+            событий_протокола: Сколько событий OnLog выдает один расчет динамики
+            шаг_графика: Шаг точек GetChainedGraphSnapshot, с
+            seed: Зерно генератора случайных чисел (схема и отказы)
+        """
+        self._стоимость = _СтоимостьВызовов(
+            задержка_вызова, задержки, вероятность_отказа, вероятности_отказа, seed
+        )
+        self._исходная_схема = _сгенерировать_схему(число_узлов, число_генераторов, seed)
+        self._таблицы = {}
+        self._восстановить_схему()
+
+        if предел_устойчивости is None:
+            предел_устойчивости = round(1.25 * self.суммарная_генерация(), 1)
+        self.предел_устойчивости = предел_устойчивости
+        self.время_расчета = время_расчета
+        self.время_итерации = время_итерации
+        self.время_подготовки = время_подготовки
+        self.зависание_при_загрузке = зависание_при_загрузке
+        self.время_зависания = время_зависания
+        self._подготовленные_ветви = None
+        self.число_итераций = 0
+
+        self.событий_протокола = событий_протокола
+        self._обработчики = []
+        self._случайные_протокола = random.Random(seed)
+        self.шаг_графика = шаг_графика
+        self._последняя_динамика = None
+
+        self.Tables = КоллекцияТаблиц(self)
+
+    @property
+    def счетчики_вызовов(self):
+        """Counter: сколько раз вызывался каждый метод"""
+        return self._стоимость.счетчики
+
+    def подключить_обработчик(self, обработчик):
+        """
+        Подписывает объект с методом OnLog на события протокола (аналог
+        win32com.client.WithEvents для COM-объекта)
+        """
+        self._обработчики.append(обработчик)
+
+    def отключить_обработчик(self, обработчик):
+        self._обработчики.remove(обработчик)
+
+    def _сообщить(self, уровень, описание, таблица="", индекс=-1):
+        """Отправляет событие OnLog(code, level, stage_id, table, index, description, form)"""
+        for обработчик in self._обработчики:
+            обработчик.OnLog(0, уровень, 0, таблица, индекс, описание, "")
+
+    def _протокол_динамики(self, время_до):
+        """Условный протокол расчета динамики: событий_протокола сообщений"""
+        if not self._обработчики or not self.событий_протокола:
+            return
+        случайные = self._случайные_протокола
+        узлы = self._таблицы["node"]._данные
+        for номер in range(self.событий_протокола):
+            t = время_до * номер / self.событий_протокола
+            вид = номер % 10
+            if вид < 3:
+                строка = случайные.randrange(len(узлы["ny"]))
+                self._сообщить(
+                    УРОВЕНЬ_СООБЩЕНИЕ,
+                    f"t={t:.3f} с: Величина остаточного напряжения в узле {узлы['ny'][строка]} "
+                    f"(Uкз={узлы['uhom'][строка] * случайные.uniform(0.2, 0.9):.1f} кВ, "
+                    f"Iкз={случайные.uniform(0.5, 30):.2f} кА)",
+                    "node", строка,
+                )
+            elif вид == 3:
+                self._сообщить(УРОВЕНЬ_ПРЕДУПРЕЖДЕНИЕ, f"t={t:.3f} с: Шаг интегрирования уменьшен")
+            else:
+                self._сообщить(УРОВЕНЬ_ИНФОРМАЦИЯ, f"Итерация {вид} завершена")
+
+    def _проверить_зависание(self):
+        """Имитирует зависание расчета на "патологической" схеме"""
+        if (self.зависание_при_загрузке is not None
+                and self.суммарная_генерация() > self.зависание_при_загрузке * self.предел_устойчивости):
+            time.sleep(self.время_зависания)
+
+    def суммарная_генерация(self):
+        """Суммарная мощность генераторов без учета задержек, МВт"""
+        return float(sum(self._таблицы["Generator"]._данные["P"]))
+
+    def _восстановить_схему(self):
+        self._таблицы = {
+            имя: ТаблицаИмитатора(имя, {колонка: list(значения) for колонка, значения in данные.items()},
+                                  self._стоимость)
+            for имя, данные in self._исходная_схема.items()
+        }
+
+    def Load(self, режим, путь, шаблон=""):
+        """Загрузка файла: восстанавливает исходную схему"""
+        self._стоимость.вызов("Load")
+        self._восстановить_схему()
+
+    def NewFile(self, шаблон=""):
+        """Создание пустого файла по шаблону: все таблицы без строк"""
+        self._стоимость.вызов("NewFile")
+        for таблица in self._таблицы.values():
+            for колонка in таблица._данные:
+                таблица._данные[колонка] = []
+
+    def Save(self, путь, шаблон=""):
+        self._стоимость.вызов("Save")
+
+    def rgm(self, параметры=""):
+        """
+        Расчет установившегося режима
+
+        Флаги параметров (условная модель):
+            "p" - плоский старт, иначе расчет идет от текущих vras/delta;
+            "z" - без стартового алгоритма: на итерацию быстрее, но
+                  расходится при более далеком начальном приближении;
+            "c" - без контроля данных: время_подготовки меньше на четверть;
+            "r" - без подготовки данных: время_подготовки вдвое меньше, но
+                  расчет расходится, если после последней подготовки
+                  менялось состояние ветвей (vetv.sta).
+
+        Число итераций сохраняется в атрибуте число_итераций.
+
+        Returns:
+            int: 0 - режим сбалансирован, 1 - расчет разошелся
+        """
+        self._стоимость.вызов("rgm")
+        self._проверить_зависание()
+        узлы = self._таблицы["node"]._данные
+        if not узлы["ny"]:
+            self.число_итераций = 0
+            return 1
+
+        подготовка = self.время_подготовки
+        if "c" in параметры:
+            подготовка *= 0.75
+        if "r" in параметры:
+            подготовка *= 0.5
+            данные_устарели = self._подготовленные_ветви != self._таблицы["vetv"]._данные["sta"]
+        else:
+            self._подготовленные_ветви = list(self._таблицы["vetv"]._данные["sta"])
+            данные_устарели = False
+
+        загрузка = self.суммарная_генерация() / self.предел_устойчивости
+        vras = [round(uhom * (1.05 - 0.08 * вес * загрузка), 3)
+                for uhom, вес in zip(узлы["uhom"], узлы["_вес"])]
+        delta = [round(-35.0 * вес * загрузка, 3) for вес in узлы["_вес"]]
+
+        # Статическая устойчивость теряется позже динамической
+        if загрузка > 1.4 or данные_устарели:
+            итераций = None
+        elif "p" in параметры:
+            итераций = 5 + math.ceil(10 * max(0.0, загрузка - 0.8))
+        else:
+            # Начальная невязка - отличие текущих значений от решения
+            невязка = max(
+                max(abs(новое - старое) for новое, старое in zip(delta, узлы["delta"])) * math.pi / 180,
+                max(abs(новое - старое) / uhom
+                    for новое, старое, uhom in zip(vras, узлы["vras"], узлы["uhom"])),
+            )
+            if "z" in параметры:
+                итераций = _итераций_ньютона(невязка)
+            else:
+                # Стартовый алгоритм: одна итерация, вдвое уменьшающая невязку
+                итераций = _итераций_ньютона(невязка / 2)
+                итераций = None if итераций is None else итераций + 1
+
+        self.число_итераций = МАКСИМУМ_ИТЕРАЦИЙ if итераций is None else итераций
+        задержка = подготовка + self.число_итераций * self.время_итерации
+        if задержка > 0:
+            time.sleep(задержка)
+        if итераций is None:
+            # Как и RasterWin, разошедшийся расчет оставляет в таблице
+            # последнее приближение, далекое от решения
+            узлы["vras"][:] = [round(0.5 * значение, 3) for значение in vras]
+            узлы["delta"][:] = [round(4.0 * значение, 3) for значение in delta]
+            return 1
+
+        узлы["vras"][:] = vras
+        узлы["delta"][:] = delta
+        return 0
+
+    def GetChainedGraphSnapshot(self, таблица, колонка, индекс, режим=0):
+        """
+        Точки графика последнего расчета динамики
+
+        Условные траектории: node.vras - провал напряжения при КЗ и
+        восстановление, Generator.Delta - качания угла ротора, град,
+        Generator.s - скольжение, %. При потере синхронизма каждый третий
+        генератор выпадает: его угол уходит на 360° относительно остальных.
+
+        Args:
+            таблица: "node" или "Generator"
+            колонка: "vras" для узлов; "Delta" или "s" для генераторов
+            индекс: Номер строки таблицы
+            режим: Не используется (оставлен для совместимости вызова)
+
+        Returns:
+            tuple: Кортеж точек (значение, время), как SAFEARRAY из COM
+        """
+        self._стоимость.вызов("GetChainedGraphSnapshot")
+        if self._последняя_динамика is None:
+            raise ОшибкаИмитатора("Нет результатов расчета динамики")
+        if (таблица, колонка) not in (("node", "vras"), ("Generator", "Delta"), ("Generator", "s")):
+            raise ОшибкаИмитатора(f"Нет графика {таблица}.{колонка}")
+        данные = self._таблицы[таблица]._данные
+        if not 0 <= индекс < len(данные[колонка if таблица == "node" else "Num"]):
+            raise ОшибкаИмитатора(f"Строка {индекс} не найдена в таблице '{таблица}'")
+
+        динамика = self._последняя_динамика
+        конец = динамика["Время"]
+        число_точек = int(round(конец / self.шаг_графика)) + 1
+        времена = [min(номер * self.шаг_графика, конец) for номер in range(число_точек)]
+
+        if таблица == "node":
+            функция = self._функция_напряжения(данные, индекс, динамика)
+        else:
+            функция = self._функция_угла(данные, индекс, динамика, колонка == "s")
+        return tuple((функция(t), t) for t in времена)
+
+    @staticmethod
+    def _функция_напряжения(узлы, индекс, динамика):
+        """Провал напряжения на время КЗ и экспоненциальное восстановление"""
+        v0 = узлы["vras"][индекс]
+        вес = узлы["_вес"][индекс]
+        провал = 0.3 + 0.5 * вес
+        постоянная = 0.1 + 0.4 * вес
+        конец = динамика["Время"]
+        устойчив = динамика["Устойчив"]
+
+        def напряжение(t):
+            if t < ВРЕМЯ_КЗ:
+                return v0
+            if t < ВРЕМЯ_ОТКЛЮЧЕНИЯ_КЗ:
+                return v0 * (1 - провал)
+            значение = v0 * (1 - провал * math.exp(-(t - ВРЕМЯ_ОТКЛЮЧЕНИЯ_КЗ) / постоянная))
+            if not устойчив:
+                # Асинхронный ход: напряжение снова проваливается к концу расчета
+                значение *= 1 - 0.6 * max(0.0, (t - 0.6 * конец) / (0.4 * конец))
+            return значение
+
+        return напряжение
+
+    @staticmethod
+    def _функция_угла(генераторы, индекс, динамика, скольжение):
+        """Затухающие качания угла ротора (или его производная - скольжение)"""
+        загрузка = динамика["Загрузка"]
+        доля = генераторы["P"][индекс] / генераторы["Pmax"][индекс]
+        угол0 = 20.0 + 40.0 * загрузка * доля
+        амплитуда = 30.0 * загрузка * (0.6 + 0.1 * (индекс % 5))
+        частота = 2 * math.pi * (0.8 + 0.1 * (индекс % 5))
+        затухание = 0.1 * частота
+        # Длительность после КЗ, за которую выпадающий генератор проворачивается
+        длительность = max(динамика["Время"] - ВРЕМЯ_КЗ, 1e-3)
+        уход = 360.0
+        устойчив = динамика["Устойчив"] or индекс % 3 != 0
+        # Угол в град/с -> скольжение в % при 50 Гц
+        в_скольжение = 100.0 / (360.0 * 50.0)
+
+        def угол(t):
+            if t < ВРЕМЯ_КЗ:
+                return 0.0 if скольжение else угол0
+            tк = t - ВРЕМЯ_КЗ
+            огибающая = амплитуда * math.exp(-затухание * tк)
+            if скольжение:
+                значение = огибающая * (частота * math.cos(частота * tк)
+                                        - затухание * math.sin(частота * tк)) * в_скольжение
+                if not устойчив:
+                    значение += 3 * уход * tк ** 2 / длительность ** 3 * в_скольжение
+                return значение
+            значение = угол0 + огибающая * math.sin(частота * tк)
+            if not устойчив:
+                # Размах углов превышает 180° к моменту потери синхронизма
+                значение += уход * (tк / длительность) ** 3
+            return значение
+
+        return угол
+
+    def FWDynamic(self):
+        self._стоимость.вызов("FWDynamic")
+        return FWDynamicИмитатора(self)
+
+
+def _итераций_ньютона(невязка, точность=1e-6):
+    """
+    Число итераций метода Ньютона при квадратичной сходимости
+
+    Returns:
+        int или None: None - начальное приближение слишком далеко, расчет разошелся
+    """
+    итераций = 0
+    while невязка > точность:
+        if КОЭФФИЦИЕНТ_СХОДИМОСТИ * невязка >= 1.0:
+            return None
+        невязка = КОЭФФИЦИЕНТ_СХОДИМОСТИ * невязка ** 2
+        итераций += 1
+    return max(итераций, 1)
+
+
+def _разобрать_значение(текст):
+    """Значение из выражения выборки: число или строка в кавычках"""
+    текст = текст.strip()
+    if len(текст) >= 2 and текст[0] == текст[-1] and текст[0] in "'\"":
+        return текст[1:-1]
+    try:
+        return int(текст)
+    except ValueError:
+        pass
+    try:
+        return float(текст)
+    except ValueError:
+        return текст
+
+
+def _сгенерировать_схему(число_узлов, число_генераторов, seed):
+    """
+    Генерирует условную схему: узлы, ветви (цепочка + поперечные связи)
+    и генераторы в первых узлах
+
+    Returns:
+        dict: {имя_таблицы: {колонка: [значения]}}
+    """
+    случайные = random.Random(seed)
+
+    номера = list(range(1, число_узлов + 1))
+    uhom = [случайные.choice((110.0, 220.0, 500.0)) for _ in номера]
+    узлы = {
+        "ny": номера,
+        "name": [f"Узел {номер}" for номер in номера],
+        "uhom": uhom,
+        "vras": list(uhom),
+        "delta": [0.0] * число_узлов,
+        "pn": [round(случайные.uniform(0, 50), 1) for _ in номера],
+        "qn": [round(случайные.uniform(0, 20), 1) for _ in номера],
+        "p": [0.0] * число_узлов,
+        "q": [0.0] * число_узлов,
+        # Служебная колонка: насколько узел "далек" от генераторов
+        "_вес": [round(случайные.uniform(0.2, 1.0), 3) for _ in номера],
+    }
+    узлы["p"] = [-pn for pn in узлы["pn"]]
+    узлы["q"] = [-qn for qn in узлы["qn"]]
+
+    начала, концы = [], []
+    for номер in номера[1:]:
+        начала.append(номер - 1)
+        концы.append(номер)
+    for _ in range(число_узлов // 5):
+        ip, iq = sorted(случайные.sample(номера, 2))
+        начала.append(ip)
+        концы.append(iq)
+    ветви = {
+        "ip": начала,
+        "iq": концы,
+        "np": [0] * len(начала),
+        "name": [f"ЛЭП {ip}-{iq}" for ip, iq in zip(начала, концы)],
+        "pl_ip": [0.0] * len(начала),
+        "sta": [0] * len(начала),  # 0 - ветвь включена, 1 - отключена
+    }
+    # Параллельные ветви различаются номером np
+    встречено = Counter()
+    for строка, ключ in enumerate(zip(начала, концы)):
+        ветви["np"][строка] = встречено[ключ]
+        встречено[ключ] += 1
+
+    номера_генераторов = list(range(1, число_генераторов + 1))
+    P_max = [float(случайные.choice((100, 150, 200, 300))) for _ in номера_генераторов]
+    генераторы = {
+        "Num": номера_генераторов,
+        "Name": [f"Г-{номер}" for номер in номера_генераторов],
+        "Node": [номера[(номер - 1) % число_узлов] for номер in номера_генераторов],
+        "P": [round(0.7 * pmax, 1) for pmax in P_max],
+        "Pmin": [round(0.3 * pmax, 1) for pmax in P_max],
+        "Pmax": P_max,
+    }
+
+    return {"node": узлы, "vetv": ветви, "Generator": генераторы}
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: Локальный имитатор RasterWin")
+    print("="*60)
+
+    rastr = ИмитаторRastr(задержки={"rgm": 0.02, "Run": 0.05})
+
+    # Тот же код, что в извлечь_данные_из_таблицы_узлов
+    table_node = rastr.Tables.Item("node")
+    table_node.SetSel("ny=12")
+    row = table_node.FindNextSel(-1)
+    print(f"\nУзел ny=12 найден в строке {row}: {table_node.Cols('name').Z(row)}")
+
+    # Цикл увеличения генерации до потери устойчивости
+    table_gen = rastr.Tables.Item("Generator")
+    print(f"\nПредел устойчивости имитатора: {rastr.предел_устойчивости} МВт")
+    for шаг in range(10):
+        P = table_gen.Cols("P")
+        for строка in range(table_gen.Count):
+            P.SetZ(строка, P.Z(строка) * 1.05)
+
+        if rastr.rgm("p") != 0:
+            print("  ❌ Режим не сбалансирован")
+            break
+
+        fw_dynamic = rastr.FWDynamic()
+        fw_dynamic.Run()
+        print(f"  Генерация {rastr.суммарная_генерация():7.1f} МВт: "
+              f"SyncLossCause={fw_dynamic.SyncLossCause}, TimeReached={fw_dynamic.TimeReached}")
+        if fw_dynamic.SyncLossCause != 0:
+            print(f"  {fw_dynamic.ResultMessage}")
+            break
+
+    print(f"\nU в узле ny=12 после расчета: {table_node.Cols('vras').Z(row)} кВ")
+    print(f"\nСчетчики вызовов: {dict(rastr.счетчики_вызовов)}")
@@ -0,0 +1,253 @@
+"""
+ПРИМЕР: Индекс строк таблиц RasterWin вместо поиска через SetSel/FindNextSel
+
+В извлечь_данные_из_таблицы_узлов строка узла ищется так:
+
+    table_node.SetSel("ny=123")
+    row = table_node.FindNextSel(-1)
+
+Для каждого поиска RasterWin просматривает всю таблицу по выражению
+выборки. Индекс один раз читает ключевые колонки (ny у узлов, ip/iq/np у
+ветвей) и строит словарь ключ -> номер строки. Число строк сверяется один
+раз за сценарий (начать_сценарий), индекс перестраивается только когда оно
+изменилось, а тысячи поисков контролируемых узлов становятся обращениями
+к словарю без единого COM-вызова.
+"""
+
+import time
+
+import numpy as np
+
+from пример_массовое_чтение_таблиц import ЧтениеТаблиц
+
+# Ключевые колонки таблиц
+КЛЮЧИ_ТАБЛИЦ = {
+    "node": ("ny",),
+    "vetv": ("ip", "iq", "np"),
+    "Generator": ("Num",),
+}
+
+
+class ИндексСтрок:
+    """
+    Индекс ключ -> номер строки для таблиц RasterWin
+
+    Пример:
+        индекс = ИндексСтрок(rastr)
+        row = индекс.строка("node", 123)                 # Вместо SetSel/FindNextSel
+        row = индекс.строка("vetv", (12, 13, 0))
+        rows = индекс.строки("node", [123, 456, 789])    # Массив номеров, -1 - нет
+
+        for сценарий in сценарии:
+            применить(rastr, сценарий)   # Может добавлять и удалять строки
+            индекс.начать_сценарий()     # Один Count на таблицу
+            ...
+
+    Поиск не обращается к RasterWin: число строк сверяется в
+    начать_сценарий() (или при проверить=True). После Load/NewFile и после
+    изменения значений ключевых колонок нужно вызвать сбросить().
+    """
+
+    def __init__(self, rastr, ключи_таблиц=None):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+            ключи_таблиц: {таблица: (ключевые колонки)}, по умолчанию КЛЮЧИ_ТАБЛИЦ
+        """
+        self.чтение = ЧтениеТаблиц(rastr)
+        self.ключи_таблиц = dict(КЛЮЧИ_ТАБЛИЦ if ключи_таблиц is None else ключи_таблиц)
+        self._индексы = {}  # таблица -> {"Строк", "Словарь", "Ключи", "Порядок"}
+        self.перестроений = 0
+
+    def сбросить(self):
+        """Забывает все индексы (нужно после Load/NewFile)"""
+        self._индексы.clear()
+        self.чтение.сбросить_кэш()
+
+    def начать_сценарий(self):
+        """
+        Сверяет число строк построенных индексов с таблицами (один вызов
+        Count на таблицу) и перестраивает изменившиеся
+
+        Returns:
+            list: Таблицы, индексы которых перестроены
+        """
+        перестроенные = []
+        for имя_таблицы, индекс in list(self._индексы.items()):
+            if self.чтение.таблица(имя_таблицы).Count != индекс["Строк"]:
+                self._построить(имя_таблицы)
+                перестроенные.append(имя_таблицы)
+        return перестроенные
+
+    def _построить(self, имя_таблицы):
+        колонки = list(self.ключи_таблиц[имя_таблицы])
+        данные = self.чтение.прочитать_колонки(имя_таблицы, колонки)
+
+        if len(колонки) == 1:
+            ключи = данные[колонки[0]]
+        else:
+            ключи = list(zip(*(данные[колонка] for колонка in колонки)))
+
+        словарь = {}
+        for строка, ключ in enumerate(ключи):
+            # Как FindNextSel(-1): при повторе ключа - первая строка
+            словарь.setdefault(ключ, строка)
+
+        индекс = {"Строк": len(ключи), "Словарь": словарь, "Ключи": None, "Порядок": None}
+        if len(колонки) == 1:
+            # Для числового ключа - отсортированный массив для searchsorted
+            значения = np.asarray(ключи)
+            if значения.dtype.kind in "iuf":
+                порядок = np.argsort(значения, kind="stable")
+                индекс["Ключи"] = значения[порядок]
+                индекс["Порядок"] = порядок
+
+        self._индексы[имя_таблицы] = индекс
+        self.перестроений += 1
+        return индекс
+
+    def индекс(self, имя_таблицы, проверить=False):
+        """
+        Индекс таблицы (строится при первом обращении)
+
+        Args:
+            имя_таблицы: Название таблицы
+            проверить: Сверить число строк с таблицей (один вызов Count) и
+                перестроить индекс, если строки добавлены или удалены; по
+                умолчанию сверка - раз за сценарий в начать_сценарий()
+        """
+        индекс = self._индексы.get(имя_таблицы)
+        if индекс is None:
+            return self._построить(имя_таблицы)
+        if проверить and self.чтение.таблица(имя_таблицы).Count != индекс["Строк"]:
+            return self._построить(имя_таблицы)
+        return индекс
+
+    def строка(self, имя_таблицы, ключ, проверить=False):
+        """
+        Номер строки по ключу
+
+        Args:
+            имя_таблицы: Название таблицы
+            ключ: Значение ключа (кортеж для составного ключа)
+            проверить: См. индекс()
+
+        Returns:
+            int: Номер строки или -1, если ключ не найден (как FindNextSel)
+        """
+        return self.индекс(имя_таблицы, проверить)["Словарь"].get(ключ, -1)
+
+    def строки(self, имя_таблицы, ключи, проверить=False):
+        """
+        Номера строк для списка ключей
+
+        Args:
+            имя_таблицы: Название таблицы
+            ключи: Список ключей (кортежей для составного ключа)
+            проверить: См. индекс()
+
+        Returns:
+            numpy.ndarray: Номера строк (int64), -1 для ненайденных ключей
+        """
+        индекс = self.индекс(имя_таблицы, проверить)
+
+        if индекс["Ключи"] is None:
+            словарь = индекс["Словарь"]
+            return np.fromiter((словарь.get(ключ, -1) for ключ in ключи), dtype=np.int64,
+                               count=len(ключи))
+
+        искомые = np.asarray(ключи)
+        отсортированные = индекс["Ключи"]
+        if len(отсортированные) == 0:
+            return np.full(len(искомые), -1, dtype=np.int64)
+        позиции = np.searchsorted(отсортированные, искомые)
+        позиции_в_пределах = np.minimum(позиции, len(отсортированные) - 1)
+        найдено = (позиции < len(отсортированные)) & (отсортированные[позиции_в_пределах] == искомые)
+        return np.where(найдено, индекс["Порядок"][позиции_в_пределах], -1).astype(np.int64)
+
+
+def найти_строку_выборкой(rastr, имя_таблицы, выборка):
+    """Поиск строки как в извлечь_данные_из_таблицы_узлов: SetSel + FindNextSel"""
+    таблица = rastr.Tables.Item(имя_таблицы)
+    таблица.SetSel(выборка)
+    return таблица.FindNextSel(-1)
+
+
+def сравнить_с_выборкой(число_узлов=5_000, число_контролируемых=1_000):
+    """
+    Бенчмарк: поиск строк контролируемых узлов через SetSel/FindNextSel,
+    через индекс по одному и через индекс списком
+
+    Args:
+        число_узлов: Размер схемы
+        число_контролируемых: Сколько узлов ищется за сценарий
+
+    Returns:
+        dict: Время каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    rastr = ИмитаторRastr(число_узлов=число_узлов)
+    контролируемые = list(range(1, число_узлов + 1, max(1, число_узлов // число_контролируемых)))
+
+    print("\n" + "="*60)
+    print(f"ПОИСК СТРОК: {len(контролируемые)} узлов в схеме на {число_узлов} узлов")
+    print("="*60)
+
+    сводка = {}
+
+    начало = time.perf_counter()
+    по_выборке = [найти_строку_выборкой(rastr, "node", f"ny={ny}") for ny in контролируемые]
+    сводка["SetSel/FindNextSel"] = time.perf_counter() - начало
+
+    индекс = ИндексСтрок(rastr)
+    индекс.начать_сценарий()
+    начало = time.perf_counter()
+    по_одному = [индекс.строка("node", ny) for ny in контролируемые]
+    сводка["Индекс по одному"] = time.perf_counter() - начало
+
+    начало = time.perf_counter()
+    списком = индекс.строки("node", контролируемые)
+    сводка["Индекс списком"] = time.perf_counter() - начало
+
+    assert по_выборке == по_одному == списком.tolist()
+
+    for способ, время in сводка.items():
+        print(f"  {способ:<20} {время * 1000:9.2f} мс")
+    print(f"\n  Ускорение индекса списком: "
+          f"{сводка['SetSel/FindNextSel'] / сводка['Индекс списком']:.0f}x")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Индекс строк таблиц RasterWin")
+    print("="*60)
+
+    rastr = ИмитаторRastr(число_узлов=30)
+    индекс = ИндексСтрок(rastr)
+
+    print(f"\nУзел ny=12: строка {индекс.строка('node', 12)} "
+          f"(SetSel/FindNextSel: {найти_строку_выборкой(rastr, 'node', 'ny=12')})")
+    print(f"Ветвь 11-12: строка {индекс.строка('vetv', (11, 12, 0))}")
+    print(f"Узлы [5, 7, 999]: строки {индекс.строки('node', [5, 7, 999])}")
+
+    # Поиск не делает COM-вызовов
+    rastr.счетчики_вызовов.clear()
+    for ny in range(1, 31):
+        индекс.строка("node", ny)
+    print(f"30 поисков: {sum(rastr.счетчики_вызовов.values())} COM-вызовов")
+
+    # Добавление строки меняет число строк - индекс перестраивается
+    # при сверке в начале следующего сценария
+    таблица = rastr.Tables.Item("node")
+    таблица.AddRow()
+    таблица.Cols("ny").SetZ(таблица.Count - 1, 1000)
+    print(f"Новый сценарий, перестроены: {индекс.начать_сценарий()}")
+    print(f"Новый узел ny=1000: строка {индекс.строка('node', 1000)}, "
+          f"перестроений индекса: {индекс.перестроений}")
+
+    сравнить_с_выборкой()
@@ -0,0 +1,342 @@
+"""
+ПРИМЕР: Дисковый кэш результатов проверки устойчивости
+
+Этот пример показывает, как не пересчитывать одни и те же сценарии.
+Каждый сценарий (модель + изменения + уровень нагрузки) получает
+"отпечаток" - хэш, по которому результат расчета сохраняется в SQLite.
+При повторном ночном прогоне пересчитываются только изменившиеся сценарии.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+
+# Отпечатки файлов моделей: (путь, размер, время изменения) -> хэш содержимого
+# Чтобы не перечитывать большой .rst файл при каждой проверке
+_отпечатки_файлов = {}
+
+
+def отпечаток_файла_модели(путь_к_модели):
+    """
+    Вычисляет хэш содержимого файла модели (.rst, .scn и т.д.)
+
+    Хэш пересчитывается только если у файла изменились размер или время
+    изменения, поэтому повторные вызовы почти бесплатны.
+
+    Args:
+        путь_к_модели: Путь к файлу модели
+
+    Returns:
+        str: SHA-256 содержимого файла в виде hex-строки
+    """
+    путь = Path(путь_к_модели)
+    состояние = путь.stat()
+    ключ = (str(путь.resolve()), состояние.st_size, состояние.st_mtime_ns)
+
+    if ключ not in _отпечатки_файлов:
+        хэш = hashlib.sha256()
+        with open(путь, "rb") as файл:
+            for блок in iter(lambda: файл.read(1024 * 1024), b""):
+                хэш.update(блок)
+        _отпечатки_файлов[ключ] = хэш.hexdigest()
+
+    return _отпечатки_файлов[ключ]
+
+
+def отпечаток_сценария(путь_к_модели, изменения, параметр_нагрузки, шаг_квантования=0.01):
+    """
+    Вычисляет отпечаток сценария для поиска в кэше
+
+    Параметр нагрузки округляется до шага квантования, чтобы 249.999999
+    и 250.000001 МВт считались одним и тем же сценарием.
+
+    Args:
+        путь_к_модели: Путь к файлу модели
+        изменения: Изменения, примененные к модели (словарь/список, например
+            {"Возмущение": "КЗ в узле 123", "Генераторы": {"Г-1": 150.0}})
+        параметр_нагрузки: Уровень нагрузки, МВт
+        шаг_квантования: Шаг округления параметра нагрузки, МВт
+
+    Returns:
+        str: SHA-256 отпечаток сценария
+    """
+    описание = {
+        "Модель": отпечаток_файла_модели(путь_к_модели),
+        "Изменения": изменения,
+        "Нагрузка": round(параметр_нагрузки / шаг_квантования),
+    }
+    # sort_keys - чтобы порядок ключей в словаре не влиял на отпечаток
+    текст = json.dumps(описание, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(текст.encode("utf-8")).hexdigest()
+
+
+class КэшУстойчивости:
+    """
+    Дисковый кэш результатов проверки устойчивости (SQLite)
+
+    Хранит для каждого отпечатка сценария: устойчива ли система,
+    SyncLossCause и TimeReached. При превышении максимального числа
+    записей удаляются записи, к которым дольше всего не обращались.
+
+    Пример:
+        with КэшУстойчивости("кэш.sqlite") as кэш:
+            результат = кэш.проверить(путь, изменения, 250.0, рассчитать_сценарий)
+            print(кэш.статистика())
+    """
+
+    def __init__(self, путь_к_базе="кэш_устойчивости.sqlite", максимум_записей=100_000):
+        """
+        Args:
+            путь_к_базе: Путь к файлу SQLite
+            максимум_записей: Сколько записей хранить до вытеснения старых
+        """
+        self.путь_к_базе = путь_к_базе
+        self.максимум_записей = максимум_записей
+        self.попадания = 0
+        self.промахи = 0
+        self.вытеснено = 0
+
+        # timeout - ждем, если базу в этот момент пишет другой процесс
+        self._соединение = sqlite3.connect(путь_к_базе, timeout=30.0)
+        self._соединение.execute("PRAGMA journal_mode=WAL")
+        self._соединение.execute(
+            """
+            CREATE TABLE IF NOT EXISTS результаты (
+                отпечаток TEXT PRIMARY KEY,
+                устойчива INTEGER NOT NULL,
+                sync_loss_cause INTEGER NOT NULL,
+                time_reached REAL NOT NULL,
+                последнее_обращение REAL NOT NULL
+            )
+            """
+        )
+        self._соединение.execute(
+            "CREATE INDEX IF NOT EXISTS индекс_обращения ON результаты (последнее_обращение)"
+        )
+        self._соединение.commit()
+        self._число_записей = self._соединение.execute(
+            "SELECT COUNT(*) FROM результаты"
+        ).fetchone()[0]
+
+    def получить(self, отпечаток):
+        """
+        Ищет результат в кэше
+
+        Args:
+            отпечаток: Отпечаток сценария (см. отпечаток_сценария)
+
+        Returns:
+            dict: Результат расчета или None, если сценария нет в кэше
+        """
+        строка = self._соединение.execute(
+            "SELECT устойчива, sync_loss_cause, time_reached FROM результаты WHERE отпечаток = ?",
+            (отпечаток,),
+        ).fetchone()
+
+        if строка is None:
+            self.промахи += 1
+            return None
+
+        self.попадания += 1
+        self._соединение.execute(
+            "UPDATE результаты SET последнее_обращение = ? WHERE отпечаток = ?",
+            (time.time(), отпечаток),
+        )
+        self._соединение.commit()
+
+        return {
+            "Система_устойчива": bool(строка[0]),
+            "Причина_потери_синхронизма": строка[1],
+            "Время_достигнутое": строка[2],
+        }
+
+    def сохранить(self, отпечаток, результат):
+        """
+        Сохраняет результат расчета в кэш
+
+        Args:
+            отпечаток: Отпечаток сценария
+            результат: Словарь с ключами "Система_устойчива",
+                "Причина_потери_синхронизма", "Время_достигнутое"
+        """
+        значения = (
+            int(результат["Система_устойчива"]),
+            int(результат["Причина_потери_синхронизма"]),
+            float(результат["Время_достигнутое"]),
+            time.time(),
+        )
+        курсор = self._соединение.execute(
+            "INSERT OR IGNORE INTO результаты VALUES (?, ?, ?, ?, ?)", (отпечаток, *значения)
+        )
+        if курсор.rowcount == 1:
+            # Новая запись - только она увеличивает число записей
+            self._число_записей += 1
+        else:
+            self._соединение.execute(
+                """
+                UPDATE результаты SET устойчива = ?, sync_loss_cause = ?, time_reached = ?,
+                    последнее_обращение = ?
+                WHERE отпечаток = ?
+                """,
+                (*значения, отпечаток),
+            )
+        if self._число_записей > self.максимум_записей:
+            self._вытеснить()
+        self._соединение.commit()
+
+    def _вытеснить(self):
+        """Удаляет самые давно использованные записи сверх максимума"""
+        self._число_записей = self._соединение.execute(
+            "SELECT COUNT(*) FROM результаты"
+        ).fetchone()[0]
+        лишние = self._число_записей - self.максимум_записей
+        if лишние <= 0:
+            return
+
+        self._соединение.execute(
+            """
+            DELETE FROM результаты WHERE отпечаток IN (
+                SELECT отпечаток FROM результаты
+                ORDER BY последнее_обращение ASC LIMIT ?
+            )
+            """,
+            (лишние,),
+        )
+        self.вытеснено += лишние
+        self._число_записей -= лишние
+
+    def проверить(self, путь_к_модели, изменения, параметр_нагрузки, функция_расчета,
+                  шаг_квантования=0.01):
+        """
+        Возвращает результат из кэша или выполняет расчет и запоминает его
+
+        Args:
+            путь_к_модели: Путь к файлу модели
+            изменения: Изменения, примененные к модели
+            параметр_нагрузки: Уровень нагрузки, МВт
+            функция_расчета: Функция(параметр_нагрузки) -> dict с результатом
+                (те же ключи, что у извлечь_результат_динамики)
+            шаг_квантования: Шаг округления параметра нагрузки, МВт
+
+        Returns:
+            dict: Результат расчета
+        """
+        отпечаток = отпечаток_сценария(
+            путь_к_модели, изменения, параметр_нагрузки, шаг_квантования
+        )
+
+        результат = self.получить(отпечаток)
+        if результат is None:
+            результат = функция_расчета(параметр_нагрузки)
+            self.сохранить(отпечаток, результат)
+
+        return результат
+
+    def статистика(self):
+        """
+        Returns:
+            dict: Счетчики попаданий, промахов и вытесненных записей
+        """
+        всего = self.попадания + self.промахи
+        return {
+            "Попадания": self.попадания,
+            "Промахи": self.промахи,
+            "Доля_попаданий": self.попадания / всего if всего else 0.0,
+            "Записей": self._число_записей,
+            "Вытеснено": self.вытеснено,
+        }
+
+    def закрыть(self):
+        """Закрывает соединение с базой"""
+        self._соединение.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *исключение):
+        self.закрыть()
+
+
+def рассчитать_сценарий(параметр_нагрузки):
+    """
+    Имитация полного расчета сценария (rgm + FWDynamic)
+
+    В реальном коде здесь:
+    rastr.rgm("p")
+    fw_dynamic = rastr.FWDynamic()
+    fw_dynamic.Run()
+    и результат собирается как в извлечь_результат_динамики
+
+    Args:
+        параметр_нагрузки: Уровень нагрузки, МВт
+
+    Returns:
+        dict: Результат расчета
+    """
+    time.sleep(0.1)  # Имитация времени расчета
+    устойчива = параметр_нагрузки < 250.0
+    return {
+        "Система_устойчива": устойчива,
+        "Причина_потери_синхронизма": 0 if устойчива else 1,
+        "Время_достигнутое": 5.0 if устойчива else 1.2,
+    }
+
+
+def пример_ночного_прогона(кэш, путь_к_модели, возмущения, уровни_нагрузки):
+    """
+    Прогон всех возмущений по всем уровням нагрузки через кэш
+
+    Args:
+        кэш: Объект КэшУстойчивости
+        путь_к_модели: Путь к файлу модели
+        возмущения: Список описаний возмущений
+        уровни_нагрузки: Список уровней нагрузки, МВт
+
+    Returns:
+        float: Время прогона, с
+    """
+    начало = time.perf_counter()
+    for возмущение in возмущения:
+        for нагрузка in уровни_нагрузки:
+            кэш.проверить(путь_к_модели, {"Возмущение": возмущение}, нагрузка,
+                          рассчитать_сценарий)
+    return time.perf_counter() - начало
+
+
+# Пример использования
+if __name__ == "__main__":
+    import tempfile
+
+    print("="*60)
+    print("ПРИМЕР: Дисковый кэш результатов проверки устойчивости")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as папка:
+        # Имитация файла модели
+        путь_к_модели = Path(папка) / "схема.rst"
+        путь_к_модели.write_bytes(b"RASTR MODEL" * 1000)
+
+        уровни = [200.0, 225.0, 250.0, 275.0]
+        возмущения = ["КЗ в узле 1", "КЗ в узле 2", "Отключение ЛЭП 1-2"]
+
+        with КэшУстойчивости(str(Path(папка) / "кэш.sqlite")) as кэш:
+            print("\n1. Первый прогон (кэш пустой):")
+            время = пример_ночного_прогона(кэш, путь_к_модели, возмущения, уровни)
+            print(f"   Время: {время:.2f} с, {кэш.статистика()}")
+
+        # Новый процесс открывает тот же файл - результаты сохранились на диске
+        with КэшУстойчивости(str(Path(папка) / "кэш.sqlite")) as кэш:
+            print("\n2. Повторный прогон (все из кэша):")
+            время = пример_ночного_прогона(кэш, путь_к_модели, возмущения, уровни)
+            print(f"   Время: {время:.2f} с, {кэш.статистика()}")
+
+            print("\n3. Добавили одно возмущение - считаются только новые сценарии:")
+            время = пример_ночного_прогона(
+                кэш, путь_к_модели, возмущения + ["КЗ в узле 3"], уровни
+            )
+            print(f"   Время: {время:.2f} с, {кэш.статистика()}")
+
+    print("\n✅ Пример завершен")
@@ -0,0 +1,319 @@
+"""
+ПРИМЕР: Массовое чтение таблиц RasterWin в массивы NumPy
+
+Чтение результатов по одной ячейке (table_node.Cols("vras").Z(row), как в
+извлечь_данные_из_таблицы_узлов) - это один межпроцессный COM-вызов на
+ячейку. Для схемы на 10 000 узлов это десятки тысяч вызовов на сценарий.
+Здесь таблица читается целиком за минимальное число вызовов и
+возвращается как структурированный массив NumPy (или DataFrame).
+
+Объекты таблиц и колонок (rastr.Tables.Item(имя).Cols.Item(колонка))
+находятся один раз для загруженной модели и переиспользуются, в том числе
+для чтения и записи отдельных ячеек (значение/установить). После Load и
+NewFile они недействительны: загрузка через ЧтениеТаблиц.Load сбрасывает
+кэш сама, иначе нужно вызвать сбросить_кэш().
+"""
+
+import time
+
+import numpy as np
+
+
+def _тип_колонки(значения):
+    """Подбирает тип NumPy для колонки по ее значениям"""
+    if all(isinstance(значение, (bool, int, np.integer)) for значение in значения):
+        return np.int64
+    if all(isinstance(значение, (bool, int, float, np.number)) for значение in значения):
+        return np.float64
+    длина = max((len(str(значение)) for значение in значения), default=1)
+    return f"U{max(длина, 1)}"
+
+
+class ЧтениеТаблиц:
+    """
+    Массовое чтение таблиц RasterWin с кэшем объектов таблиц и колонок
+
+    Если таблица поддерживает ReadSafeArray (чтение нескольких колонок за
+    один вызов), используется он. Иначе колонки читаются по ячейкам, но
+    объекты колонок запрашиваются один раз и переиспользуются.
+
+    Пример:
+        чтение = ЧтениеТаблиц(rastr)
+        узлы = чтение.прочитать("node", ["ny", "vras", "delta"])
+        print(узлы["vras"].min())
+
+        P = чтение.значение("Generator", "P", 0)
+        чтение.установить("Generator", "P", 0, P - 10.0)
+        чтение.Load(0, "другая_схема.rst", "")  # Кэш сбрасывается
+        print(чтение.статистика())
+    """
+
+    def __init__(self, rastr):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+        """
+        self.rastr = rastr
+        self._таблицы = {}
+        self._колонки = {}  # (таблица, колонка) -> объект колонки
+        self.обращений = 0
+        self.поисков = 0
+        self.сбросов = 0
+
+    def сбросить_кэш(self):
+        """Забывает объекты таблиц и колонок (нужно после Load/NewFile)"""
+        self._таблицы.clear()
+        self._колонки.clear()
+        self.сбросов += 1
+
+    def начать_сценарий(self):
+        """Обнуляет счетчики, чтобы статистика относилась к одному сценарию"""
+        self.обращений = 0
+        self.поисков = 0
+
+    def Load(self, *аргументы):
+        """rastr.Load со сбросом кэша"""
+        self.сбросить_кэш()
+        return self.rastr.Load(*аргументы)
+
+    def NewFile(self, *аргументы):
+        """rastr.NewFile со сбросом кэша"""
+        self.сбросить_кэш()
+        return self.rastr.NewFile(*аргументы)
+
+    def таблица(self, имя_таблицы):
+        """Объект таблицы из кэша (rastr.Tables.Item запрашивается один раз)"""
+        if имя_таблицы not in self._таблицы:
+            self._таблицы[имя_таблицы] = self.rastr.Tables.Item(имя_таблицы)
+            self.поисков += 1
+        return self._таблицы[имя_таблицы]
+
+    def колонка(self, имя_таблицы, имя_колонки):
+        """Объект колонки из кэша (Cols.Item запрашивается один раз)"""
+        ключ = (имя_таблицы, имя_колонки)
+        if ключ not in self._колонки:
+            self._колонки[ключ] = self.таблица(имя_таблицы).Cols.Item(имя_колонки)
+            self.поисков += 1
+        return self._колонки[ключ]
+
+    def значение(self, имя_таблицы, имя_колонки, строка):
+        """Аналог rastr.Tables.Item(таблица).Cols.Item(колонка).Z(строка)"""
+        self.обращений += 1
+        return self.колонка(имя_таблицы, имя_колонки).Z(строка)
+
+    def установить(self, имя_таблицы, имя_колонки, строка, значение):
+        """Аналог rastr.Tables.Item(таблица).Cols.Item(колонка).SetZ(строка, значение)"""
+        self.обращений += 1
+        self.колонка(имя_таблицы, имя_колонки).SetZ(строка, значение)
+
+    def статистика(self):
+        """
+        Returns:
+            dict: Обращения к ячейкам, выполненные и сэкономленные поиски
+                объектов (без кэша каждое обращение - это Tables.Item + Cols.Item)
+        """
+        return {
+            "Обращений": self.обращений,
+            "Поисков_выполнено": self.поисков,
+            "Поисков_сэкономлено": max(2 * self.обращений - self.поисков, 0),
+            "Сбросов": self.сбросов,
+        }
+
+    def прочитать_колонки(self, имя_таблицы, колонки):
+        """
+        Читает колонки таблицы как списки Python
+
+        Args:
+            имя_таблицы: Название таблицы, например "node"
+            колонки: Список названий колонок
+
+        Returns:
+            dict: {колонка: [значения по строкам]}
+        """
+        таблица = self.таблица(имя_таблицы)
+
+        if hasattr(таблица, "ReadSafeArray"):
+            строки = таблица.ReadSafeArray(2, ",".join(колонки), "")
+            if not строки:
+                return {колонка: [] for колонка in колонки}
+            return dict(zip(колонки, (list(значения) for значения in zip(*строки))))
+
+        число_строк = таблица.Count
+        return {
+            колонка: [self.колонка(имя_таблицы, колонка).Z(строка) for строка in range(число_строк)]
+            for колонка in колонки
+        }
+
+    def прочитать(self, имя_таблицы, колонки):
+        """
+        Читает таблицу в структурированный массив NumPy
+
+        Args:
+            имя_таблицы: Название таблицы, например "node"
+            колонки: Список названий колонок
+
+        Returns:
+            numpy.ndarray: Структурированный массив, поля - колонки
+        """
+        данные = self.прочитать_колонки(имя_таблицы, колонки)
+        число_строк = len(данные[колонки[0]]) if колонки else 0
+
+        тип = np.dtype([(колонка, _тип_колонки(данные[колонка])) for колонка in колонки])
+        массив = np.empty(число_строк, dtype=тип)
+        for колонка in колонки:
+            массив[колонка] = данные[колонка]
+        return массив
+
+    def прочитать_dataframe(self, имя_таблицы, колонки):
+        """
+        Читает таблицу в pandas.DataFrame
+
+        Returns:
+            pandas.DataFrame: Таблица с колонками в заданном порядке
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.прочитать_колонки(имя_таблицы, колонки), columns=list(колонки))
+
+
+def прочитать_поячеечно(rastr, имя_таблицы, колонки):
+    """
+    Чтение таблицы по одной ячейке, как в извлечь_данные_из_таблицы_узлов
+
+    Returns:
+        dict: {колонка: [значения по строкам]}
+    """
+    таблица = rastr.Tables.Item(имя_таблицы)
+    данные = {колонка: [] for колонка in колонки}
+    for строка in range(таблица.Count):
+        for колонка in колонки:
+            данные[колонка].append(таблица.Cols(колонка).Z(строка))
+    return данные
+
+
+def сравнить_с_поячеечным_чтением(число_узлов=10_000, задержка_вызова=20e-6,
+                                  колонки=("ny", "name", "vras", "delta", "p", "q")):
+    """
+    Бенчмарк: массовое чтение против поячеечного на имитаторе
+
+    Задержка каждого вызова имитирует стоимость межпроцессного COM-вызова.
+
+    Args:
+        число_узлов: Размер схемы
+        задержка_вызова: Стоимость одного COM-вызова, с
+        колонки: Какие колонки таблицы node читать
+
+    Returns:
+        dict: Время и число вызовов для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    колонки = list(колонки)
+    print("\n" + "="*60)
+    print(f"ЧТЕНИЕ ТАБЛИЦЫ node: {число_узлов} узлов, {len(колонки)} колонок, "
+          f"{задержка_вызова * 1e6:.0f} мкс на вызов")
+    print("="*60)
+
+    сводка = {}
+    for способ in ("Поячеечно", "Кэш колонок", "Массово"):
+        rastr = ИмитаторRastr(число_узлов=число_узлов, задержка_вызова=задержка_вызова)
+        начало = time.perf_counter()
+        if способ == "Поячеечно":
+            прочитать_поячеечно(rastr, "node", колонки)
+        elif способ == "Кэш колонок":
+            # Тот же поячеечный путь, что и без ReadSafeArray, но с кэшем колонок
+            чтение = ЧтениеТаблиц(rastr)
+            таблица = чтение.таблица("node")
+            for колонка in колонки:
+                объект = чтение.колонка("node", колонка)
+                for строка in range(таблица.Count):
+                    объект.Z(строка)
+        else:
+            ЧтениеТаблиц(rastr).прочитать("node", колонки)
+        время = time.perf_counter() - начало
+
+        вызовов = sum(rastr.счетчики_вызовов.values())
+        сводка[способ] = {"Время": время, "Вызовов": вызовов}
+        print(f"  {способ:<12} время: {время:8.3f} с   вызовов: {вызовов:8d}")
+
+    print(f"\n  Ускорение массового чтения: "
+          f"{сводка['Поячеечно']['Время'] / сводка['Массово']['Время']:.0f}x")
+    return сводка
+
+
+def сравнить_с_поиском_при_каждом_обращении(число_генераторов=200, итераций=10,
+                                            задержка_вызова=20e-6):
+    """
+    Бенчмарк: цикл корректировки генераторов с поиском объектов при каждом
+    обращении и через кэш ЧтениеТаблиц
+
+    Args:
+        число_генераторов: Количество генераторов в схеме
+        итераций: Количество итераций корректировки
+        задержка_вызова: Стоимость одного COM-вызова, с
+
+    Returns:
+        dict: Время и число COM-вызовов для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("\n" + "="*60)
+    print(f"КОРРЕКТИРОВКА ГЕНЕРАТОРОВ: {число_генераторов} генераторов, {итераций} итераций")
+    print("="*60)
+
+    сводка = {}
+    for способ in ("Поиск каждый раз", "Кэш объектов"):
+        rastr = ИмитаторRastr(число_генераторов=число_генераторов, задержка_вызова=задержка_вызова)
+        чтение = ЧтениеТаблиц(rastr)
+
+        начало = time.perf_counter()
+        for _ in range(итераций):
+            for строка in range(число_генераторов):
+                if способ == "Поиск каждый раз":
+                    P = rastr.Tables.Item("Generator").Cols.Item("P").Z(строка)
+                    Pmin = rastr.Tables.Item("Generator").Cols.Item("Pmin").Z(строка)
+                    rastr.Tables.Item("Generator").Cols.Item("P").SetZ(строка, max(P - 5.0, Pmin))
+                else:
+                    P = чтение.значение("Generator", "P", строка)
+                    Pmin = чтение.значение("Generator", "Pmin", строка)
+                    чтение.установить("Generator", "P", строка, max(P - 5.0, Pmin))
+        время = time.perf_counter() - начало
+
+        вызовов = sum(rastr.счетчики_вызовов.values())
+        сводка[способ] = {"Время": время, "Вызовов": вызовов}
+        print(f"  {способ:<17} время: {время:6.3f} с   COM-вызовов: {вызовов:7d}")
+        if способ == "Кэш объектов":
+            print(f"  Статистика кэша: {чтение.статистика()}")
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Массовое чтение таблиц RasterWin")
+    print("="*60)
+
+    rastr = ИмитаторRastr(число_узлов=20)
+    rastr.rgm("p")
+
+    узлы = ЧтениеТаблиц(rastr).прочитать("node", ["ny", "name", "vras", "delta"])
+    print(f"\nТип массива: {узлы.dtype}")
+    print(f"Первые 3 узла: {узлы[:3]}")
+    print(f"Минимальное напряжение: {узлы['vras'].min():.2f} кВ "
+          f"в узле {узлы['ny'][узлы['vras'].argmin()]}")
+
+    # Чтение и запись отдельных ячеек через кэш объектов, сброс при Load
+    чтение = ЧтениеТаблиц(rastr)
+    for сценарий in range(1, 3):
+        чтение.Load(0, f"сценарий_{сценарий}.rst", "")
+        чтение.начать_сценарий()
+        for строка in range(5):
+            чтение.установить("Generator", "P", строка, чтение.значение("Generator", "P", строка) * 1.1)
+        rastr.rgm("p")
+        print(f"\nСценарий {сценарий}: {чтение.статистика()}")
+
+    сравнить_с_поячеечным_чтением(число_узлов=2_000)
+    сравнить_с_поиском_при_каждом_обращении()
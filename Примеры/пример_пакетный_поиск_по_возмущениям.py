@@ -0,0 +1,226 @@
+"""
+ПРИМЕР: Пакетный поиск предельных режимов для списка возмущений
+
+В реальных расчетах один и тот же поиск предела выполняется для сотен
+возмущений на одной схеме, и пределы соседних возмущений обычно
+отличаются на несколько процентов. Поэтому каждый следующий поиск можно
+начинать не со всего диапазона [мин, макс], а с узкого интервала вокруг
+прогноза по уже найденным пределам ("теплый старт").
+"""
+
+import statistics
+import time
+
+from пример_цикл_устойчивости import сузить_интервал_бинарно
+
+
+# Имитация пределов для разных возмущений (в реальном коде их и ищем)
+ПРЕДЕЛЫ_ВОЗМУЩЕНИЙ = {
+    "КЗ на шинах 500 кВ ПС-1": 251.3,
+    "КЗ на шинах 500 кВ ПС-2": 247.8,
+    "Отключение ВЛ 500 кВ Л-1": 262.4,
+    "Отключение ВЛ 500 кВ Л-2": 258.1,
+    "КЗ на ВЛ 220 кВ Л-3 с АПВ": 244.6,
+    "Отключение АТ-1 ПС-1": 268.9,
+    "КЗ на шинах 220 кВ ПС-3": 239.5,
+    "Отключение блока Г-3": 273.2,
+}
+
+
+def проверить_устойчивость_при_возмущении(возмущение, параметр_нагрузки):
+    """
+    Имитация проверки устойчивости при заданном возмущении
+
+    В реальном коде здесь: загрузка сценария возмущения (.scn),
+    установка нагрузки, rgm и FWDynamic().Run().
+
+    Args:
+        возмущение: Название возмущения
+        параметр_нагрузки: Параметр нагрузки, МВт
+
+    Returns:
+        bool: True если система устойчива
+    """
+    print(f"  [{возмущение}] проверка при {параметр_нагрузки:.2f} МВт")
+    time.sleep(0.02)  # Имитация времени расчета
+    return параметр_нагрузки < ПРЕДЕЛЫ_ВОЗМУЩЕНИЙ[возмущение]
+
+
+def число_расчетов_без_прогноза(мин_нагрузка, макс_нагрузка, точность):
+    """
+    Сколько расчетов требует обычный бинарный поиск по всему диапазону
+
+    Бинарный поиск проверяет две границы и делит интервал пополам, пока
+    он шире точности, поэтому число расчетов не зависит от ответов.
+
+    Returns:
+        int: Число расчетов
+    """
+    ширина = макс_нагрузка - мин_нагрузка
+    делений = 0
+    while ширина > точность:
+        ширина /= 2.0
+        делений += 1
+    return 2 + делений
+
+
+def найти_предел_с_прогнозом(проверка, прогноз, мин_нагрузка, макс_нагрузка, точность,
+                             запас_прогноза):
+    """
+    Поиск предела, начиная с узкого интервала вокруг прогноза
+
+    Если прогноз ошибочен (нижняя граница интервала неустойчива или
+    верхняя устойчива), интервал расширяется в эту сторону вдвое, пока
+    не будет найдена граница или не будет достигнут край диапазона.
+
+    Args:
+        проверка: Функция(нагрузка) -> bool
+        прогноз: Ожидаемое значение предела, МВт
+        мин_нагрузка: Минимальное значение нагрузки
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+        запас_прогноза: Относительная полуширина начального интервала
+
+    Returns:
+        tuple: (предел или None, число расчетов)
+    """
+    полуширина = max(прогноз * запас_прогноза, точность)
+    расчетов = 0
+
+    # Нижняя граница: расширяем вниз, пока не найдем устойчивый режим
+    шаг = полуширина
+    нижняя_граница = max(прогноз - шаг, мин_нагрузка)
+    верхняя_неустойчивая = None
+    while True:
+        расчетов += 1
+        if проверка(нижняя_граница):
+            break
+        print(f"  ⚠️ Прогноз завышен: {нижняя_граница:.2f} МВт неустойчиво → расширяем вниз")
+        верхняя_неустойчивая = нижняя_граница
+        if нижняя_граница <= мин_нагрузка:
+            return None, расчетов
+        шаг *= 2.0
+        нижняя_граница = max(нижняя_граница - шаг, мин_нагрузка)
+
+    # Верхняя граница: если уже нашли неустойчивую точку, проверять не нужно
+    if верхняя_неустойчивая is not None:
+        верхняя_граница = верхняя_неустойчивая
+    else:
+        шаг = полуширина
+        верхняя_граница = min(прогноз + шаг, макс_нагрузка)
+        while True:
+            расчетов += 1
+            if not проверка(верхняя_граница):
+                break
+            print(f"  ⚠️ Прогноз занижен: {верхняя_граница:.2f} МВт устойчиво → расширяем вверх")
+            нижняя_граница = верхняя_граница
+            if верхняя_граница >= макс_нагрузка:
+                return макс_нагрузка, расчетов
+            шаг *= 2.0
+            верхняя_граница = min(верхняя_граница + шаг, макс_нагрузка)
+
+    предел, итераций = сузить_интервал_бинарно(
+        нижняя_граница, верхняя_граница, точность, проверка
+    )
+    return предел, расчетов + итераций
+
+
+def найти_пределы_для_списка_возмущений(возмущения, мин_нагрузка, макс_нагрузка, точность=1.0,
+                                        функция_проверки=None, запас_прогноза=0.05):
+    """
+    Пакетный поиск предельных режимов для списка возмущений
+
+    Первое возмущение считается обычным бинарным поиском по всему
+    диапазону. Для каждого следующего прогнозом служит медиана уже
+    найденных пределов, и поиск начинается с интервала
+    [прогноз * (1 - запас), прогноз * (1 + запас)].
+
+    Args:
+        возмущения: Список возмущений
+        мин_нагрузка: Минимальное значение нагрузки
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+        функция_проверки: Функция(возмущение, нагрузка) -> bool, по умолчанию
+            проверить_устойчивость_при_возмущении
+        запас_прогноза: Относительная полуширина начального интервала
+
+    Returns:
+        dict: {"Пределы": {возмущение: предел}, "Расчетов": ...,
+               "Расчетов_без_прогноза": ...}
+    """
+    if функция_проверки is None:
+        функция_проверки = проверить_устойчивость_при_возмущении
+
+    print("\n" + "="*60)
+    print(f"ПАКЕТНЫЙ ПОИСК ПРЕДЕЛОВ ({len(возмущения)} возмущений)")
+    print("="*60)
+
+    пределы = {}
+    всего_расчетов = 0
+    расчетов_на_холодный_поиск = число_расчетов_без_прогноза(
+        мин_нагрузка, макс_нагрузка, точность
+    )
+
+    for возмущение in возмущения:
+        def проверка(нагрузка):
+            return функция_проверки(возмущение, нагрузка)
+
+        найденные = [п for п in пределы.values() if п is not None]
+        print(f"\n▶ {возмущение}")
+
+        if найденные:
+            прогноз = statistics.median(найденные)
+            print(f"  Прогноз предела: {прогноз:.2f} МВт")
+            предел, расчетов = найти_предел_с_прогнозом(
+                проверка, прогноз, мин_нагрузка, макс_нагрузка, точность, запас_прогноза
+            )
+        else:
+            # Первое возмущение - обычный бинарный поиск по всему диапазону
+            расчетов = 2
+            if not проверка(мин_нагрузка):
+                предел = None
+                расчетов = 1
+            elif проверка(макс_нагрузка):
+                предел = макс_нагрузка
+            else:
+                предел, итераций = сузить_интервал_бинарно(
+                    мин_нагрузка, макс_нагрузка, точность, проверка
+                )
+                расчетов += итераций
+
+        пределы[возмущение] = предел
+        всего_расчетов += расчетов
+        if предел is None:
+            print(f"  ❌ Устойчивый режим не найден (расчетов: {расчетов})")
+        else:
+            print(f"  ✅ Предел: {предел:.2f} МВт (расчетов: {расчетов})")
+
+    без_прогноза = расчетов_на_холодный_поиск * len(возмущения)
+    print("\n" + "="*60)
+    print("ИТОГИ ПАКЕТНОГО ПОИСКА")
+    print("="*60)
+    print(f"  Расчетов с прогнозом:  {всего_расчетов}")
+    print(f"  Расчетов без прогноза: {без_прогноза}")
+    print(f"  Сэкономлено расчетов:  {без_прогноза - всего_расчетов} "
+          f"({(без_прогноза - всего_расчетов) / без_прогноза:.0%})")
+
+    return {
+        "Пределы": пределы,
+        "Расчетов": всего_расчетов,
+        "Расчетов_без_прогноза": без_прогноза,
+    }
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: ПАКЕТНЫЙ ПОИСК ПРЕДЕЛОВ С ТЕПЛЫМ СТАРТОМ")
+    print("="*60)
+
+    итоги = найти_пределы_для_списка_возмущений(
+        list(ПРЕДЕЛЫ_ВОЗМУЩЕНИЙ), мин_нагрузка=100.0, макс_нагрузка=400.0, точность=1.0
+    )
+
+    print("\nНайденные пределы:")
+    for возмущение, предел in итоги["Пределы"].items():
+        print(f"  {возмущение}: {предел:.2f} МВт (истинный {ПРЕДЕЛЫ_ВОЗМУЩЕНИЙ[возмущение]})")
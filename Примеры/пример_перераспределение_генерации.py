@@ -0,0 +1,239 @@
+"""
+ПРИМЕР: Векторное перераспределение мощности генераторов (NumPy)
+
+В пример_с_корректировкой_генераторов генераторы хранятся словарем
+словарей, и мощность каждого уменьшается на 10 МВт в цикле Python.
+Здесь P_min, P_max, P_текущая и коэффициенты участия хранятся в массивах
+NumPy: изменение распределяется пропорционально коэффициентам за одну
+векторную операцию, ограничивается пределами, а недобор перераспределяется
+между оставшимися генераторами. Время одной итерации почти не зависит от
+числа генераторов.
+"""
+
+import time
+
+import numpy as np
+
+from пример_цикл_устойчивости import проверить_устойчивость_системы
+
+
+class ДвижокПерераспределения:
+    """
+    Перераспределение мощности между генераторами на массивах NumPy
+
+    Пример:
+        движок = ДвижокПерераспределения.из_словаря(генераторы)
+        недобор = движок.изменить_мощность(-20.0)
+        if движок.все_на_минимуме():
+            ...
+    """
+
+    def __init__(self, P_min, P_max, P_текущая, коэффициенты_участия=None, имена=None):
+        """
+        Args:
+            P_min: Минимальные мощности генераторов, МВт
+            P_max: Максимальные мощности генераторов, МВт
+            P_текущая: Текущие мощности генераторов, МВт
+            коэффициенты_участия: Доли участия в изменении мощности
+                (по умолчанию - пропорционально регулировочному диапазону)
+            имена: Названия генераторов (для вывода)
+        """
+        self.P_min = np.asarray(P_min, dtype=np.float64)
+        self.P_max = np.asarray(P_max, dtype=np.float64)
+        self.P = np.clip(np.asarray(P_текущая, dtype=np.float64), self.P_min, self.P_max)
+
+        if коэффициенты_участия is None:
+            коэффициенты_участия = self.P_max - self.P_min
+        self.коэффициенты = np.asarray(коэффициенты_участия, dtype=np.float64)
+
+        self.имена = list(имена) if имена is not None else [
+            f"Г-{номер}" for номер in range(1, len(self.P) + 1)
+        ]
+
+    @classmethod
+    def из_словаря(cls, генераторы, коэффициенты_участия=None):
+        """
+        Создает движок из словаря в формате пример_с_корректировкой_генераторов
+
+        Args:
+            генераторы: {"Г-1": {"P_min": 50, "P_max": 200, "P_текущая": 150}, ...}
+            коэффициенты_участия: Необязательные доли участия
+
+        Returns:
+            ДвижокПерераспределения
+        """
+        параметры = list(генераторы.values())
+        return cls(
+            [г["P_min"] for г in параметры],
+            [г["P_max"] for г in параметры],
+            [г["P_текущая"] for г in параметры],
+            коэффициенты_участия,
+            имена=генераторы.keys(),
+        )
+
+    @property
+    def суммарная_мощность(self):
+        """float: Суммарная мощность всех генераторов, МВт"""
+        return float(self.P.sum())
+
+    def изменить_мощность(self, изменение, допуск=1e-9):
+        """
+        Изменяет суммарную мощность, распределяя изменение по коэффициентам
+
+        За один проход изменение делится между генераторами пропорционально
+        коэффициентам и ограничивается пределами P_min/P_max. То, что не
+        поместилось у дошедших до предела, делится между остальными на
+        следующем проходе (проходов обычно 1-3, каждый - векторный).
+
+        Args:
+            изменение: Требуемое изменение суммарной мощности, МВт
+                (отрицательное - снижение)
+            допуск: Остаток, который считается нулевым, МВт
+
+        Returns:
+            float: Недобор - часть изменения, которую некуда распределить
+                (все генераторы на пределе), МВт
+        """
+        остаток = float(изменение)
+
+        # Участвуют только генераторы, которые могут двигаться в нужную сторону
+        if остаток < 0:
+            активные = (self.P > self.P_min) & (self.коэффициенты > 0)
+        else:
+            активные = (self.P < self.P_max) & (self.коэффициенты > 0)
+
+        while abs(остаток) > допуск and активные.any():
+            доли = np.where(активные, self.коэффициенты, 0.0)
+            доли /= доли.sum()
+
+            новая_P = np.clip(self.P + остаток * доли, self.P_min, self.P_max)
+            остаток -= float((новая_P - self.P).sum())
+            self.P = новая_P
+
+            # Генераторы, упершиеся в предел, выбывают из следующего прохода
+            if остаток < 0:
+                активные &= self.P > self.P_min
+            else:
+                активные &= self.P < self.P_max
+
+        return остаток if abs(остаток) > допуск else 0.0
+
+    def все_на_минимуме(self):
+        """
+        Returns:
+            bool: True если все генераторы на минимуме мощности
+        """
+        return bool(np.all(self.P <= self.P_min))
+
+    def как_словарь(self):
+        """
+        Returns:
+            dict: {имя: текущая мощность} - для вывода и записи в Excel
+        """
+        return dict(zip(self.имена, self.P.tolist()))
+
+
+def пример_с_корректировкой_генераторов_numpy(шаг_корректировки=-10.0, максимальные_итерации=20):
+    """
+    Цикл корректировки генераторов из пример_с_корректировкой_генераторов,
+    переписанный на ДвижокПерераспределения
+
+    Args:
+        шаг_корректировки: Изменение мощности на генератор за итерацию, МВт
+        максимальные_итерации: Ограничение числа итераций
+    """
+    print("\n" + "="*60)
+    print("ПРИМЕР: КОРРЕКТИРОВКА ГЕНЕРАТОРОВ (NumPy)")
+    print("="*60)
+
+    генераторы = {
+        "Г-1": {"P_min": 50, "P_max": 200, "P_текущая": 150},
+        "Г-2": {"P_min": 50, "P_max": 200, "P_текущая": 150},
+    }
+    движок = ДвижокПерераспределения.из_словаря(генераторы)
+
+    for итерация in range(1, максимальные_итерации + 1):
+        общая_нагрузка = движок.суммарная_мощность
+        print(f"\nИтерация {итерация}: Общая нагрузка = {общая_нагрузка:.2f} МВт")
+
+        if проверить_устойчивость_системы(общая_нагрузка):
+            print("  ✅ Система УСТОЙЧИВА")
+            for имя, мощность in движок.как_словарь().items():
+                print(f"   {имя}: {мощность:.2f} МВт")
+            return
+
+        print("  ❌ Система НЕУСТОЙЧИВА → корректируем мощность")
+        недобор = движок.изменить_мощность(шаг_корректировки * len(движок.P))
+        if недобор:
+            print(f"    Не удалось распределить {недобор:.2f} МВт")
+
+        if движок.все_на_минимуме():
+            print("\n⚠️ Все генераторы достигли минимума, но система неустойчива")
+            return
+
+    print("\n⚠️ Достигнуто максимальное количество итераций")
+
+
+def _корректировка_словарем(генераторы, шаг_корректировки):
+    """Одна итерация корректировки в стиле пример_с_корректировкой_генераторов"""
+    все_на_минимуме = True
+    for параметры in генераторы.values():
+        новая_мощность = параметры["P_текущая"] + шаг_корректировки
+        if новая_мощность < параметры["P_min"]:
+            новая_мощность = параметры["P_min"]
+        else:
+            все_на_минимуме = False
+        параметры["P_текущая"] = новая_мощность
+    return все_на_минимуме
+
+
+def сравнить_время_корректировки(размеры=(10, 1_000, 10_000, 100_000), итераций=20):
+    """
+    Бенчмарк: время одной итерации корректировки - словарь против NumPy
+
+    Args:
+        размеры: Числа генераторов для сравнения
+        итераций: Сколько итераций корректировки выполнять
+
+    Returns:
+        dict: Число генераторов -> (мкс на итерацию словарем, мкс на итерацию NumPy)
+    """
+    print("\n" + "="*60)
+    print("ВРЕМЯ ОДНОЙ ИТЕРАЦИИ КОРРЕКТИРОВКИ")
+    print("="*60)
+    print(f"  {'Генераторов':>12}{'Словарь, мкс':>15}{'NumPy, мкс':>13}{'Ускорение':>11}")
+
+    генератор_чисел = np.random.default_rng(1)
+    сводка = {}
+    for число in размеры:
+        P_min = генератор_чисел.uniform(20, 100, число)
+        P_max = P_min + генератор_чисел.uniform(50, 300, число)
+        P = (P_min + P_max) / 2.0
+
+        генераторы = {
+            f"Г-{номер}": {"P_min": мин, "P_max": макс, "P_текущая": тек}
+            for номер, (мин, макс, тек) in enumerate(zip(P_min, P_max, P), start=1)
+        }
+        начало = time.perf_counter()
+        for _ in range(итераций):
+            _корректировка_словарем(генераторы, -10.0)
+        время_словарь = (time.perf_counter() - начало) / итераций * 1e6
+
+        движок = ДвижокПерераспределения(P_min, P_max, P)
+        начало = time.perf_counter()
+        for _ in range(итераций):
+            движок.изменить_мощность(-10.0 * число)
+            движок.все_на_минимуме()
+        время_numpy = (time.perf_counter() - начало) / итераций * 1e6
+
+        print(f"  {число:>12}{время_словарь:>15.1f}{время_numpy:>13.1f}"
+              f"{время_словарь / время_numpy:>10.1f}x")
+        сводка[число] = (время_словарь, время_numpy)
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    пример_с_корректировкой_генераторов_numpy()
+    сравнить_время_корректировки()
@@ -0,0 +1,263 @@
+"""
+ПРИМЕР: Поиск предельного режима по непрерывному запасу устойчивости
+
+Бинарный поиск использует только ответ "устойчиво / неустойчиво" и
+не учитывает, НАСКОЛЬКО близко расчет подошел к потере синхронизма.
+Если по каждому динамическому расчету вычислить непрерывный запас
+(например, по максимальному углу или по времени до потери синхронизма),
+то границу можно искать интерполяцией (метод ложного положения /
+regula falsi в модификации Illinois). На гладких зависимостях запаса
+это требует в 1.5-3 раза меньше дорогих расчетов при той же точности.
+"""
+
+import contextlib
+import io
+import math
+import time
+
+from пример_цикл_устойчивости import найти_последний_устойчивый_режим_бинарно
+
+
+def запас_по_результату_динамики(результат, полное_время, максимальный_угол=None,
+                                 предельный_угол=180.0):
+    """
+    Вычисляет непрерывный запас устойчивости по результату динамики
+
+    Запас положителен, если система устойчива, и отрицателен, если нет:
+    - устойчиво: (предельный_угол - максимальный_угол) / предельный_угол,
+      то есть чем меньше максимальный угол, тем больше запас;
+    - неустойчиво: TimeReached / полное_время - 1, то есть чем позже
+      произошла потеря синхронизма, тем ближе запас к нулю.
+
+    Args:
+        результат: Словарь из извлечь_результат_динамики
+        полное_время: Время расчета динамики, с
+        максимальный_угол: Максимальная разность углов роторов за расчет, град
+            (например, по графикам из получить_точки_графика)
+        предельный_угол: Угол, при котором фиксируется потеря синхронизма, град
+
+    Returns:
+        float: Запас устойчивости в диапазоне [-1, 1]
+    """
+    if результат["Система_устойчива"]:
+        if максимальный_угол is None:
+            # Без информации об угле известно только, что запас положительный
+            return 1.0
+        return max(предельный_угол - максимальный_угол, 0.0) / предельный_угол
+
+    return min(результат["Время_достигнутое"] / полное_время, 1.0) - 1.0
+
+
+def оценить_запас_устойчивости(параметр_нагрузки):
+    """
+    Имитация расчета запаса устойчивости
+
+    В реальном коде здесь: rgm, FWDynamic().Run(), чтение максимального
+    угла из графиков и запас_по_результату_динамики.
+
+    Args:
+        параметр_нагрузки: Параметр нагрузки, МВт
+
+    Returns:
+        float: Запас устойчивости (> 0 - устойчиво)
+    """
+    print(f"  Расчет запаса при нагрузке: {параметр_нагрузки:.2f} МВт")
+    time.sleep(0.1)  # Имитация времени расчета
+
+    # Угол растет нелинейно с нагрузкой, граница - 250 МВт
+    return 1.0 - (параметр_нагрузки / 250.0) ** 2
+
+
+def найти_последний_устойчивый_режим_по_запасу(мин_нагрузка, макс_нагрузка, точность=1.0,
+                                               функция_запаса=None):
+    """
+    Поиск последнего устойчивого режима методом ложного положения (Illinois)
+
+    Каждая новая точка - это корень прямой, проведенной через запасы на
+    границах интервала (Illinois: если одна граница держится два шага
+    подряд, ее запас делится пополам). Чтобы интервал закрывался с обеих
+    сторон, точка сдвигается от корня к середине интервала - на половину
+    точности или на четверть последнего изменения оценки корня.
+
+    Защита бисекцией: точка не может уйти от середины интервала дальше,
+    чем позволяет оставшееся число шагов бинарного поиска (как в методе
+    ITP). Поэтому даже на "неудобной" зависимости запаса расчетов не
+    больше, чем у бинарного поиска плюс один.
+
+    Args:
+        мин_нагрузка: Минимальное значение нагрузки (заведомо устойчиво)
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+        функция_запаса: Функция(нагрузка) -> float, > 0 если устойчиво.
+            По умолчанию оценить_запас_устойчивости
+
+    Returns:
+        float: Последнее значение нагрузки, при котором система устойчива
+    """
+    if функция_запаса is None:
+        функция_запаса = оценить_запас_устойчивости
+
+    print("\n" + "="*60)
+    print("ПОИСК ПО ЗАПАСУ УСТОЙЧИВОСТИ (REGULA FALSI / ILLINOIS)")
+    print("="*60)
+
+    нижняя_граница, верхняя_граница = мин_нагрузка, макс_нагрузка
+    запас_нижней = функция_запаса(нижняя_граница)
+    if запас_нижней <= 0:
+        print("  ❌ Нижняя граница НЕУСТОЙЧИВА (это не должно быть!)")
+        return None
+
+    запас_верхней = функция_запаса(верхняя_граница)
+    if запас_верхней > 0:
+        print("  ✅ Верхняя граница УСТОЙЧИВА (значит весь диапазон устойчив)")
+        return верхняя_граница
+
+    # Бюджет шагов: столько делает бинарный поиск, плюс один шаг запаса
+    шагов_бисекции = math.ceil(math.log2((верхняя_граница - нижняя_граница) / точность))
+    бюджет_шагов = шагов_бисекции + 1
+
+    последняя_сдвинутая = None  # Какая граница сдвинулась на прошлом шаге
+    предыдущий_корень = None
+    итерация = 0
+
+    while (верхняя_граница - нижняя_граница) > точность:
+        середина = (нижняя_граница + верхняя_граница) / 2.0
+
+        # Корень прямой через (нижняя, запас_нижней) и (верхняя, запас_верхней)
+        корень = (запас_верхней * нижняя_граница - запас_нижней * верхняя_граница) / (
+            запас_верхней - запас_нижней
+        )
+
+        # Сдвиг к середине: чем сильнее "гуляет" оценка корня, тем больше сдвиг
+        сдвиг = 0.45 * точность
+        if предыдущий_корень is not None:
+            сдвиг = max(сдвиг, 0.25 * abs(корень - предыдущий_корень))
+        предыдущий_корень = корень
+
+        направление = 1.0 if середина > корень else -1.0
+        if сдвиг <= abs(середина - корень):
+            точка = корень + направление * сдвиг
+        else:
+            точка = середина
+
+        # Защита бисекцией: насколько точка может отойти от середины
+        радиус = 0.5 * точность * 2 ** (бюджет_шагов - итерация) - (
+            верхняя_граница - нижняя_граница
+        ) / 2.0
+        if abs(точка - середина) <= радиус:
+            способ = "интерполяция"
+        else:
+            точка = середина - направление * радиус
+            способ = "бисекция" if радиус <= 0 else "интерполяция (ограничена)"
+
+        итерация += 1
+        print(f"\nИтерация {итерация} ({способ}):")
+        print(f"  Диапазон: [{нижняя_граница:.2f}, {верхняя_граница:.2f}] МВт")
+        запас = функция_запаса(точка)
+
+        if запас > 0:
+            print(f"  ✅ {точка:.2f} МВт УСТОЙЧИВА (запас {запас:.3f})")
+            нижняя_граница, запас_нижней = точка, запас
+            # Illinois: верхняя граница держится второй раз подряд - ослабляем ее вес
+            if последняя_сдвинутая == "нижняя":
+                запас_верхней /= 2.0
+            последняя_сдвинутая = "нижняя"
+        else:
+            print(f"  ❌ {точка:.2f} МВт НЕУСТОЙЧИВА (запас {запас:.3f})")
+            верхняя_граница, запас_верхней = точка, запас
+            if последняя_сдвинутая == "верхняя":
+                запас_нижней /= 2.0
+            последняя_сдвинутая = "верхняя"
+
+    результат = нижняя_граница
+    print(f"\n✅ Результат: Последний устойчивый режим = {результат:.2f} МВт")
+    print(f"   Итераций выполнено: {итерация} (бинарному поиску нужно {шагов_бисекции})")
+
+    return результат
+
+
+def синтетические_функции_запаса():
+    """
+    Набор синтетических зависимостей запаса от нагрузки для бенчмарка
+
+    Returns:
+        dict: Название -> (функция_запаса, истинная_граница)
+    """
+    return {
+        "Линейная": (lambda x: (250.0 - x) / 250.0, 250.0),
+        "Квадратичная (угол)": (lambda x: 1.0 - (x / 250.0) ** 2, 250.0),
+        "Излом (угол / TimeReached)": (
+            lambda x: 1.0 - (x / 141.2) ** 2 if x < 141.2 else (141.2 / x) ** 4 - 1.0, 141.2
+        ),
+        "Насыщение (tanh)": (lambda x: math.tanh((263.7 - x) / 15.0), 263.7),
+        "Экспонента": (lambda x: math.exp((233.3 - x) / 40.0) - 1.0, 233.3),
+        # Неудобный случай: запас почти не меняется около границы
+        "Кубическая (плоская)": (lambda x: (180.0 - x) ** 3 / 1e5, 180.0),
+    }
+
+
+def сравнить_число_расчетов(мин_нагрузка=100.0, макс_нагрузка=300.0, точность=1.0):
+    """
+    Бенчмарк: сравнивает число расчетов бинарного поиска и поиска по запасу
+
+    Расчеты не выполняются по-настоящему - считается, сколько раз каждый
+    поиск вызвал бы расчет динамики на синтетических функциях запаса.
+
+    Args:
+        мин_нагрузка: Минимальное значение нагрузки
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+
+    Returns:
+        dict: Название функции -> (расчетов_бинарно, расчетов_по_запасу)
+    """
+    print("\n" + "="*60)
+    print(f"ЧИСЛО РАСЧЕТОВ ПРИ ТОЧНОСТИ {точность} МВт")
+    print("="*60)
+    print(f"  {'Функция запаса':<30}{'Бинарно':>9}{'По запасу':>11}  Ошибка")
+
+    сводка = {}
+    for название, (функция, граница) in синтетические_функции_запаса().items():
+        счетчик = {"Бинарно": 0, "По запасу": 0}
+
+        def проверка(нагрузка):
+            счетчик["Бинарно"] += 1
+            return функция(нагрузка) > 0
+
+        def запас(нагрузка):
+            счетчик["По запасу"] += 1
+            return функция(нагрузка)
+
+        # Подробный вывод поисков здесь не нужен
+        with contextlib.redirect_stdout(io.StringIO()):
+            найти_последний_устойчивый_режим_бинарно(
+                мин_нагрузка, макс_нагрузка, точность, функция_проверки=проверка
+            )
+            результат = найти_последний_устойчивый_режим_по_запасу(
+                мин_нагрузка, макс_нагрузка, точность, функция_запаса=запас
+            )
+
+        ошибка = граница - результат
+        отметка = "✅" if 0 <= ошибка <= точность else "❌"
+        print(f"  {название:<30}{счетчик['Бинарно']:>9}{счетчик['По запасу']:>11}"
+              f"  {ошибка:.2f} {отметка}")
+        сводка[название] = (счетчик["Бинарно"], счетчик["По запасу"])
+
+    всего_бинарно = sum(б for б, _ in сводка.values())
+    всего_по_запасу = sum(з for _, з in сводка.values())
+    print(f"\n  Всего: {всего_бинарно} против {всего_по_запасу} расчетов "
+          f"({всего_бинарно / всего_по_запасу:.1f}x меньше)")
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: ПОИСК ПРЕДЕЛЬНОГО РЕЖИМА ПО ЗАПАСУ УСТОЙЧИВОСТИ")
+    print("="*60)
+
+    найти_последний_устойчивый_режим_по_запасу(100.0, 300.0, точность=1.0)
+
+    сравнить_число_расчетов(100.0, 300.0, точность=1.0)
+    сравнить_число_расчетов(100.0, 300.0, точность=0.1)
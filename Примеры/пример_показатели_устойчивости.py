@@ -0,0 +1,274 @@
+"""
+ПРИМЕР: Показатели устойчивости по траекториям генераторов и узлов
+
+Итог расчета динамики в извлечь_результат_динамики - только
+SyncLossCause. Размах углов, отклонение частоты, время восстановления
+напряжения и демпфирование качаний обычно считают вручную по точкам
+графиков. Здесь все показатели считаются для всех генераторов и узлов
+сразу несколькими векторными проходами NumPy по матрицам траекторий
+(результат получить_траектории), а итог расчета - одна компактная запись.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+НОМИНАЛЬНАЯ_ЧАСТОТА = 50.0  # Гц
+
+# Угол, при котором считается, что синхронизм потерян, град
+ПРЕДЕЛЬНЫЙ_РАЗМАХ_УГЛОВ = 180.0
+
+ПоказателиУстойчивости = namedtuple("ПоказателиУстойчивости", [
+    "Система_устойчива",           # по размаху углов (не по SyncLossCause)
+    "Размах_углов_макс",           # град
+    "Время_размаха_макс",          # с
+    "Отклонение_частоты_макс",     # Гц
+    "Генератор_частоты",           # номер строки генератора
+    "Время_восстановления_U_макс",  # с; inf - напряжение не восстановилось
+    "Узел_восстановления",         # номер строки узла
+    "Демпфирование_мин",           # относительный коэффициент демпфирования; nan - нет качаний
+    "Генератор_демпфирования",     # номер строки генератора
+])
+
+
+def размах_углов(углы):
+    """
+    Размах углов генераторов (максимум минус минимум) в каждый момент
+
+    Args:
+        углы: Матрица (генераторы, точки), град
+
+    Returns:
+        np.ndarray: (точки,)
+    """
+    return углы.max(axis=0) - углы.min(axis=0)
+
+
+def отклонение_частоты(скольжение):
+    """
+    Наибольшее отклонение частоты каждого генератора
+
+    Args:
+        скольжение: Матрица (генераторы, точки), %
+
+    Returns:
+        np.ndarray: (генераторы,), Гц
+    """
+    return np.abs(скольжение).max(axis=1) * НОМИНАЛЬНАЯ_ЧАСТОТА / 100.0
+
+
+def время_восстановления_напряжения(время, напряжения, порог=0.9, исходные=None):
+    """
+    Время от первого выхода напряжения из допустимой области до последнего
+    возвращения в нее
+
+    Args:
+        время: Вектор времени (точки,)
+        напряжения: Матрица (узлы, точки), кВ
+        порог: Допустимая доля исходного напряжения
+        исходные: Исходные напряжения (узлы,); по умолчанию - первая точка
+
+    Returns:
+        np.ndarray: (узлы,), с; 0 - напряжение не выходило из области,
+        inf - не вернулось к концу расчета
+    """
+    исходные = напряжения[:, 0] if исходные is None else np.asarray(исходные)
+    вне_области = напряжения < порог * исходные[:, np.newaxis]
+    было = вне_области.any(axis=1)
+    последняя_точка = напряжения.shape[1] - 1
+
+    первая = вне_области.argmax(axis=1)
+    последняя = последняя_точка - вне_области[:, ::-1].argmax(axis=1)
+    вернулось = последняя < последняя_точка
+
+    результат = np.zeros(len(напряжения))
+    восстановленные = было & вернулось
+    результат[восстановленные] = (
+        время[последняя[восстановленные] + 1] - время[первая[восстановленные]]
+    )
+    результат[было & ~вернулось] = np.inf
+    return результат
+
+
+def демпфирование_качаний(углы, доля_амплитуды=0.05):
+    """
+    Относительный коэффициент демпфирования качаний каждого генератора
+
+    По логарифмическому декременту между первым и последним значимым
+    максимумом отклонения угла от установившегося значения (среднее за
+    последнюю четверть расчета): δ = ln(A1 / An) / (n - 1),
+    ζ = δ / sqrt(4π² + δ²).
+
+    Args:
+        углы: Матрица (генераторы, точки), град
+        доля_амплитуды: Максимумы меньше этой доли наибольшего не учитываются
+
+    Returns:
+        np.ndarray: (генераторы,); nan - меньше двух значимых максимумов
+    """
+    число_точек = углы.shape[1]
+    отклонение = углы - углы[:, -max(число_точек // 4, 1):].mean(axis=1, keepdims=True)
+    x = отклонение[:, 1:-1]
+    максимумы = (x > отклонение[:, :-2]) & (x >= отклонение[:, 2:])
+    максимумы &= x > доля_амплитуды * np.abs(отклонение).max(axis=1, keepdims=True)
+
+    число = максимумы.sum(axis=1)
+    строки = np.arange(len(углы))
+    первый = x[строки, максимумы.argmax(axis=1)]
+    последний = x[строки, x.shape[1] - 1 - максимумы[:, ::-1].argmax(axis=1)]
+
+    результат = np.full(len(углы), np.nan)
+    есть = число >= 2
+    декремент = np.log(первый[есть] / последний[есть]) / (число[есть] - 1)
+    результат[есть] = декремент / np.sqrt(4 * math.pi ** 2 + декремент ** 2)
+    return результат
+
+
+def рассчитать_показатели(время, углы, скольжение, напряжения, порог_напряжения=0.9):
+    """
+    Показатели устойчивости одного расчета
+
+    Args:
+        время: Вектор времени (точки,)
+        углы: Углы роторов (генераторы, точки), град
+        скольжение: Скольжения (генераторы, точки), %
+        напряжения: Напряжения узлов (узлы, точки), кВ
+        порог_напряжения: Допустимая доля исходного напряжения
+
+    Returns:
+        ПоказателиУстойчивости
+    """
+    время = np.asarray(время, dtype=np.float64)
+    размах = размах_углов(углы)
+    частота = отклонение_частоты(скольжение)
+    восстановление = время_восстановления_напряжения(время, напряжения, порог_напряжения)
+    демпфирование = демпфирование_качаний(углы)
+
+    момент = int(размах.argmax())
+    есть_демпфирование = not np.isnan(демпфирование).all()
+    генератор_демпфирования = int(np.nanargmin(демпфирование)) if есть_демпфирование else -1
+    return ПоказателиУстойчивости(
+        Система_устойчива=bool(размах[момент] < ПРЕДЕЛЬНЫЙ_РАЗМАХ_УГЛОВ),
+        Размах_углов_макс=float(размах[момент]),
+        Время_размаха_макс=float(время[момент]),
+        Отклонение_частоты_макс=float(частота.max()),
+        Генератор_частоты=int(частота.argmax()),
+        Время_восстановления_U_макс=float(восстановление.max()),
+        Узел_восстановления=int(восстановление.argmax()),
+        Демпфирование_мин=float(демпфирование[генератор_демпфирования]) if есть_демпфирование else math.nan,
+        Генератор_демпфирования=генератор_демпфирования,
+    )
+
+
+def показатели_расчета(rastr, порог_напряжения=0.9):
+    """
+    Показатели последнего расчета динамики по всем генераторам и узлам
+
+    Returns:
+        ПоказателиУстойчивости
+    """
+    from пример_траектории_numpy import получить_траектории, сигналы_таблицы
+
+    генераторов = rastr.Tables.Item("Generator").Count
+    узлов = rastr.Tables.Item("node").Count
+    углы = получить_траектории(rastr, сигналы_таблицы("Generator", "Delta", range(генераторов)))
+    скольжение = получить_траектории(rastr, сигналы_таблицы("Generator", "s", range(генераторов)))
+    напряжения = получить_траектории(rastr, сигналы_таблицы("node", "vras", range(узлов)))
+    return рассчитать_показатели(углы.время, углы.значения, скольжение.значения,
+                                 напряжения.значения, порог_напряжения)
+
+
+def _показатели_циклом(время, углы, скольжение, напряжения, порог=0.9):
+    """Размах, частота и восстановление напряжения циклами по точкам - для сравнения"""
+    размах_макс = 0.0
+    for точка in range(len(время)):
+        значения = [угол[точка] for угол in углы]
+        размах_макс = max(размах_макс, max(значения) - min(значения))
+
+    частота_макс = max(
+        max(abs(s) for s in скольжение_генератора) * НОМИНАЛЬНАЯ_ЧАСТОТА / 100.0
+        for скольжение_генератора in скольжение
+    )
+
+    восстановление_макс = 0.0
+    for напряжение in напряжения:
+        вне = [номер for номер, u in enumerate(напряжение) if u < порог * напряжение[0]]
+        if not вне:
+            continue
+        if вне[-1] == len(напряжение) - 1:
+            восстановление_макс = math.inf
+        else:
+            восстановление_макс = max(восстановление_макс, время[вне[-1] + 1] - время[вне[0]])
+    return размах_макс, частота_макс, восстановление_макс
+
+
+def сравнить_с_циклами(число_генераторов=500, время_расчета=20.0):
+    """
+    Бенчмарк: показатели для всех генераторов и узлов циклами Python и
+    векторными проходами NumPy (траектории получены заранее)
+
+    Returns:
+        dict: Время каждого способа, с
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+    from пример_траектории_numpy import получить_траектории, сигналы_таблицы
+
+    rastr = ИмитаторRastr(число_узлов=число_генераторов, число_генераторов=число_генераторов,
+                          время_расчета=время_расчета)
+    rastr.FWDynamic().Run()
+    индексы = range(число_генераторов)
+    углы = получить_траектории(rastr, сигналы_таблицы("Generator", "Delta", индексы))
+    скольжение = получить_траектории(rastr, сигналы_таблицы("Generator", "s", индексы))
+    напряжения = получить_траектории(rastr, сигналы_таблицы("node", "vras", индексы))
+
+    print("\n" + "="*60)
+    print(f"ПОКАЗАТЕЛИ УСТОЙЧИВОСТИ: {число_генераторов} генераторов и узлов x "
+          f"{len(углы.время)} точек")
+    print("="*60)
+
+    сводка = {}
+    списки = (углы.время.tolist(), углы.значения.tolist(),
+              скольжение.значения.tolist(), напряжения.значения.tolist())
+    начало = time.perf_counter()
+    по_циклам = _показатели_циклом(*списки)
+    сводка["Циклы Python"] = time.perf_counter() - начало
+
+    начало = time.perf_counter()
+    показатели = рассчитать_показатели(углы.время, углы.значения, скольжение.значения,
+                                       напряжения.значения)
+    сводка["NumPy"] = time.perf_counter() - начало
+
+    assert np.allclose(по_циклам, (показатели.Размах_углов_макс, показатели.Отклонение_частоты_макс,
+                                   показатели.Время_восстановления_U_макс))
+    for способ, время in сводка.items():
+        print(f"  {способ:<14} {время * 1000:8.1f} мс")
+    print(f"  (циклы Python считают только размах, частоту и напряжение, без демпфирования)")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Показатели устойчивости по траекториям")
+    print("="*60)
+
+    rastr = ИмитаторRastr(время_расчета=10.0)
+    генераторы = rastr.Tables.Item("Generator")
+    P = генераторы.Cols("P")
+
+    for коэффициент in (1.0, 1.2, 1.1):
+        for строка in range(генераторы.Count):
+            P.SetZ(строка, P.Z(строка) * коэффициент)
+        fw = rastr.FWDynamic()
+        fw.Run()
+        показатели = показатели_расчета(rastr)
+        print(f"\nГенерация {rastr.суммарная_генерация():.0f} МВт, SyncLossCause={fw.SyncLossCause}")
+        for поле, значение in показатели._asdict().items():
+            print(f"  {поле:<28} {значение:.3f}" if isinstance(значение, float)
+                  else f"  {поле:<28} {значение}")
+
+    сравнить_с_циклами()
@@ -0,0 +1,271 @@
+"""
+ПРИМЕР: Прореживание траекторий для графиков и отчетов (LTTB и мин/макс)
+
+Траектория расчета на 20 с с шагом 0.01 с - это 2000 точек на сигнал, а на
+графике или в отчете Excel видно лишь несколько сотен. Здесь траектории
+прореживаются до заданного числа точек двумя способами:
+
+    "lttb"   - Largest-Triangle-Three-Buckets: из каждого интервала
+               берется точка, образующая наибольший треугольник с соседями;
+               форма кривой и выбросы сохраняются.
+    "минмакс" - огибающая: из каждого интервала берутся минимум и максимум,
+               поэтому максимум угла и провал напряжения сохраняются точно.
+
+Оба способа работают сразу над матрицей (сигналы x точки): цикл Python идет
+только по интервалам, а все сигналы обрабатываются одной операцией NumPy.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+
+# Прореженные траектории: у каждого сигнала свои моменты времени
+ПрореженныеТраектории = namedtuple("ПрореженныеТраектории", ["время", "значения", "сигналы"])
+
+СПОСОБЫ_ПРОРЕЖИВАНИЯ = ("lttb", "минмакс")
+
+
+def _как_матрица(значения):
+    значения = np.asarray(значения, dtype=np.float64)
+    return значения[np.newaxis] if значения.ndim == 1 else значения
+
+
+def прореживание_lttb(время, значения, число_точек):
+    """
+    Прореживание LTTB для всех сигналов сразу
+
+    Args:
+        время: Вектор времени (точки,)
+        значения: Матрица (сигналы, точки) или вектор (точки,)
+        число_точек: Сколько точек оставить (не меньше 3)
+
+    Returns:
+        tuple: (номера точек (сигналы, число_точек), время, значения) - матрицы
+
+    Raises:
+        ValueError: число_точек меньше 3
+    """
+    if число_точек < 3:
+        raise ValueError(f"LTTB оставляет не меньше 3 точек, запрошено {число_точек}")
+    время = np.asarray(время, dtype=np.float64)
+    значения = _как_матрица(значения)
+    число_сигналов, всего = значения.shape
+    if число_точек >= всего:
+        номера = np.broadcast_to(np.arange(всего), (число_сигналов, всего))
+        return номера, время[номера], значения.copy()
+
+    # Первая и последняя точки остаются, середина делится на число_точек - 2 интервала
+    шаг = (всего - 2) / (число_точек - 2)
+    границы = (np.arange(число_точек - 1) * шаг).astype(np.int64) + 1
+    границы[-1] = всего - 1
+    начала, концы = границы[:-1], границы[1:]
+
+    # Средние точки интервалов; для последнего интервала "следующий" - последняя точка
+    длины = концы - начала
+    среднее_время = np.append(np.add.reduceat(время[1:-1], начала - 1) / длины, время[-1])
+    средние_значения = np.concatenate(
+        [np.add.reduceat(значения[:, 1:-1], начала - 1, axis=1) / длины, значения[:, -1:]], axis=1
+    )
+
+    номера = np.empty((число_сигналов, число_точек), dtype=np.int64)
+    номера[:, 0] = 0
+    номера[:, -1] = всего - 1
+    строки = np.arange(число_сигналов)
+    выбранная = np.zeros(число_сигналов, dtype=np.int64)
+
+    for интервал, (начало, конец) in enumerate(zip(начала.tolist(), концы.tolist())):
+        ax = время[выбранная][:, np.newaxis]
+        ay = значения[строки, выбранная][:, np.newaxis]
+        cx = среднее_время[интервал + 1]
+        cy = средние_значения[:, интервал + 1][:, np.newaxis]
+        # Удвоенная площадь треугольника (a, точка, c) для всех точек интервала
+        площадь = np.abs(
+            (ax - cx) * (значения[:, начало:конец] - ay) - (ax - время[начало:конец]) * (cy - ay)
+        )
+        выбранная = начало + площадь.argmax(axis=1)
+        номера[:, интервал + 1] = выбранная
+
+    return номера, время[номера], np.take_along_axis(значения, номера, axis=1)
+
+
+def прореживание_минмакс(время, значения, число_точек):
+    """
+    Огибающая мин/макс для всех сигналов сразу
+
+    Точки делятся на число_точек // 2 интервалов почти равной длины (не
+    меньше двух точек), из каждого берутся первый минимум и последний
+    максимум (в порядке времени), поэтому номера точек не повторяются.
+    Глобальные экстремумы сохраняются всегда. Значения nan (например, у
+    разошедшегося расчета) в экстремумах не участвуют; из интервала без
+    конечных значений берутся его первая и последняя точки.
+
+    Args:
+        время: Вектор времени (точки,)
+        значения: Матрица (сигналы, точки) или вектор (точки,)
+        число_точек: Сколько точек оставить (четное; нечетное округляется вниз)
+
+    Returns:
+        tuple: (номера точек (сигналы, число_точек), время, значения) - матрицы
+    """
+    время = np.asarray(время, dtype=np.float64)
+    значения = _как_матрица(значения)
+    число_сигналов, всего = значения.shape
+    интервалов = число_точек // 2
+    if число_точек >= всего or интервалов < 1:
+        номера = np.broadcast_to(np.arange(всего), (число_сигналов, всего))
+        return номера, время[номера], значения.copy()
+
+    # Равномерные границы без дополнения: в каждом интервале есть точки
+    начала = np.linspace(0, всего, интервалов + 1).astype(np.int64)[:-1]
+    длины = np.diff(np.append(начала, всего))
+    минимумы = np.fmin.reduceat(значения, начала, axis=1)
+    максимумы = np.fmax.reduceat(значения, начала, axis=1)
+
+    # Номер первого минимума и последнего максимума в каждом интервале
+    позиции = np.arange(всего)
+    первый_минимум = np.minimum.reduceat(
+        np.where(значения == np.repeat(минимумы, длины, axis=1), позиции, всего), начала, axis=1
+    )
+    последний_максимум = np.maximum.reduceat(
+        np.where(значения == np.repeat(максимумы, длины, axis=1), позиции, -1), начала, axis=1
+    )
+    # Интервал только из nan: его первая и последняя точки
+    концы = начала + длины - 1
+    первый_минимум = np.where(первый_минимум == всего, начала, первый_минимум)
+    последний_максимум = np.where(последний_максимум == -1, концы, последний_максимум)
+    # Единственное конечное значение в интервале: вторая точка - край интервала
+    совпали = первый_минимум == последний_максимум
+    последний_максимум = np.where(
+        совпали, np.where(первый_минимум != начала, начала, концы), последний_максимум
+    )
+
+    номера = np.sort(np.stack([первый_минимум, последний_максимум], axis=2), axis=2)
+    номера = номера.reshape(число_сигналов, -1)
+    return номера, время[номера], np.take_along_axis(значения, номера, axis=1)
+
+
+def проредить(траектории, число_точек=500, способ="lttb"):
+    """
+    Прореживание результата получить_траектории
+
+    Args:
+        траектории: Траектории (время, значения, сигналы)
+        число_точек: Сколько точек оставить на сигнал
+        способ: "lttb" или "минмакс"
+
+    Returns:
+        ПрореженныеТраектории: время и значения - матрицы (сигналы, число_точек)
+    """
+    if способ == "lttb":
+        функция = прореживание_lttb
+    elif способ == "минмакс":
+        функция = прореживание_минмакс
+    else:
+        raise ValueError(f"Неизвестный способ прореживания: {способ} (есть {СПОСОБЫ_ПРОРЕЖИВАНИЯ})")
+    _, время, значения = функция(траектории.время, траектории.значения, число_точек)
+    return ПрореженныеТраектории(время, значения, траектории.сигналы)
+
+
+def _lttb_по_точкам(время, значения, число_точек):
+    """LTTB одного сигнала циклом по точкам - для проверки и сравнения"""
+    всего = len(значения)
+    шаг = (всего - 2) / (число_точек - 2)
+    выбранные = [0]
+    a = 0
+    for интервал in range(число_точек - 2):
+        начало = int(интервал * шаг) + 1
+        конец = int((интервал + 1) * шаг) + 1 if интервал < число_точек - 3 else всего - 1
+        if интервал < число_точек - 3:
+            следующий_конец = int((интервал + 2) * шаг) + 1 if интервал < число_точек - 4 else всего - 1
+            cx = sum(время[конец:следующий_конец]) / (следующий_конец - конец)
+            cy = sum(значения[конец:следующий_конец]) / (следующий_конец - конец)
+        else:
+            cx, cy = время[-1], значения[-1]
+        лучшая, наибольшая = начало, -1.0
+        for точка in range(начало, конец):
+            площадь = abs((время[a] - cx) * (значения[точка] - значения[a])
+                          - (время[a] - время[точка]) * (cy - значения[a]))
+            if площадь > наибольшая:
+                лучшая, наибольшая = точка, площадь
+        выбранные.append(лучшая)
+        a = лучшая
+    выбранные.append(всего - 1)
+    return выбранные
+
+
+def сравнить_с_циклом_по_точкам(число_сигналов=500, время_расчета=20.0, число_точек=500):
+    """
+    Бенчмарк: прореживание углов всех генераторов циклом по точкам и
+    векторно (LTTB и мин/макс)
+
+    Returns:
+        dict: Время каждого способа, с
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+    from пример_траектории_numpy import получить_траектории, сигналы_таблицы
+
+    rastr = ИмитаторRastr(число_узлов=число_сигналов, число_генераторов=число_сигналов,
+                          время_расчета=время_расчета)
+    rastr.FWDynamic().Run()
+    траектории = получить_траектории(rastr, сигналы_таблицы("Generator", "Delta", range(число_сигналов)))
+    всего = траектории.значения.shape[1]
+
+    print("\n" + "="*60)
+    print(f"ПРОРЕЖИВАНИЕ: {число_сигналов} сигналов x {всего} точек -> {число_точек} точек")
+    print("="*60)
+
+    время_список = траектории.время.tolist()
+    значения_списки = траектории.значения.tolist()
+
+    сводка = {}
+    начало = time.perf_counter()
+    по_точкам = [_lttb_по_точкам(время_список, значения, число_точек) for значения in значения_списки]
+    сводка["LTTB циклом по точкам"] = time.perf_counter() - начало
+
+    начало = time.perf_counter()
+    номера, _, _ = прореживание_lttb(траектории.время, траектории.значения, число_точек)
+    сводка["LTTB векторно"] = time.perf_counter() - начало
+    assert np.array_equal(номера, np.array(по_точкам))
+
+    начало = time.perf_counter()
+    _, _, огибающая = прореживание_минмакс(траектории.время, траектории.значения, число_точек)
+    сводка["Мин/макс векторно"] = time.perf_counter() - начало
+    assert np.array_equal(огибающая.max(axis=1), траектории.значения.max(axis=1))
+    assert np.array_equal(огибающая.min(axis=1), траектории.значения.min(axis=1))
+
+    for способ, время in сводка.items():
+        print(f"  {способ:<24} {время * 1000:8.1f} мс")
+    print(f"  Точек в отчете: {траектории.значения.size} -> {номера.size} "
+          f"({траектории.значения.size / номера.size:.0f}x меньше)")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+    from пример_траектории_numpy import получить_траектории, сигналы_таблицы
+
+    print("="*60)
+    print("ПРИМЕР: Прореживание траекторий")
+    print("="*60)
+
+    rastr = ИмитаторRastr(время_расчета=20.0)
+    rastr.FWDynamic().Run()
+    узлы = получить_траектории(rastr, сигналы_таблицы("node", "vras", range(5)))
+
+    for способ in СПОСОБЫ_ПРОРЕЖИВАНИЯ:
+        прореженные = проредить(узлы, число_точек=100, способ=способ)
+        print(f"\n{способ}: {узлы.значения.shape[1]} -> {прореженные.значения.shape[1]} точек")
+        for номер, (_, _, индекс) in enumerate(узлы.сигналы[:3]):
+            print(f"  Узел {индекс}: провал U {узлы.значения[номер].min():.1f} кВ, "
+                  f"после прореживания {прореженные.значения[номер].min():.1f} кВ")
+
+    try:
+        from пример_запись_результатов import записать_траектории
+
+        записать_траектории("траектории.xlsx", проредить(узлы, 200, "минмакс"))
+    except ImportError:
+        print("\n⚠️ openpyxl не установлен: запись в Excel пропущена")
+
+    сравнить_с_циклом_по_точкам()
@@ -0,0 +1,584 @@
+"""
+ПРИМЕР: Пул изолированных расчетных процессов
+
+Один объект Dispatch("Astra.Rastr") однопоточный, поэтому одна машина
+считает только один режим за раз. Пул запускает N процессов, у каждого
+свой экземпляр RasterWin (или локальный имитатор на Linux), раздает
+сценарии свободным процессам, проверяет их "пингом" и перезапускает
+процесс после M заданий или при росте памяти выше порога.
+
+Вызовы rgm и Run могут зависнуть на "патологической" схеме. С заданным
+таймаутом_вызова рабочий сообщает пулу о начале каждого такого вызова,
+а пул убивает процесс, превысивший время, запускает замену с заново
+загруженной моделью и отмечает сценарий как "таймаут". Запуск процесса
+(подключение и загрузка модели) в таймаут_вызова не входит: отсчет
+начинается, когда рабочий сообщит о готовности; для запуска есть свой
+таймаут_запуска.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Предельное время запуска рабочего процесса по умолчанию (подключение и
+# загрузка модели), с: зависшая загрузка не должна останавливать пул
+ТАЙМАУТ_ЗАПУСКА = 300.0
+
+
+def текущий_rss_мб():
+    """
+    Возвращает объем памяти текущего процесса (RSS), МБ
+
+    Использует psutil, если он установлен, иначе /proc/self/statm (Linux).
+    Если ни то ни другое недоступно - возвращает 0.0.
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / 2**20
+    try:
+        with open("/proc/self/statm") as файл:
+            страниц = int(файл.read().split()[1])
+        return страниц * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return 0.0
+
+
+def создать_расчетный_объект(использовать_имитатор=None, параметры_имитатора=None):
+    """
+    Создает расчетный объект: настоящий RasterWin или локальный имитатор
+
+    Args:
+        использовать_имитатор: True - всегда имитатор, False - только COM,
+            None - COM, если доступен, иначе имитатор
+        параметры_имитатора: Параметры для ИмитаторRastr (задержки и т.п.)
+
+    Returns:
+        Объект с API Astra.Rastr или None, если подключиться не удалось
+    """
+    if not использовать_имитатор and sys.platform == "win32":
+        from пример_стратегии_подключения import ПодключениеRastrWin
+
+        # Способ подключения, сработавший на этом компьютере, пробуется первым
+        rastr = ПодключениеRastrWin().подключиться()
+        if rastr is not None or использовать_имитатор is False:
+            return rastr
+    elif использовать_имитатор is False:
+        # Запрошен только COM, а его нет вне Windows - имитатор не подставляется
+        return None
+
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    return ИмитаторRastr(**(параметры_имитатора or {}))
+
+
+def рассчитать_сценарий(rastr, сценарий):
+    """
+    Расчет одного сценария в рабочем процессе
+
+    Сценарий задает коэффициент загрузки генераторов. Загрузка файла,
+    установка мощности, rgm и FWDynamic - как в реальных проектах.
+
+    Args:
+        rastr: Расчетный объект рабочего процесса
+        сценарий: {"Коэффициент_загрузки": 1.1, ...}
+
+    Returns:
+        dict: Результат в формате извлечь_результат_динамики
+    """
+    rastr.Load(0, сценарий.get("Файл", ""), сценарий.get("Шаблон", ""))
+
+    P = rastr.Tables.Item("Generator").Cols.Item("P")
+    for строка in range(rastr.Tables.Item("Generator").Count):
+        P.SetZ(строка, P.Z(строка) * сценарий["Коэффициент_загрузки"])
+
+    if rastr.rgm("p") != 0:
+        return {"Система_устойчива": False, "Причина_потери_синхронизма": -1,
+                "Время_достигнутое": 0.0, "Сообщение": "Режим не сбалансирован"}
+
+    fw_dynamic = rastr.FWDynamic()
+    fw_dynamic.Run()
+    return {
+        "Система_устойчива": fw_dynamic.SyncLossCause == 0,
+        "Причина_потери_синхронизма": fw_dynamic.SyncLossCause,
+        "Время_достигнутое": fw_dynamic.TimeReached,
+        "Сообщение": fw_dynamic.ResultMessage or "",
+    }
+
+
+class _ДинамикаПодНаблюдением:
+    """Объект FWDynamic, сообщающий пулу о начале Run/RunEMSmode"""
+
+    def __init__(self, fw_dynamic, канал):
+        self._fw_dynamic = fw_dynamic
+        self._канал = канал
+
+    def Run(self):
+        self._канал.send(("вызов", "Run"))
+        return self._fw_dynamic.Run()
+
+    def RunEMSmode(self):
+        self._канал.send(("вызов", "RunEMSmode"))
+        return self._fw_dynamic.RunEMSmode()
+
+    def __getattr__(self, имя):
+        return getattr(self._fw_dynamic, имя)
+
+
+class _RastrПодНаблюдением:
+    """Объект RasterWin, сообщающий пулу о начале rgm и расчета динамики"""
+
+    def __init__(self, rastr, канал):
+        self._rastr = rastr
+        self._канал = канал
+
+    def rgm(self, параметры=""):
+        self._канал.send(("вызов", "rgm"))
+        return self._rastr.rgm(параметры)
+
+    def FWDynamic(self):
+        return _ДинамикаПодНаблюдением(self._rastr.FWDynamic(), self._канал)
+
+    def __getattr__(self, имя):
+        return getattr(self._rastr, имя)
+
+
+def _рабочий_процесс(канал, функция_сценария, использовать_имитатор, параметры_имитатора,
+                     под_наблюдением=False, файл_модели=None, шаблон=""):
+    """
+    Цикл рабочего процесса: подключение и обработка сообщений из канала
+
+    Сообщения: ("задание", номер, сценарий), ("пинг",), ("стоп",)
+    Ответы: ("готов",) - после подключения и загрузки модели,
+            ("результат", номер, результат, rss), ("ошибка", номер, текст, rss),
+            ("понг", rss), ("не_подключен", текст),
+            ("вызов", имя_метода) - под наблюдением, перед rgm/Run
+    """
+    rastr = создать_расчетный_объект(использовать_имитатор, параметры_имитатора)
+    if rastr is None:
+        канал.send(("не_подключен", "Не удалось создать расчетный объект"))
+        return
+    if файл_модели is not None:
+        rastr.Load(0, файл_модели, шаблон)
+    канал.send(("готов",))
+    if под_наблюдением:
+        rastr = _RastrПодНаблюдением(rastr, канал)
+
+    while True:
+        try:
+            сообщение = канал.recv()
+        except EOFError:
+            return
+
+        if сообщение[0] == "стоп":
+            return
+        if сообщение[0] == "пинг":
+            канал.send(("понг", текущий_rss_мб()))
+            continue
+
+        _, номер, сценарий = сообщение
+        try:
+            результат = функция_сценария(rastr, сценарий)
+            канал.send(("результат", номер, результат, текущий_rss_мб()))
+        except Exception as e:
+            канал.send(("ошибка", номер, f"{type(e).__name__}: {e}", текущий_rss_мб()))
+
+
+class _Рабочий:
+    """Запущенный рабочий процесс и его счетчики"""
+
+    def __init__(self, процесс, канал):
+        self.процесс = процесс
+        self.канал = канал
+        self.готов = False  # Подключился и загрузил модель
+        self.выполнено_заданий = 0
+        self.rss_мб = 0.0
+        self.текущее_задание = None  # (номер, сценарий, попытка)
+        self.срок = None  # Время (time.monotonic), до которого должен прийти ответ
+        self.текущий_вызов = None  # Что выполняется сейчас: "rgm", "Run" и т.п.
+
+
+class ПулРасчетныхПроцессов:
+    """
+    Пул процессов, у каждого из которых свой экземпляр RasterWin
+
+    Пример:
+        with ПулРасчетныхПроцессов(8, рассчитать_сценарий) as пул:
+            результаты = пул.выполнить(сценарии)
+            print(пул.статистика())
+    """
+
+    def __init__(self, число_процессов, функция_сценария=рассчитать_сценарий,
+                 заданий_до_перезапуска=200, предел_rss_мб=None,
+                 использовать_имитатор=None, параметры_имитатора=None,
+                 таймаут_вызова=None, файл_модели=None, шаблон="",
+                 таймаут_запуска=ТАЙМАУТ_ЗАПУСКА):
+        """
+        Args:
+            число_процессов: Количество рабочих процессов
+            функция_сценария: Функция(rastr, сценарий) -> результат;
+                должна быть объявлена на уровне модуля (передается в процесс)
+            заданий_до_перезапуска: После стольких заданий процесс перезапускается
+            предел_rss_мб: Перезапуск процесса при превышении памяти, МБ
+            использовать_имитатор: См. создать_расчетный_объект
+            параметры_имитатора: Параметры для ИмитаторRastr
+            таймаут_вызова: Предельное время одного вызова rgm/Run (и участков
+                сценария между ними), с; None - без ограничения. Отсчитывается
+                после того, как процесс сообщил о готовности
+            файл_модели: Модель, загружаемая при запуске каждого процесса
+            шаблон: Шаблон RasterWin для файла_модели
+            таймаут_запуска: Предельное время запуска процесса (подключение
+                и загрузка файла_модели), с; None - без ограничения (зависшая
+                при запуске загрузка тогда останавливает пул)
+        """
+        self.число_процессов = число_процессов
+        self.функция_сценария = функция_сценария
+        self.заданий_до_перезапуска = заданий_до_перезапуска
+        self.предел_rss_мб = предел_rss_мб
+        self.использовать_имитатор = использовать_имитатор
+        self.параметры_имитатора = параметры_имитатора
+        self.таймаут_вызова = таймаут_вызова
+        self.файл_модели = файл_модели
+        self.шаблон = шаблон
+        self.таймаут_запуска = таймаут_запуска
+
+        # spawn - единственный способ, совместимый с COM на Windows
+        self._контекст = multiprocessing.get_context("spawn")
+        self._рабочие = []
+        self._обертки_готовы = False
+        self.перезапусков = 0
+        self.выполнено_заданий = 0
+        self.таймаутов = 0
+
+    def запустить(self):
+        """
+        Запускает все рабочие процессы
+
+        На Windows перед первым запуском один раз создаются обертки типов
+        EnsureDispatch, чтобы рабочие не создавали их каждый при подключении.
+        """
+        if not self._обертки_готовы and not self.использовать_имитатор and sys.platform == "win32":
+            from пример_стратегии_подключения import подготовить_обертки_типов
+
+            подготовить_обертки_типов()
+            self._обертки_готовы = True
+        while len(self._рабочие) < self.число_процессов:
+            self._рабочие.append(self._новый_рабочий())
+
+    def _новый_рабочий(self):
+        канал_пула, канал_рабочего = self._контекст.Pipe()
+        процесс = self._контекст.Process(
+            target=_рабочий_процесс,
+            args=(канал_рабочего, self.функция_сценария,
+                  self.использовать_имитатор, self.параметры_имитатора,
+                  self.таймаут_вызова is not None, self.файл_модели, self.шаблон),
+            daemon=True,
+        )
+        процесс.start()
+        канал_рабочего.close()
+        return _Рабочий(процесс, канал_пула)
+
+    def _остановить_рабочего(self, рабочий, принудительно=False):
+        if not принудительно:
+            try:
+                рабочий.канал.send(("стоп",))
+                рабочий.процесс.join(timeout=5.0)
+            except (OSError, BrokenPipeError):
+                pass
+        if рабочий.процесс.is_alive():
+            рабочий.процесс.kill()
+            рабочий.процесс.join()
+        рабочий.канал.close()
+
+    def _перезапустить(self, рабочий, принудительно=False):
+        """Заменяет рабочего новым процессом"""
+        self._остановить_рабочего(рабочий, принудительно)
+        новый = self._новый_рабочий()
+        self._рабочие[self._рабочие.index(рабочий)] = новый
+        self.перезапусков += 1
+        return новый
+
+    def _нужен_перезапуск(self, рабочий):
+        if рабочий.выполнено_заданий >= self.заданий_до_перезапуска:
+            return True
+        return self.предел_rss_мб is not None and рабочий.rss_мб > self.предел_rss_мб
+
+    def _продлить_срок(self, рабочий, вызов):
+        рабочий.текущий_вызов = вызов
+        if self.таймаут_вызова is not None:
+            рабочий.срок = time.monotonic() + self.таймаут_вызова
+
+    def _начать_отсчет(self, рабочий):
+        """Срок для нового задания: от готовности процесса, до нее - таймаут_запуска"""
+        if рабочий.готов:
+            self._продлить_срок(рабочий, "подготовка сценария")
+            return
+        рабочий.текущий_вызов = "запуск процесса"
+        if self.таймаут_запуска is not None:
+            рабочий.срок = time.monotonic() + self.таймаут_запуска
+
+    @staticmethod
+    def _до_ближайшего_срока(рабочие):
+        """Сколько ждать ответов до ближайшего срока (None - без ограничения)"""
+        сроки = [рабочий.срок for рабочий in рабочие if рабочий.срок is not None]
+        if not сроки:
+            return None
+        return max(0.0, min(сроки) - time.monotonic())
+
+    def выполнить(self, сценарии, повторов_при_сбое=1):
+        """
+        Выполняет сценарии на свободных процессах
+
+        Если рабочий процесс аварийно завершился, его сценарий отдается
+        новому процессу (не больше повторов_при_сбое раз). Сценарий, вызов
+        которого превысил таймаут_вызова, не повторяется: процесс
+        заменяется, а результат - {"Ошибка": текст, "Таймаут": True}.
+
+        Args:
+            сценарии: Список сценариев
+            повторов_при_сбое: Сколько раз повторять сценарий после падения процесса
+
+        Returns:
+            list: Результаты в порядке сценариев. Для сценариев с ошибкой -
+                {"Ошибка": текст}
+        """
+        self.запустить()
+        результаты = [None] * len(сценарии)
+        очередь = [(номер, сценарий, 0) for номер, сценарий in enumerate(сценарии)]
+        очередь.reverse()  # pop() берет с конца - сохраняем порядок
+        свободные = list(self._рабочие)
+        занятые = {}
+
+        while очередь or занятые:
+            while очередь and свободные:
+                рабочий = свободные.pop()
+                рабочий.текущее_задание = очередь.pop()
+                номер, сценарий, _ = рабочий.текущее_задание
+                рабочий.канал.send(("задание", номер, сценарий))
+                self._начать_отсчет(рабочий)
+                занятые[рабочий.канал] = рабочий
+
+            готовые = wait(list(занятые), timeout=self._до_ближайшего_срока(занятые.values()))
+            for канал in готовые:
+                рабочий = занятые[канал]
+                try:
+                    ответ = канал.recv()
+                except (EOFError, OSError):
+                    ответ = ("сбой",)
+
+                if ответ[0] == "готов":
+                    # Процесс запустился - отсчет таймаута задания только теперь
+                    рабочий.готов = True
+                    self._начать_отсчет(рабочий)
+                    continue
+                if ответ[0] == "вызов":
+                    # Рабочий начал rgm/Run - отсчет таймаута заново
+                    self._продлить_срок(рабочий, ответ[1])
+                    continue
+
+                del занятые[канал]
+                номер, сценарий, попытка = рабочий.текущее_задание
+                рабочий.текущее_задание = None
+                рабочий.срок = None
+
+                if ответ[0] in ("результат", "ошибка"):
+                    _, _, значение, рабочий.rss_мб = ответ
+                    результаты[номер] = значение if ответ[0] == "результат" else {"Ошибка": значение}
+                    рабочий.выполнено_заданий += 1
+                    self.выполнено_заданий += 1
+                    if self._нужен_перезапуск(рабочий):
+                        рабочий = self._перезапустить(рабочий)
+                else:
+                    # Процесс упал или не подключился к RasterWin
+                    if попытка < повторов_при_сбое:
+                        очередь.append((номер, сценарий, попытка + 1))
+                    else:
+                        результаты[номер] = {"Ошибка": f"Рабочий процесс завершился: {ответ}"}
+                    рабочий = self._перезапустить(рабочий, принудительно=True)
+
+                свободные.append(рабочий)
+
+            сейчас = time.monotonic()
+            for канал, рабочий in list(занятые.items()):
+                if канал in готовые or рабочий.срок is None or сейчас < рабочий.срок:
+                    continue
+                # Вызов завис: процесс убивается, сценарий отмечается таймаутом
+                del занятые[канал]
+                номер = рабочий.текущее_задание[0]
+                результаты[номер] = {
+                    "Ошибка": f"Превышено время "
+                              f"({self.таймаут_вызова if рабочий.готов else self.таймаут_запуска} с): "
+                              f"{рабочий.текущий_вызов}",
+                    "Таймаут": True,
+                }
+                self.таймаутов += 1
+                свободные.append(self._перезапустить(рабочий, принудительно=True))
+
+        return результаты
+
+    def проверить_здоровье(self, таймаут=5.0):
+        """
+        Пингует все процессы и перезапускает не ответившие за таймаут
+
+        Вызывается между пакетами заданий (когда все процессы свободны).
+        Процессу, еще не сообщившему о готовности, дается не меньше
+        таймаута_запуска.
+
+        Returns:
+            dict: {pid: "ok" | "перезапущен"}
+        """
+        self.запустить()
+        состояние = {}
+        for рабочий in list(self._рабочие):
+            pid = рабочий.процесс.pid
+            try:
+                рабочий.канал.send(("пинг",))
+                ответ = None
+                ожидание = таймаут if рабочий.готов else max(таймаут, self.таймаут_запуска or 0.0)
+                while рабочий.канал.poll(ожидание):
+                    ответ = рабочий.канал.recv()
+                    if ответ[0] != "готов":
+                        break
+                    рабочий.готов = True
+                    ожидание = таймаут
+                if ответ is not None:
+                    if ответ[0] == "понг":
+                        рабочий.rss_мб = ответ[1]
+                        if self._нужен_перезапуск(рабочий):
+                            self._перезапустить(рабочий)
+                            состояние[pid] = "перезапущен"
+                        else:
+                            состояние[pid] = "ok"
+                        continue
+            except (EOFError, OSError):
+                pass
+            self._перезапустить(рабочий, принудительно=True)
+            состояние[pid] = "перезапущен"
+        return состояние
+
+    def статистика(self):
+        """
+        Returns:
+            dict: Число процессов, выполненных заданий, перезапусков и память
+        """
+        return {
+            "Процессов": len(self._рабочие),
+            "Выполнено_заданий": self.выполнено_заданий,
+            "Перезапусков": self.перезапусков,
+            "Таймаутов": self.таймаутов,
+            "RSS_МБ": [round(рабочий.rss_мб, 1) for рабочий in self._рабочие],
+        }
+
+    def остановить(self):
+        """Останавливает все рабочие процессы"""
+        for рабочий in self._рабочие:
+            self._остановить_рабочего(рабочий)
+        self._рабочие = []
+
+    def __enter__(self):
+        self.запустить()
+        return self
+
+    def __exit__(self, *исключение):
+        self.остановить()
+
+
+def измерить_масштабирование(числа_процессов=(1, 2, 4, 8), число_сценариев=64,
+                              параметры_имитатора=None):
+    """
+    Бенчмарк: пропускная способность пула в зависимости от числа процессов
+
+    Расчет выполняется на имитаторе с задержками rgm и Run, поэтому
+    результат показывает накладные расходы самого пула.
+
+    Args:
+        числа_процессов: Количества процессов для сравнения
+        число_сценариев: Сколько сценариев считать в каждом замере
+        параметры_имитатора: Параметры ИмитаторRastr (по умолчанию
+            rgm - 20 мс, Run - 80 мс)
+
+    Returns:
+        dict: Число процессов -> сценариев в секунду
+    """
+    if параметры_имитатора is None:
+        параметры_имитатора = {"задержки": {"rgm": 0.02, "Run": 0.08}}
+
+    сценарии = [{"Коэффициент_загрузки": 1.0 + 0.005 * номер} for номер in range(число_сценариев)]
+
+    print("\n" + "="*60)
+    print(f"МАСШТАБИРОВАНИЕ ПУЛА ({число_сценариев} сценариев, ядер: {os.cpu_count()})")
+    print("="*60)
+
+    сводка = {}
+    for число in числа_процессов:
+        with ПулРасчетныхПроцессов(число, использовать_имитатор=True,
+                                   параметры_имитатора=параметры_имитатора) as пул:
+            пул.проверить_здоровье()  # Дожидаемся запуска всех процессов
+            начало = time.perf_counter()
+            пул.выполнить(сценарии)
+            время = time.perf_counter() - начало
+
+        сводка[число] = число_сценариев / время
+        print(f"  Процессов: {число:3d}  время: {время:6.2f} с  "
+              f"сценариев/с: {сводка[число]:6.1f}  "
+              f"ускорение: {сводка[число] / сводка[числа_процессов[0]]:.1f}x")
+
+    return сводка
+
+
+def пример_с_зависаниями(таймаут_вызова=1.0):
+    """
+    Пакет сценариев, часть которых "зависает" в rgm на имитаторе
+
+    Имитатор зависает, если генерация больше предела устойчивости, то есть
+    при коэффициенте загрузки больше 1.25. Пакет должен дойти до конца, а
+    такие сценарии - получить отметку "Таймаут".
+
+    Returns:
+        list: Результаты сценариев
+    """
+    print("\n" + "="*60)
+    print(f"ЗАВИСАЮЩИЕ РАСЧЕТЫ: таймаут вызова {таймаут_вызова} с")
+    print("="*60)
+
+    сценарии = [{"Коэффициент_загрузки": 1.0 + 0.05 * номер} for номер in range(10)]
+    параметры_имитатора = {"задержки": {"rgm": 0.02, "Run": 0.08}, "зависание_при_загрузке": 1.0}
+
+    начало = time.perf_counter()
+    with ПулРасчетныхПроцессов(4, использовать_имитатор=True, параметры_имитатора=параметры_имитатора,
+                               таймаут_вызова=таймаут_вызова, файл_модели="base.rst") as пул:
+        результаты = пул.выполнить(сценарии)
+        статистика = пул.статистика()
+
+    for сценарий, результат in zip(сценарии, результаты):
+        отметка = "⏱" if результат.get("Таймаут") else "✅"
+        print(f"  {отметка} загрузка x{сценарий['Коэффициент_загрузки']:.2f}: "
+              f"{результат.get('Ошибка') or результат['Сообщение']}")
+    print(f"\n  Пакет выполнен за {time.perf_counter() - начало:.1f} с, статистика: {статистика}")
+    return результаты
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: Пул изолированных расчетных процессов")
+    print("="*60)
+
+    сценарии = [{"Коэффициент_загрузки": 1.0 + 0.05 * номер} for номер in range(10)]
+
+    with ПулРасчетныхПроцессов(4, заданий_до_перезапуска=3, использовать_имитатор=True) as пул:
+        print(f"\nЗдоровье: {пул.проверить_здоровье()}")
+        результаты = пул.выполнить(сценарии)
+        for сценарий, результат in zip(сценарии, результаты):
+            отметка = "✅" if результат.get("Система_устойчива") else "❌"
+            print(f"  {отметка} загрузка x{сценарий['Коэффициент_загрузки']:.2f}: {результат}")
+        print(f"\nСтатистика: {пул.статистика()}")
+
+    пример_с_зависаниями()
+    измерить_масштабирование()
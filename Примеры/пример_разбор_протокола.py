@@ -0,0 +1,245 @@
+"""
+ПРИМЕР: Потоковый разбор протокола RasterWin за один проход
+
+извлечь_напряжение_из_протокола ищет одну величину (Uкз) через `in` и
+index() и вызывается для каждого сообщения. Здесь из строки извлекаются
+все поля - тип события, время, узел, Uкз и Iкз - заранее
+скомпилированными выражениями, а результат - типизированные записи
+(namedtuple), выдаваемые потоком.
+
+Порядок полей в сообщении не важен, перед событием может быть любой
+префикс ("Предупреждение: ..."): каждое поле ищется отдельно (search), и
+только в строках с известным событием. Выигрыш - в разборе всех полей
+одним способом, а не в скорости: на синтетическом протоколе поиск
+подстрок (разобрать_строку_подстроками) не медленнее выражений.
+"""
+
+import random
+import re
+import time
+from collections import namedtuple
+
+ЗаписьПротокола = namedtuple(
+    "ЗаписьПротокола", ["номер_строки", "событие", "время", "узел", "Uкз", "Iкз", "текст"]
+)
+
+# Начало сообщения (после необязательного "t=0.120 с: ") -> тип события
+ТИПЫ_СОБЫТИЙ = {
+    "Величина остаточного напряжения": "КЗ",
+    "Отключение": "Отключение",
+    "Включение": "Включение",
+    "Выявлено превышение": "Потеря синхронизма",
+    "Итерация": "Итерация",
+}
+
+_ЧИСЛО = r"(-?\d+(?:[.,]\d+)?)"
+
+# Каждое поле - отдельное выражение: поля могут идти в любом порядке.
+# Строка без известного события отсекается первым поиском.
+_СОБЫТИЕ = re.compile("|".join(map(re.escape, ТИПЫ_СОБЫТИЙ)))
+_ВРЕМЯ = re.compile(rf"t={_ЧИСЛО} с")
+_УЗЕЛ = re.compile(r"узл[еау] (\d+)")
+_U_КЗ = re.compile(rf"Uкз={_ЧИСЛО} кВ")
+_I_КЗ = re.compile(rf"Iкз={_ЧИСЛО} кА")
+
+
+def _поле(выражение, метка, строка):
+    """Первое число поля или None; метка - быстрая проверка `in` перед поиском"""
+    if метка not in строка:
+        return None
+    совпадение = выражение.search(строка)
+    return совпадение and совпадение.group(1)
+
+
+def _число(текст):
+    """Число из протокола: десятичный разделитель - точка или запятая"""
+    try:
+        return float(текст)
+    except ValueError:
+        return float(текст.replace(",", "."))
+
+
+def разобрать_строку(строка, номер_строки=0):
+    """
+    Разбирает одну строку протокола
+
+    Args:
+        строка: Строка протокола
+        номер_строки: Номер строки (для записи)
+
+    Returns:
+        ЗаписьПротокола или None, если в строке нет известного события
+    """
+    событие = _СОБЫТИЕ.search(строка)
+    if событие is None:
+        return None
+    время = _поле(_ВРЕМЯ, "t=", строка)
+    узел = _поле(_УЗЕЛ, "узл", строка)
+    u_кз = _поле(_U_КЗ, "Uкз=", строка)
+    i_кз = _поле(_I_КЗ, "Iкз=", строка)
+    return ЗаписьПротокола(
+        номер_строки,
+        ТИПЫ_СОБЫТИЙ[событие.group()],
+        время and _число(время),
+        узел and int(узел),
+        u_кз and _число(u_кз),
+        i_кз and _число(i_кз),
+        строка,
+    )
+
+
+def разобрать_протокол(строки, события=None):
+    """
+    Потоковый разбор протокола: строки читаются по одной, записи выдаются сразу
+
+    Args:
+        строки: Любой итерируемый объект строк (файл, список, OnLog и т.п.)
+        события: Какие типы событий выдавать (None - все)
+
+    Yields:
+        ЗаписьПротокола
+    """
+    события = set(события) if события is not None else None
+    for номер_строки, строка in enumerate(строки):
+        запись = разобрать_строку(строка, номер_строки)
+        if запись is not None and (события is None or запись.событие in события):
+            yield запись
+
+
+def _поле_подстрокой(строка, метка, окончание):
+    """Поле как в извлечь_напряжение_из_протокола: `in`, index() и срез"""
+    if метка not in строка:
+        return None
+    начало = строка.index(метка) + len(метка)
+    конец = строка.find(окончание, начало)
+    if конец == -1:
+        return None
+    try:
+        return _число(строка[начало:конец])
+    except ValueError:
+        return None
+
+
+def разобрать_строку_подстроками(строка, номер_строки=0):
+    """
+    Тот же разбор отдельным поиском подстрок для каждого поля
+    (подход извлечь_напряжение_из_протокола) - для сравнения
+    """
+    событие = None
+    for фраза, тип in ТИПЫ_СОБЫТИЙ.items():
+        if фраза in строка:
+            событие = тип
+            break
+    if событие is None:
+        return None
+
+    узел = None
+    if "узле " in строка:
+        начало = конец = строка.index("узле ") + 5
+        while конец < len(строка) and строка[конец].isdigit():
+            конец += 1
+        узел = int(строка[начало:конец]) if конец > начало else None
+
+    return ЗаписьПротокола(
+        номер_строки, событие, _поле_подстрокой(строка, "t=", " с"), узел,
+        _поле_подстрокой(строка, "Uкз=", " кВ"), _поле_подстрокой(строка, "Iкз=", " кА"), строка,
+    )
+
+
+def синтетический_протокол(число_строк, seed=0):
+    """
+    Генерирует условный протокол расчета динамики
+
+    Returns:
+        list: Строки протокола
+    """
+    случайные = random.Random(seed)
+    шаблоны = (
+        lambda t: f"t={t:.3f} с: Величина остаточного напряжения в узле {случайные.randint(1, 9999)} "
+                  f"(Uкз={случайные.uniform(50, 500):.1f} кВ, Iкз={случайные.uniform(0.1, 30):.2f} кА)",
+        lambda t: f"t={t:.3f} с: Отключение ветви {случайные.randint(1, 9999)}-{случайные.randint(1, 9999)}",
+        lambda t: f"t={t:.3f} с: Включение выключателя в узле {случайные.randint(1, 9999)}",
+        # Поля в другом порядке и сообщение с префиксом
+        lambda t: f"t={t:.3f} с: Величина остаточного напряжения (Iкз={случайные.uniform(0.1, 30):.2f} кА, "
+                  f"Uкз={случайные.uniform(50, 500):.1f} кВ) в узле {случайные.randint(1, 9999)}",
+        lambda t: f"  Предупреждение: Величина остаточного напряжения "
+                  f"Uкз={случайные.uniform(1, 20):.1f} кВ",
+        lambda t: f"Итерация {случайные.randint(1, 50)} завершена",
+        lambda t: f"t={t:.3f} с: Шаг интегрирования уменьшен до 0.001 с",
+        lambda t: f"t={t:.3f} с: Выявлено превышение угла по ветви значения 180°",
+    )
+    веса = (25, 10, 5, 3, 2, 40, 14, 1)
+    return [
+        случайные.choices(шаблоны, веса)[0](номер * 0.001)
+        for номер in range(число_строк)
+    ]
+
+
+def сравнить_с_поиском_подстрок(число_строк=500_000):
+    """
+    Бенчмарк на синтетическом протоколе: только Uкз через
+    извлечь_напряжение_из_протокола, все поля поиском подстрок и все поля
+    одним выражением
+
+    Returns:
+        dict: Строк в минуту для каждого способа
+    """
+    from пример_чтение_протокола import извлечь_напряжение_из_протокола
+
+    строки = синтетический_протокол(число_строк)
+
+    print("\n" + "="*60)
+    print(f"РАЗБОР ПРОТОКОЛА: {число_строк} строк")
+    print("="*60)
+
+    способы = {
+        "Только Uкз (in + index)": lambda: [
+            u for u in map(извлечь_напряжение_из_протокола, строки) if u is not None
+        ],
+        "Все поля, поиск подстрок": lambda: [
+            запись for запись in map(разобрать_строку_подстроками, строки, range(число_строк))
+            if запись is not None
+        ],
+        "Все поля, выражения": lambda: list(разобрать_протокол(строки)),
+    }
+
+    сводка = {}
+    результаты = {}
+    for способ, функция in способы.items():
+        начало = time.perf_counter()
+        результаты[способ] = функция()
+        сводка[способ] = число_строк / (time.perf_counter() - начало) * 60
+        print(f"  {способ:<26} {сводка[способ] / 1e6:6.1f} млн строк/мин")
+
+    assert результаты["Все поля, поиск подстрок"] == результаты["Все поля, выражения"]
+    записи = результаты["Все поля, выражения"]
+    print(f"\n  Записей: {len(записи)}, из них КЗ: {sum(1 for з in записи if з.событие == 'КЗ')}")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: Потоковый разбор протокола")
+    print("="*60)
+
+    протокол = [
+        "Расчет начат",
+        "t=0.120 с: Величина остаточного напряжения в узле 123 (Uкз=220,5 кВ, Iкз=1.2 кА)",
+        "Итерация 2 завершена",
+        "t=0.200 с: Отключение ветви 12-13",
+        "t=1.480 с: Выявлено превышение угла по ветви значения 180°",
+        # Поля в другом порядке и префикс перед событием
+        "t=0.130 с: Величина остаточного напряжения (Uкз=1 кВ) в узле 5",
+        "t=0.140 с: Величина остаточного напряжения в узле 7 (Iкз=1.2 кА, Uкз=220.5 кВ)",
+        "   Предупреждение: Величина остаточного напряжения в узле 9 Uкз=2 кВ",
+    ]
+    for запись in разобрать_протокол(протокол):
+        print(f"  [{запись.номер_строки}] {запись.событие:<18} t={запись.время} "
+              f"узел={запись.узел} Uкз={запись.Uкз} Iкз={запись.Iкз}")
+
+    print("\nТолько КЗ:")
+    for запись in разобрать_протокол(протокол, события=("КЗ",)):
+        print(f"  Узел {запись.узел}: Uкз={запись.Uкз} кВ")
+
+    сравнить_с_поиском_подстрок()
@@ -0,0 +1,226 @@
+"""
+ПРИМЕР: Снимок модели в памяти вместо повторной загрузки .rst
+
+При переборе возмущений базовый режим загружается с диска перед каждым
+сценарием (NewFile(shabl) + Load(0, путь, shabl)) только для того, чтобы
+отменить изменения предыдущего сценария. На больших схемах загрузка
+занимает секунды и это самая большая постоянная часть времени сценария.
+
+Снимок запоминает колонки таблиц после первой загрузки. Чтобы отменить
+сценарий, колонки читаются массово, сравниваются со снимком в NumPy и
+записываются обратно только измененные ячейки. Полная загрузка нужна
+только если изменилась структура таблиц (добавлены или удалены строки) -
+в снимке или в любой таблице, от которой зависит расчет режима.
+"""
+
+import time
+
+import numpy as np
+
+from пример_массовое_чтение_таблиц import ЧтениеТаблиц
+
+# Таблицы, от которых зависит rgm: добавленная или удаленная строка в любой
+# из них требует полной загрузки, даже если ее колонок нет в снимке
+ТАБЛИЦЫ_РАСЧЕТА = ("node", "vetv", "Generator")
+
+
+class СнимокМодели:
+    """
+    Снимок выбранных колонок таблиц RasterWin и восстановление по разнице
+
+    В снимок должны входить все колонки, которые меняют сценарии (например,
+    P генераторов и sta ветвей). Колонки вне снимка не восстанавливаются.
+    Результаты расчета (vras, delta) включать не нужно: их пересчитает
+    следующий rgm, а запись их обратно стоит по SetZ на каждый узел.
+    Число строк запоминается для таблиц снимка и для ТАБЛИЦЫ_РАСЧЕТА
+    (и дополнительных таблиц_структуры).
+
+    Пример:
+        снимок = СнимокМодели(rastr, путь, шаблон, {"Generator": ["P"], "vetv": ["sta"]})
+        снимок.загрузить()
+        for возмущение in возмущения:
+            применить(rastr, возмущение)
+            rastr.rgm("p")
+            снимок.восстановить()
+    """
+
+    def __init__(self, rastr, путь, шаблон, колонки_таблиц, таблицы_структуры=ТАБЛИЦЫ_РАСЧЕТА):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+            путь: Путь к файлу базового режима
+            шаблон: Путь к шаблону RasterWin
+            колонки_таблиц: {таблица: [колонки]}, которые запоминаются в снимке
+            таблицы_структуры: Таблицы, изменение числа строк в которых
+                требует полной загрузки (кроме таблиц снимка)
+        """
+        self.rastr = rastr
+        self.путь = путь
+        self.шаблон = шаблон
+        self.колонки_таблиц = {таблица: list(колонки) for таблица, колонки in колонки_таблиц.items()}
+        self.таблицы_структуры = list(dict.fromkeys([*таблицы_структуры, *self.колонки_таблиц]))
+        self.чтение = ЧтениеТаблиц(rastr)
+
+        self._снимок = {}  # таблица -> {колонка: np.ndarray}
+        self._число_строк = {}
+
+        self.загрузок = 0
+        self.восстановлений = 0
+        self.записано_ячеек = 0
+
+    def загрузить(self):
+        """Загружает базовый режим с диска и запоминает снимок"""
+        self.rastr.NewFile(self.шаблон)
+        self.rastr.Load(0, self.путь, self.шаблон)
+        self.чтение.сбросить_кэш()
+        self.загрузок += 1
+        self.захватить()
+
+    def захватить(self):
+        """Запоминает текущие значения колонок как базовые"""
+        self._снимок.clear()
+        self._число_строк.clear()
+        for таблица, колонки in self.колонки_таблиц.items():
+            данные = self.чтение.прочитать_колонки(таблица, колонки)
+            self._снимок[таблица] = {колонка: np.asarray(данные[колонка]) for колонка in колонки}
+        for таблица in self.таблицы_структуры:
+            self._число_строк[таблица] = self.чтение.таблица(таблица).Count
+
+    def _структура_изменилась(self):
+        return any(
+            self.чтение.таблица(таблица).Count != число_строк
+            for таблица, число_строк in self._число_строк.items()
+        )
+
+    def восстановить(self):
+        """
+        Возвращает модель к снимку
+
+        Returns:
+            dict: {"Способ": "Снимок" или "Загрузка", "Записано_ячеек": int}
+        """
+        if not self._снимок:
+            raise RuntimeError("Снимок не создан: сначала вызовите загрузить()")
+
+        if self._структура_изменилась():
+            self.загрузить()
+            return {"Способ": "Загрузка", "Записано_ячеек": 0}
+
+        записано = 0
+        for таблица, колонки in self.колонки_таблиц.items():
+            текущие = self.чтение.прочитать_колонки(таблица, колонки)
+            for колонка in колонки:
+                исходные = self._снимок[таблица][колонка]
+                измененные = np.flatnonzero(np.asarray(текущие[колонка]) != исходные)
+                if измененные.size == 0:
+                    continue
+                объект_колонки = self.чтение.колонка(таблица, колонка)
+                for строка, значение in zip(измененные.tolist(), исходные[измененные].tolist()):
+                    объект_колонки.SetZ(строка, значение)
+                записано += измененные.size
+
+        self.восстановлений += 1
+        self.записано_ячеек += записано
+        return {"Способ": "Снимок", "Записано_ячеек": записано}
+
+    def статистика(self):
+        """
+        Returns:
+            dict: Число загрузок с диска, восстановлений по снимку и записанных ячеек
+        """
+        return {
+            "Загрузок": self.загрузок,
+            "Восстановлений": self.восстановлений,
+            "Записано_ячеек": self.записано_ячеек,
+        }
+
+
+def применить_возмущение(rastr, номер):
+    """Сценарий: отключение ветви и снижение мощности одного генератора"""
+    ветви = rastr.Tables.Item("vetv")
+    ветви.Cols("sta").SetZ(номер % ветви.Count, 1)
+
+    генераторы = rastr.Tables.Item("Generator")
+    P = генераторы.Cols("P")
+    строка = номер % генераторы.Count
+    P.SetZ(строка, P.Z(строка) * 0.9)
+
+
+def сравнить_с_перезагрузкой(число_сценариев=20, число_узлов=2_000, время_загрузки=0.2,
+                             задержка_вызова=20e-6):
+    """
+    Бенчмарк: перебор возмущений с загрузкой с диска перед каждым сценарием
+    и с восстановлением по снимку
+
+    Args:
+        число_сценариев: Количество возмущений
+        число_узлов: Размер схемы
+        время_загрузки: Стоимость Load, с (на больших схемах - секунды)
+        задержка_вызова: Стоимость остальных COM-вызовов, с
+
+    Returns:
+        dict: Время и число загрузок для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    колонки_таблиц = {"Generator": ["P"], "vetv": ["sta"]}
+
+    print("\n" + "="*60)
+    print(f"ПЕРЕБОР ВОЗМУЩЕНИЙ: {число_сценариев} сценариев, {число_узлов} узлов, "
+          f"Load = {время_загрузки} с")
+    print("="*60)
+
+    сводка = {}
+    for способ in ("Загрузка каждый раз", "Снимок"):
+        rastr = ИмитаторRastr(число_узлов=число_узлов, число_генераторов=50,
+                              задержка_вызова=задержка_вызова,
+                              задержки={"Load": время_загрузки})
+        снимок = СнимокМодели(rastr, "base.rst", "шаблон.rg2", колонки_таблиц)
+
+        начало = time.perf_counter()
+        снимок.загрузить()
+        for номер in range(число_сценариев):
+            применить_возмущение(rastr, номер)
+            rastr.rgm("p")
+            if способ == "Загрузка каждый раз":
+                снимок.загрузить()
+            else:
+                снимок.восстановить()
+        время = time.perf_counter() - начало
+
+        сводка[способ] = {"Время": время, "Load": rastr.счетчики_вызовов["Load"]}
+        print(f"  {способ:<20} время: {время:6.2f} с   Load: {rastr.счетчики_вызовов['Load']:3d}   "
+              f"SetZ: {rastr.счетчики_вызовов['SetZ']:5d}")
+
+    print(f"\n  Ускорение: {сводка['Загрузка каждый раз']['Время'] / сводка['Снимок']['Время']:.1f}x")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Снимок модели вместо повторной загрузки")
+    print("="*60)
+
+    rastr = ИмитаторRastr(число_узлов=30)
+    снимок = СнимокМодели(rastr, "base.rst", "шаблон.rg2",
+                          {"Generator": ["P"], "vetv": ["sta"]})
+    снимок.загрузить()
+
+    применить_возмущение(rastr, 3)
+    rastr.rgm("p")
+    print(f"\nПосле сценария генерация: {rastr.суммарная_генерация():.1f} МВт")
+    print(f"Восстановление: {снимок.восстановить()}")
+    print(f"После восстановления генерация: {rastr.суммарная_генерация():.1f} МВт")
+
+    # Добавление строки меняет структуру - нужна полная загрузка, в том числе
+    # для таблицы, колонок которой нет в снимке
+    rastr.Tables.Item("Generator").AddRow()
+    print(f"Восстановление после AddRow в Generator: {снимок.восстановить()}")
+    rastr.Tables.Item("node").AddRow()
+    print(f"Восстановление после AddRow в node: {снимок.восстановить()}")
+    print(f"Статистика: {снимок.статистика()}")
+
+    сравнить_с_перезагрузкой()
@@ -0,0 +1,271 @@
+"""
+ПРИМЕР: Кэш способа подключения к RasterWin и заранее созданные обертки типов
+
+подключиться_к_rastrwin при каждом запуске пробует ProgID, затем GUID, а
+в реальных проектах еще и gencache.EnsureDispatch. Каждая неудачная
+попытка стоит таймаута и исключения. Когда запускается 32 рабочих
+процесса, время подключения напрямую увеличивает время всего пакета.
+
+Здесь способ, сработавший на этом компьютере, запоминается в JSON и
+пробуется первым. Обертки типов для EnsureDispatch создаются один раз
+заранее (в основном процессе), а рабочие процессы их переиспользуют.
+Диспетчер подставляется, поэтому логику выбора можно проверить на Linux.
+"""
+
+import json
+import os
+import socket
+import tempfile
+import time
+
+GUID_RASTRWIN = "{EFC5E4AD-A3DD-11D3-B73F-00500454CF3F}"
+PROGID_RASTRWIN = "Astra.Rastr"
+
+# Способы подключения в исходном порядке
+СПОСОБЫ_ПОДКЛЮЧЕНИЯ = ("ProgID", "GUID", "EnsureDispatch")
+
+ПУТЬ_КЭША_ПО_УМОЛЧАНИЮ = os.path.join(tempfile.gettempdir(), "rastrwin_подключение.json")
+
+
+class ДиспетчерWin32:
+    """Настоящий диспетчер COM: win32com импортируется при первом вызове"""
+
+    def Dispatch(self, имя):
+        import win32com.client
+
+        return win32com.client.Dispatch(имя)
+
+    def EnsureDispatch(self, имя):
+        from win32com.client import gencache
+
+        return gencache.EnsureDispatch(имя)
+
+
+class ИмитаторДиспетчера:
+    """
+    Диспетчер для проверки на Linux: часть способов "не работает" и
+    отказывает после задержки, остальные возвращают ИмитаторRastr
+
+    Пример:
+        диспетчер = ИмитаторДиспетчера(работающие=("GUID",), задержка_отказа=0.5)
+    """
+
+    def __init__(self, работающие=("EnsureDispatch",), задержка_отказа=0.5,
+                 задержка_подключения=0.05, задержка_оберток=1.0, параметры_имитатора=None):
+        """
+        Args:
+            работающие: Способы из СПОСОБЫ_ПОДКЛЮЧЕНИЯ, которые сработают
+            задержка_отказа: Время до исключения неудачной попытки, с
+            задержка_подключения: Время удачного подключения, с
+            задержка_оберток: Время первого создания оберток EnsureDispatch, с
+            параметры_имитатора: Параметры для ИмитаторRastr
+        """
+        self.работающие = set(работающие)
+        self.задержка_отказа = задержка_отказа
+        self.задержка_подключения = задержка_подключения
+        self.задержка_оберток = задержка_оберток
+        self.параметры_имитатора = параметры_имитатора or {}
+        self.обертки_созданы = False
+        self.вызовов = 0
+
+    def _подключиться(self, способ):
+        from пример_имитатор_RastrWin import ИмитаторRastr, ОшибкаИмитатора
+
+        self.вызовов += 1
+        if способ not in self.работающие:
+            time.sleep(self.задержка_отказа)
+            raise ОшибкаИмитатора(f"Класс не зарегистрирован ({способ})")
+        time.sleep(self.задержка_подключения)
+        return ИмитаторRastr(**self.параметры_имитатора)
+
+    def Dispatch(self, имя):
+        return self._подключиться("GUID" if имя == GUID_RASTRWIN else "ProgID")
+
+    def EnsureDispatch(self, имя):
+        if not self.обертки_созданы and "EnsureDispatch" in self.работающие:
+            time.sleep(self.задержка_оберток)
+            self.обертки_созданы = True
+        return self._подключиться("EnsureDispatch")
+
+
+class ПодключениеRastrWin:
+    """
+    Подключение к RasterWin с запоминанием удачного способа для компьютера
+
+    Пример:
+        подключение = ПодключениеRastrWin()
+        rastr = подключение.подключиться()
+        print(подключение.отчет)  # Способ, попытки и время до готового объекта
+    """
+
+    def __init__(self, путь_кэша=ПУТЬ_КЭША_ПО_УМОЛЧАНИЮ, диспетчер=None, имя_компьютера=None):
+        """
+        Args:
+            путь_кэша: JSON-файл {компьютер: способ}; None - не запоминать
+            диспетчер: Объект с Dispatch и EnsureDispatch (по умолчанию ДиспетчерWin32)
+            имя_компьютера: Ключ в кэше (по умолчанию socket.gethostname())
+        """
+        self.путь_кэша = путь_кэша
+        self.диспетчер = диспетчер if диспетчер is not None else ДиспетчерWin32()
+        self.имя_компьютера = имя_компьютера or socket.gethostname()
+        self.отчет = None
+
+    def _прочитать_кэш(self):
+        if not self.путь_кэша or not os.path.exists(self.путь_кэша):
+            return {}
+        try:
+            with open(self.путь_кэша, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _записать_кэш(self, способ):
+        if not self.путь_кэша:
+            return
+        кэш = self._прочитать_кэш()
+        if кэш.get(self.имя_компьютера) == способ:
+            return
+        кэш[self.имя_компьютера] = способ
+        # Запись через временный файл: параллельные процессы не увидят половину JSON
+        временный = f"{self.путь_кэша}.{os.getpid()}.tmp"
+        with open(временный, "w", encoding="utf-8") as f:
+            json.dump(кэш, f, ensure_ascii=False, indent=2)
+        os.replace(временный, self.путь_кэша)
+
+    def порядок(self):
+        """Способы подключения: сначала запомненный для этого компьютера"""
+        запомненный = self._прочитать_кэш().get(self.имя_компьютера)
+        if запомненный not in СПОСОБЫ_ПОДКЛЮЧЕНИЯ:
+            return list(СПОСОБЫ_ПОДКЛЮЧЕНИЯ)
+        return [запомненный] + [способ for способ in СПОСОБЫ_ПОДКЛЮЧЕНИЯ if способ != запомненный]
+
+    def _создать(self, способ):
+        if способ == "ProgID":
+            return self.диспетчер.Dispatch(PROGID_RASTRWIN)
+        if способ == "GUID":
+            return self.диспетчер.Dispatch(GUID_RASTRWIN)
+        return self.диспетчер.EnsureDispatch(PROGID_RASTRWIN)
+
+    def подключиться(self):
+        """
+        Подключается первым сработавшим способом
+
+        Объект считается готовым, когда отвечает rastr.Tables.Count.
+
+        Returns:
+            Объект RasterWin или None, если ни один способ не сработал
+        """
+        начало = time.perf_counter()
+        попытки = []
+        rastr = None
+
+        for способ in self.порядок():
+            начало_попытки = time.perf_counter()
+            try:
+                кандидат = self._создать(способ)
+                кандидат.Tables.Count  # Первый вызов: объект действительно работает
+            except Exception as e:
+                попытки.append({"Способ": способ, "Успех": False,
+                                "Время": time.perf_counter() - начало_попытки, "Ошибка": str(e)})
+                continue
+            попытки.append({"Способ": способ, "Успех": True,
+                            "Время": time.perf_counter() - начало_попытки})
+            rastr = кандидат
+            self._записать_кэш(способ)
+            break
+
+        self.отчет = {
+            "Способ": попытки[-1]["Способ"] if rastr is not None else None,
+            "Время_до_объекта": time.perf_counter() - начало,
+            "Попытки": попытки,
+        }
+        return rastr
+
+
+def подготовить_обертки_типов(диспетчер=None):
+    """
+    Создает обертки типов EnsureDispatch (каталог gen_py) заранее
+
+    Вызывается один раз в основном процессе до запуска рабочих, чтобы
+    каждый рабочий не создавал обертки заново при первом подключении.
+
+    Returns:
+        float: Время подготовки, с (None - EnsureDispatch не сработал)
+    """
+    диспетчер = диспетчер if диспетчер is not None else ДиспетчерWin32()
+    начало = time.perf_counter()
+    try:
+        диспетчер.EnsureDispatch(PROGID_RASTRWIN)
+    except Exception as e:
+        print(f"⚠️ Не удалось создать обертки типов: {e}")
+        return None
+    return time.perf_counter() - начало
+
+
+def сравнить_запуск_рабочих(число_рабочих=8, задержка_отказа=0.5):
+    """
+    Бенчмарк: время подключения рабочих без кэша способа и с кэшем
+
+    На "компьютере" работает только EnsureDispatch, поэтому без кэша каждый
+    рабочий сначала получает два отказа (ProgID и GUID).
+
+    Args:
+        число_рабочих: Сколько процессов подключается
+        задержка_отказа: Стоимость одной неудачной попытки, с
+
+    Returns:
+        dict: Суммарное время подключения для каждого способа
+    """
+    print("\n" + "="*60)
+    print(f"ПОДКЛЮЧЕНИЕ {число_рабочих} РАБОЧИХ: отказ попытки {задержка_отказа} с")
+    print("="*60)
+
+    путь_кэша = os.path.join(tempfile.gettempdir(), f"подключение_бенчмарк_{os.getpid()}.json")
+    сводка = {}
+    try:
+        for способ, с_кэшем in (("Без кэша", False), ("Кэш + обертки", True)):
+            if os.path.exists(путь_кэша):
+                os.remove(путь_кэша)
+            диспетчер = ИмитаторДиспетчера(работающие=("EnsureDispatch",),
+                                           задержка_отказа=задержка_отказа)
+            if с_кэшем:
+                print(f"  Подготовка оберток: {подготовить_обертки_типов(диспетчер):.2f} с")
+
+            время = 0.0
+            for _ in range(число_рабочих):
+                подключение = ПодключениеRastrWin(путь_кэша if с_кэшем else None, диспетчер)
+                подключение.подключиться()
+                время += подключение.отчет["Время_до_объекта"]
+
+            сводка[способ] = время
+            print(f"  {способ:<14} суммарно: {время:5.2f} с   "
+                  f"на рабочего: {время / число_рабочих:5.2f} с")
+    finally:
+        if os.path.exists(путь_кэша):
+            os.remove(путь_кэша)
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    print("="*60)
+    print("ПРИМЕР: Кэш способа подключения к RasterWin")
+    print("="*60)
+
+    путь_кэша = os.path.join(tempfile.gettempdir(), "rastrwin_подключение_пример.json")
+    if os.path.exists(путь_кэша):
+        os.remove(путь_кэша)
+
+    диспетчер = ИмитаторДиспетчера(работающие=("GUID",), задержка_отказа=0.3)
+    for запуск in range(1, 3):
+        подключение = ПодключениеRastrWin(путь_кэша, диспетчер, имя_компьютера="расчетный-сервер")
+        rastr = подключение.подключиться()
+        print(f"\nЗапуск {запуск}: способ {подключение.отчет['Способ']}, "
+              f"время до объекта {подключение.отчет['Время_до_объекта']:.2f} с")
+        for попытка in подключение.отчет["Попытки"]:
+            отметка = "✅" if попытка["Успех"] else "❌"
+            print(f"  {отметка} {попытка['Способ']}: {попытка['Время']:.2f} с")
+    os.remove(путь_кэша)
+
+    сравнить_запуск_рабочих()
@@ -0,0 +1,296 @@
+"""
+ПРИМЕР: Расчет режима с теплого старта
+
+В поиске предела на каждом шаге нагрузки вызывается rgm("p") - расчет с
+плоского старта, хотя предыдущий шаг сошелся в близкой точке. Если
+запускать rgm("") от последних сошедшихся напряжений и углов, методу
+Ньютона нужно заметно меньше итераций. Теплый старт используется только
+для малых шагов (генерация изменилась не больше чем на макс_шаг); после
+большого шага и при расхождении выполняется расчет с плоского старта.
+"""
+
+import time
+
+import numpy as np
+
+from пример_массовое_чтение_таблиц import ЧтениеТаблиц
+
+ТЕПЛЫЙ_СТАРТ = "Теплый старт"
+ПЛОСКИЙ_СТАРТ = "Плоский старт"
+БОЛЬШОЙ_ШАГ = "Плоский старт после большого шага"
+ОТКАТ = "Плоский старт после расхождения"
+СТРАТЕГИИ = (ТЕПЛЫЙ_СТАРТ, ПЛОСКИЙ_СТАРТ, БОЛЬШОЙ_ШАГ, ОТКАТ)
+
+# Наибольшее относительное изменение суммарной генерации от сошедшегося
+# режима, при котором выполняется теплый старт
+МАКС_ШАГ = 0.1
+
+
+def итерации_имитатора(rastr):
+    """
+    Число итераций последнего rgm (атрибут имитатора)
+
+    У RasterWin такого атрибута нет - функция возвращает None, и в
+    статистике итерации будут None ("нет данных"). Для RasterWin нужно
+    передать свою функцию_итераций (например, разбор протокола расчета).
+    """
+    return getattr(rastr, "число_итераций", None)
+
+
+class РасчетРежимаСТеплымСтартом:
+    """
+    Запуск rgm от последних сошедшихся vras/delta с откатом на плоский старт
+
+    Пример:
+        расчет = РасчетРежимаСТеплымСтартом(rastr)
+        расчет.Load(0, путь, шаблон)     # Сбрасывает кэш объектов таблиц
+        расчет.начать_поиск("Возмущение 1")
+        for нагрузка in шаги:
+            изменить_нагрузку(rastr, нагрузка)
+            if расчет.rgm() != 0:
+                break
+        print(расчет.статистика())
+
+    Объекты таблиц и колонок кэшируются в ЧтениеТаблиц и после Load/NewFile
+    становятся недействительными: загружать режим нужно через Load/NewFile
+    этого класса, а при загрузке напрямую через rastr - вызывать
+    начать_поиск() сразу после нее.
+    """
+
+    def __init__(self, rastr, функция_итераций=итерации_имитатора, макс_шаг=МАКС_ШАГ):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+            функция_итераций: Функция rastr -> число итераций последнего rgm
+                (например, чтение из протокола расчета); None или функция,
+                вернувшая None, - число итераций неизвестно, и в статистике
+                итерации - None, а не 0
+            макс_шаг: Наибольшее относительное изменение суммарной генерации
+                от сошедшегося режима для теплого старта
+        """
+        self.rastr = rastr
+        self.чтение = ЧтениеТаблиц(rastr)
+        self.функция_итераций = функция_итераций
+        self.макс_шаг = макс_шаг
+
+        self._сошедшийся = None  # {"vras": np.ndarray, "delta": np.ndarray}
+        self._генерация = None  # Суммарная генерация сошедшегося режима
+        self.поиск = None
+        self.журнал = {}  # поиск -> список шагов
+
+    def Load(self, *аргументы):
+        """rastr.Load со сбросом кэша объектов и сошедшегося режима"""
+        self._сошедшийся = None
+        return self.чтение.Load(*аргументы)
+
+    def NewFile(self, *аргументы):
+        """rastr.NewFile со сбросом кэша объектов и сошедшегося режима"""
+        self._сошедшийся = None
+        return self.чтение.NewFile(*аргументы)
+
+    def начать_поиск(self, имя=None):
+        """
+        Начинает новый поиск: сошедшийся режим другого поиска не используется
+
+        Кэш объектов таблиц тоже сбрасывается: перед новым поиском режим
+        обычно загружается заново.
+
+        Args:
+            имя: Название поиска для статистики (по умолчанию - номер)
+        """
+        self._сошедшийся = None
+        self.чтение.сбросить_кэш()
+        self.поиск = имя if имя is not None else f"Поиск {len(self.журнал) + 1}"
+        self.журнал.setdefault(self.поиск, [])
+
+    def _вернуть_сошедшийся(self):
+        """Записывает сохраненные vras/delta в те узлы, где значения отличаются"""
+        текущие = self.чтение.прочитать_колонки("node", ["vras", "delta"])
+        for колонка, сохраненные in self._сошедшийся.items():
+            if len(текущие[колонка]) != len(сохраненные):
+                # Изменился состав узлов - теплый старт невозможен
+                self._сошедшийся = None
+                return False
+            измененные = np.flatnonzero(np.asarray(текущие[колонка]) != сохраненные)
+            объект_колонки = self.чтение.колонка("node", колонка)
+            for строка, значение in zip(измененные.tolist(), сохраненные[измененные].tolist()):
+                объект_колонки.SetZ(строка, значение)
+        return True
+
+    def _суммарная_генерация(self):
+        return float(np.sum(self.чтение.прочитать_колонки("Generator", ["P"])["P"]))
+
+    def _малый_шаг(self):
+        """Генерация изменилась от сошедшегося режима не больше чем на макс_шаг"""
+        изменение = abs(self._суммарная_генерация() - self._генерация)
+        return изменение <= self.макс_шаг * max(abs(self._генерация), 1e-9)
+
+    def _запомнить_сошедшийся(self):
+        данные = self.чтение.прочитать_колонки("node", ["vras", "delta"])
+        self._сошедшийся = {колонка: np.asarray(значения) for колонка, значения in данные.items()}
+        self._генерация = self._суммарная_генерация()
+
+    def _итерации(self, итераций):
+        """Прибавляет итерации последнего rgm; None, если число неизвестно"""
+        последний = self.функция_итераций(self.rastr) if self.функция_итераций else None
+        if итераций is None or последний is None:
+            return None
+        return итераций + последний
+
+    def rgm(self):
+        """
+        Расчет режима: теплый старт после малого шага, иначе и при
+        расхождении - плоский
+
+        Returns:
+            int: 0 - режим сбалансирован, иначе код rgm (как rastr.rgm)
+        """
+        if self.поиск is None:
+            self.начать_поиск()
+
+        итераций = 0
+        начало = time.perf_counter()
+        if self._сошедшийся is None:
+            стратегия = ПЛОСКИЙ_СТАРТ
+        elif not self._малый_шаг():
+            стратегия = БОЛЬШОЙ_ШАГ
+        elif not self._вернуть_сошедшийся():
+            стратегия = ПЛОСКИЙ_СТАРТ
+        else:
+            стратегия = ТЕПЛЫЙ_СТАРТ
+
+        if стратегия == ТЕПЛЫЙ_СТАРТ:
+            kod = self.rastr.rgm("")
+            итераций = self._итерации(итераций)
+            if kod != 0:
+                kod = self.rastr.rgm("p")
+                итераций = self._итерации(итераций)
+                стратегия = ОТКАТ
+        else:
+            kod = self.rastr.rgm("p")
+            итераций = self._итерации(итераций)
+
+        if kod == 0:
+            self._запомнить_сошедшийся()
+
+        self.журнал[self.поиск].append({
+            "Стратегия": стратегия,
+            "Код": kod,
+            "Итераций": итераций,
+            "Время": time.perf_counter() - начало,
+        })
+        return kod
+
+    def статистика(self):
+        """
+        Returns:
+            dict: {поиск: {"Шагов", "Итераций", "Итераций_на_шаг", "Время", стратегия: число шагов}};
+                "Итераций" и "Итераций_на_шаг" - None, если число итераций
+                хотя бы одного шага неизвестно (RasterWin без функции_итераций)
+        """
+        сводка = {}
+        for поиск, шаги in self.журнал.items():
+            if any(шаг["Итераций"] is None for шаг in шаги):
+                итераций = на_шаг = None
+            else:
+                итераций = sum(шаг["Итераций"] for шаг in шаги)
+                на_шаг = round(итераций / len(шаги), 2) if шаги else 0.0
+            сводка[поиск] = {
+                "Шагов": len(шаги),
+                "Итераций": итераций,
+                "Итераций_на_шаг": на_шаг,
+                "Время": round(sum(шаг["Время"] for шаг in шаги), 3),
+            }
+            for стратегия in СТРАТЕГИИ:
+                сводка[поиск][стратегия] = sum(1 for шаг in шаги if шаг["Стратегия"] == стратегия)
+        return сводка
+
+
+def утяжелить_генерацию(rastr, коэффициент):
+    """Умножает мощность всех генераторов на коэффициент"""
+    генераторы = rastr.Tables.Item("Generator")
+    P = генераторы.Cols("P")
+    for строка in range(генераторы.Count):
+        P.SetZ(строка, P.Z(строка) * коэффициент)
+
+
+def сравнить_с_плоским_стартом(число_поисков=3, шаг=0.02, время_итерации=0.005):
+    """
+    Бенчмарк: поиск предела по режиму (утяжеление до расхождения rgm)
+    с плоским стартом на каждом шаге и с теплым стартом
+
+    Args:
+        число_поисков: Количество поисков (возмущений)
+        шаг: Относительное утяжеление на каждом шаге
+        время_итерации: Стоимость одной итерации rgm, с
+
+    Returns:
+        dict: Итерации и время для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("\n" + "="*60)
+    print(f"УТЯЖЕЛЕНИЕ ДО ПРЕДЕЛА: {число_поисков} поисков, шаг {шаг:.0%}")
+    print("="*60)
+
+    сводка = {}
+    for способ in ("Плоский старт", "Теплый старт"):
+        rastr = ИмитаторRastr(число_узлов=200, время_итерации=время_итерации)
+        расчет = РасчетРежимаСТеплымСтартом(rastr)
+        итераций = шагов = 0
+
+        начало = time.perf_counter()
+        for номер in range(1, число_поисков + 1):
+            расчет.Load(0, "base.rst", "")
+            расчет.начать_поиск(f"Возмущение {номер}")
+            while True:
+                утяжелить_генерацию(rastr, 1 + шаг)
+                if способ == "Плоский старт":
+                    kod = rastr.rgm("p")
+                    итераций += rastr.число_итераций
+                    шагов += 1
+                else:
+                    kod = расчет.rgm()
+                if kod != 0:
+                    break
+        время = time.perf_counter() - начало
+
+        if способ == "Теплый старт":
+            статистика = расчет.статистика()
+            итераций = sum(поиск["Итераций"] for поиск in статистика.values())
+            шагов = sum(поиск["Шагов"] for поиск in статистика.values())
+            for поиск, данные in статистика.items():
+                print(f"  {поиск}: {данные}")
+
+        сводка[способ] = {"Итераций": итераций, "Шагов": шагов, "Время": время}
+        print(f"  {способ:<14} шагов: {шагов:3d}   итераций: {итераций:4d} "
+              f"({итераций / шагов:.1f} на шаг)   время: {время:5.2f} с")
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Расчет режима с теплого старта")
+    print("="*60)
+
+    rastr = ИмитаторRastr()
+    расчет = РасчетРежимаСТеплымСтартом(rastr)
+    расчет.начать_поиск("Пример")
+
+    for коэффициент in (1.0, 1.02, 1.02, 1.3):
+        утяжелить_генерацию(rastr, коэффициент)
+        kod = расчет.rgm()
+        шаг = расчет.журнал["Пример"][-1]
+        print(f"  Генерация {rastr.суммарная_генерация():6.1f} МВт: код {kod}, "
+              f"{шаг['Стратегия']}, итераций {шаг['Итераций']}")
+
+    # Без источника числа итераций (как у RasterWin) статистика не выдумывает нули
+    без_итераций = РасчетРежимаСТеплымСтартом(rastr, функция_итераций=None)
+    без_итераций.rgm()
+    print(f"  Без функции_итераций: {без_итераций.статистика()}")
+
+    сравнить_с_плоским_стартом()
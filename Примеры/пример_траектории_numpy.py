@@ -0,0 +1,230 @@
+"""
+ПРИМЕР: Траектории расчета динамики в массивах NumPy
+
+получить_точки_графика превращает результат GetChainedGraphSnapshot в
+список кортежей (время, значение) по одной точке. Расчет на 20 с с шагом
+0.01 с для сотен сигналов - это миллионы кортежей. Здесь точки всех
+сигналов за один проход копируются в один буфер float64 (np.fromiter), а
+результат - общий вектор времени и непрерывная матрица значений
+(сигналы x точки), с которой сразу работают векторные операции NumPy.
+"""
+
+import time
+import tracemalloc
+from collections import namedtuple
+from itertools import chain
+
+import numpy as np
+
+Траектории = namedtuple("Траектории", ["время", "значения", "сигналы"])
+
+
+def сигналы_таблицы(таблица, колонка, индексы):
+    """
+    Список сигналов одной колонки для нескольких строк
+
+    Returns:
+        list: [(таблица, колонка, индекс), ...]
+    """
+    return [(таблица, колонка, int(индекс)) for индекс in индексы]
+
+
+def точки_графика_массивом(rastr, таблица, колонка, индекс):
+    """
+    Точки одного графика в виде массивов (аналог получить_точки_графика)
+
+    Args:
+        rastr: Объект RasterWin
+        таблица: Название таблицы (например, "node")
+        колонка: Название колонки (например, "vras")
+        индекс: Индекс строки
+
+    Returns:
+        tuple: (время, значения) - непрерывные массивы float64
+    """
+    траектории = получить_траектории(rastr, [(таблица, колонка, индекс)])
+    return траектории.время, траектории.значения[0]
+
+
+def _точки_снимка(снимок):
+    """
+    Точки одного снимка -> массив (точки, 2): (значение, время)
+
+    Как в получить_точки_графика: точки короче двух полей пропускаются,
+    поля после второго отбрасываются.
+    """
+    if isinstance(снимок, np.ndarray) and снимок.ndim == 2 and снимок.shape[1] >= 2:
+        return np.asarray(снимок[:, :2], dtype=np.float64)
+    return np.array(
+        [(точка[0], точка[1]) for точка in снимок if len(точка) >= 2], dtype=np.float64
+    ).reshape(-1, 2)
+
+
+def _в_массив(снимки):
+    """
+    Точки (значение, время, ...) всех снимков -> массив (сигналы, точки, 2)
+
+    Если снимки - массивы NumPy одной формы, они собираются одним
+    np.stack. Если снимки одной длины и все точки одной ширины (не меньше
+    двух полей), все поля копируются одним np.fromiter без промежуточных
+    списков, а лишние поля отбрасываются срезом. Иначе возвращается None:
+    снимки разбираются по одному (_точки_снимка).
+    """
+    if all(isinstance(снимок, np.ndarray) for снимок in снимки):
+        if (len({снимок.shape for снимок in снимки}) == 1
+                and снимки[0].ndim == 2 and снимки[0].shape[1] >= 2):
+            return np.stack(снимки).astype(np.float64, copy=False)[:, :, :2]
+        return None
+    число_точек = len(снимки[0])
+    if any(len(снимок) != число_точек for снимок in снимки):
+        return None
+    # Ширина точки проверяется до копирования: иначе поля сдвинутся без ошибки
+    ширины = set(map(len, chain.from_iterable(снимки)))
+    if len(ширины) != 1 or min(ширины) < 2:
+        return None
+    ширина = ширины.pop()
+    буфер = np.fromiter(
+        chain.from_iterable(chain.from_iterable(снимки)),
+        dtype=np.float64, count=ширина * число_точек * len(снимки),
+    )
+    return буфер.reshape(len(снимки), число_точек, ширина)[:, :, :2]
+
+
+def получить_траектории(rastr, сигналы, режим=0):
+    """
+    Траектории нескольких сигналов за один вызов
+
+    Все сигналы приводятся к сетке времени первого сигнала. Обычно сетка
+    общая и значения копируются как есть; сигналы с другой сеткой
+    интерполируются (np.interp).
+
+    Args:
+        rastr: Объект RasterWin
+        сигналы: Список (таблица, колонка, индекс)
+        режим: Последний параметр GetChainedGraphSnapshot
+
+    Returns:
+        Траектории: время (точки,), значения (сигналы, точки) - float64, C-порядок
+    """
+    сигналы = list(сигналы)
+    if not сигналы:
+        return Траектории(np.empty(0), np.empty((0, 0)), [])
+
+    снимки = [
+        rastr.GetChainedGraphSnapshot(таблица, колонка, индекс, режим)
+        for таблица, колонка, индекс in сигналы
+    ]
+
+    точки = _в_массив(снимки)
+    if точки is not None:
+        время = точки[0, :, 1].copy()
+        if not (точки[:, :, 1] != время).any():
+            return Траектории(время, np.ascontiguousarray(точки[:, :, 0]), сигналы)
+        снимки = list(точки)
+
+    # Разные сетки времени или формат точек: каждый сигнал отдельно
+    # интерполируется на сетку первого
+    снимки = [_точки_снимка(снимок) for снимок in снимки]
+    время = снимки[0][:, 1].copy()
+    значения = np.empty((len(снимки), len(время)))
+    for номер, массив in enumerate(снимки):
+        значения[номер] = np.interp(время, массив[:, 1], массив[:, 0])
+    return Траектории(время, значения, сигналы)
+
+
+def _точки_списком(снимок):
+    """Прежний подход получить_точки_графика: список кортежей (время, значение)"""
+    точки = []
+    for точка in снимок:
+        if len(точка) >= 2:
+            точки.append((точка[1], точка[0]))
+    return точки
+
+
+class _СнимкиИзКэша:
+    """Отдает заранее полученные снимки: в бенчмарке меряется только преобразование"""
+
+    def __init__(self, снимки):
+        self._снимки = снимки
+
+    def GetChainedGraphSnapshot(self, таблица, колонка, индекс, режим=0):
+        return self._снимки[(таблица, колонка, индекс)]
+
+
+def сравнить_со_списками(число_генераторов=200, время_расчета=20.0, шаг=0.01):
+    """
+    Бенчмарк: списки кортежей и матрица NumPy для углов всех генераторов
+
+    Снимки получаются заранее, поэтому сравнивается только преобразование
+    точек и последующий расчет максимума угла каждого генератора.
+
+    Returns:
+        dict: Время и память для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    rastr = ИмитаторRastr(число_узлов=число_генераторов, число_генераторов=число_генераторов,
+                          время_расчета=время_расчета, шаг_графика=шаг)
+    rastr.FWDynamic().Run()
+    сигналы = сигналы_таблицы("Generator", "Delta", range(число_генераторов))
+    кэш = _СнимкиИзКэша({сигнал: rastr.GetChainedGraphSnapshot(*сигнал, 0) for сигнал in сигналы})
+    число_точек = len(кэш.GetChainedGraphSnapshot(*сигналы[0]))
+
+    print("\n" + "="*60)
+    print(f"ТРАЕКТОРИИ: {число_генераторов} сигналов x {число_точек} точек")
+    print("="*60)
+
+    def списками():
+        графики = [_точки_списком(кэш.GetChainedGraphSnapshot(*сигнал)) for сигнал in сигналы]
+        return графики, [max(значение for _, значение in точки) for точки in графики]
+
+    def массивами():
+        траектории = получить_траектории(кэш, сигналы)
+        return траектории, траектории.значения.max(axis=1)
+
+    сводка = {}
+    максимумы = {}
+    for способ, функция in (("Списки кортежей", списками), ("Матрица NumPy", массивами)):
+        начало = time.perf_counter()
+        _, максимумы[способ] = функция()
+        время = time.perf_counter() - начало
+
+        # Память - отдельным запуском: tracemalloc замедляет создание объектов
+        tracemalloc.start()
+        данные = функция()
+        память, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del данные
+
+        сводка[способ] = {"Время": время, "Память_МБ": память / 1024 ** 2}
+        print(f"  {способ:<16} время: {время:6.3f} с   занято памяти: {память / 1024 ** 2:7.1f} МБ")
+
+    assert np.allclose(максимумы["Списки кортежей"], максимумы["Матрица NumPy"])
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Траектории в массивах NumPy")
+    print("="*60)
+
+    rastr = ИмитаторRastr()
+    rastr.FWDynamic().Run()
+
+    время, напряжение = точки_графика_массивом(rastr, "node", "vras", 0)
+    print(f"\nУзел 0: {len(время)} точек, минимум U = {напряжение.min():.1f} кВ "
+          f"при t = {время[напряжение.argmin()]:.2f} с")
+
+    генераторы = rastr.Tables.Item("Generator")
+    траектории = получить_траектории(
+        rastr, сигналы_таблицы("Generator", "Delta", range(генераторы.Count))
+    )
+    print(f"Углы генераторов: матрица {траектории.значения.shape}, "
+          f"C-порядок: {траектории.значения.flags['C_CONTIGUOUS']}")
+    for (_, _, индекс), максимум in zip(траектории.сигналы, траектории.значения.max(axis=1)):
+        print(f"  Генератор {индекс}: максимум угла {максимум:.1f}°")
+
+    сравнить_со_списками()
@@ -0,0 +1,354 @@
+"""
+ПРИМЕР: Хранилище траекторий расчетов динамики на диске (сегменты .npy)
+
+Траектории тысяч расчетов за ночь не помещаются в память, а повторно
+извлекать их из RasterWin долго. Здесь результат получить_траектории
+(вектор времени и матрица сигналы x точки) дописывается в сегменты .npy
+фиксированной емкости, а положение каждого расчета записывается в
+индекс (JSON Lines, по строке на расчет). Чтение идет через np.load с
+mmap_mode="r": в память попадают только те сигналы и интервалы времени,
+которые действительно нужны анализу.
+
+Структура папки:
+    индекс.jsonl         - наборы сигналов и расчеты (сегмент, смещение, размеры)
+    сегмент_00000.npy    - одномерный массив float64: время и значения расчетов подряд
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from пример_траектории_numpy import Траектории
+
+ИМЯ_ИНДЕКСА = "индекс.jsonl"
+
+# Емкость сегмента по умолчанию: 16 млн значений float64 (128 МБ)
+ЕМКОСТЬ_СЕГМЕНТА = 16 * 1024 * 1024
+
+
+class ХранилищеТраекторий:
+    """
+    Дописываемое хранилище траекторий с ленивым чтением через memmap
+
+    Пример:
+        хранилище = ХранилищеТраекторий("траектории_2024_05_01")
+        хранилище.добавить("Сценарий 17", получить_траектории(rastr, сигналы),
+                           {"Система_устойчива": True})
+        ...
+        for имя, время, значения in хранилище.сканировать(("Generator", "Delta", 3)):
+            print(имя, значения.max())
+    """
+
+    def __init__(self, папка, емкость_сегмента=ЕМКОСТЬ_СЕГМЕНТА):
+        """
+        Args:
+            папка: Папка хранилища (создается, если ее нет)
+            емкость_сегмента: Сколько значений float64 помещается в один сегмент
+        """
+        self.папка = папка
+        self.емкость_сегмента = емкость_сегмента
+        os.makedirs(папка, exist_ok=True)
+
+        self.наборы_сигналов = []  # [[(таблица, колонка, индекс), ...], ...]
+        self._номера_наборов = {}  # tuple(сигналы) -> номер набора
+        self.расчеты = {}          # имя -> запись индекса
+        self._сегменты = {}        # номер -> memmap для чтения
+        self._запись = None        # (номер, файл, начало данных) текущего сегмента
+        self._заполнено = {}       # номер сегмента -> занято значений
+        self._емкости = {}         # номер сегмента -> емкость из заголовка .npy
+        self._прочитать_индекс()
+
+    def _путь_сегмента(self, номер):
+        return os.path.join(self.папка, f"сегмент_{номер:05d}.npy")
+
+    def _прочитать_индекс(self):
+        путь = os.path.join(self.папка, ИМЯ_ИНДЕКСА)
+        if not os.path.exists(путь):
+            return
+        with open(путь, "r", encoding="utf-8") as f:
+            for строка in f:
+                if not строка.strip():
+                    continue
+                запись = json.loads(строка)
+                if запись["Тип"] == "Сигналы":
+                    сигналы = [tuple(сигнал) for сигнал in запись["Сигналы"]]
+                    self._номера_наборов[tuple(сигналы)] = len(self.наборы_сигналов)
+                    self.наборы_сигналов.append(сигналы)
+                else:
+                    self.расчеты[запись["Имя"]] = запись
+                    конец = запись["Смещение"] + запись["Точек"] * (запись["Сигналов"] + 1)
+                    self._заполнено[запись["Сегмент"]] = max(
+                        self._заполнено.get(запись["Сегмент"], 0), конец
+                    )
+
+    def _дописать_индекс(self, запись):
+        with open(os.path.join(self.папка, ИМЯ_ИНДЕКСА), "a", encoding="utf-8") as f:
+            f.write(json.dumps(запись, ensure_ascii=False) + "\n")
+
+    def _номер_набора(self, сигналы):
+        ключ = tuple(tuple(сигнал) for сигнал in сигналы)
+        if ключ not in self._номера_наборов:
+            self._номера_наборов[ключ] = len(self.наборы_сигналов)
+            self.наборы_сигналов.append(list(ключ))
+            self._дописать_индекс({"Тип": "Сигналы", "Сигналы": [list(с) for с in ключ]})
+        return self._номера_наборов[ключ]
+
+    def _емкость(self, номер):
+        """
+        Емкость существующего сегмента из заголовка .npy (0 - сегмента нет)
+
+        Сегмент мог быть создан с другой емкость_сегмента (хранилище открыто
+        заново с другим параметром или расчет больше емкости), поэтому
+        свободное место считается по заголовку, а не по параметру.
+        """
+        if номер not in self._емкости:
+            путь = self._путь_сегмента(номер)
+            if not os.path.exists(путь):
+                return 0
+            self._емкости[номер] = np.load(путь, mmap_mode="r").shape[0]
+        return self._емкости[номер]
+
+    def _место(self, размер):
+        """Сегмент и смещение для размер значений: текущий сегмент или новый"""
+        номер = max(self._заполнено, default=-1)
+        if номер >= 0 and self._заполнено[номер] + размер <= self._емкость(номер):
+            смещение = self._заполнено[номер]
+        else:
+            номер += 1
+            смещение = 0
+
+        if self._запись is None or self._запись[0] != номер:
+            self._закрыть_запись()
+            путь = self._путь_сегмента(номер)
+            # Сегмент без расчетов в индексе (прерванная запись) можно пересоздать
+            if self._емкость(номер) < размер:
+                # Заголовок .npy и файл полной емкости (на диске - разреженный).
+                # Расчет больше емкости получает собственный сегмент.
+                емкость = max(размер, self.емкость_сегмента)
+                self._емкости.pop(номер, None)
+                self._сегменты.pop(номер, None)
+                with open(путь, "wb") as f:
+                    np.lib.format.write_array_header_1_0(f, {
+                        "descr": np.lib.format.dtype_to_descr(np.dtype(np.float64)),
+                        "fortran_order": False,
+                        "shape": (емкость,),
+                    })
+                    f.truncate(f.tell() + емкость * 8)
+            начало_данных = np.load(путь, mmap_mode="r").offset
+            # Запись обычным файлом: без msync на каждый расчет, как у memmap.flush()
+            self._запись = (номер, open(путь, "r+b"), начало_данных)
+        return номер, смещение
+
+    def _закрыть_запись(self):
+        if self._запись is not None:
+            self._запись[1].close()
+            self._запись = None
+
+    def добавить(self, имя, траектории, метаданные=None):
+        """
+        Дописывает траектории одного расчета
+
+        Args:
+            имя: Уникальное имя расчета
+            траектории: Траектории (результат получить_траектории)
+            метаданные: Словарь, сохраняемый в индексе (например, итог расчета)
+        """
+        if имя in self.расчеты:
+            raise ValueError(f"Расчет '{имя}' уже есть в хранилище")
+        время = np.asarray(траектории.время, dtype=np.float64)
+        значения = np.asarray(траектории.значения, dtype=np.float64)
+        число_сигналов, число_точек = значения.shape
+
+        номер, смещение = self._место(число_точек * (число_сигналов + 1))
+        _, файл, начало_данных = self._запись
+        файл.seek(начало_данных + смещение * 8)
+        файл.write(время.tobytes())
+        файл.write(np.ascontiguousarray(значения).tobytes())
+        # Данные уходят в файл до записи индекса: в индексе только полные расчеты
+        файл.flush()
+
+        запись = {
+            "Тип": "Расчет",
+            "Имя": имя,
+            "Сегмент": номер,
+            "Смещение": смещение,
+            "Точек": число_точек,
+            "Сигналов": число_сигналов,
+            "Набор": self._номер_набора(траектории.сигналы),
+            "Метаданные": метаданные or {},
+        }
+        self._дописать_индекс(запись)
+        self.расчеты[имя] = запись
+        self._заполнено[номер] = смещение + число_точек * (число_сигналов + 1)
+
+    def _сегмент(self, номер):
+        if номер not in self._сегменты:
+            self._сегменты[номер] = np.load(self._путь_сегмента(номер), mmap_mode="r")
+        return self._сегменты[номер]
+
+    def прочитать(self, имя, сигналы=None, с=None, по=None):
+        """
+        Траектории расчета (или их часть) без чтения остальных данных
+
+        Args:
+            имя: Имя расчета
+            сигналы: Список (таблица, колонка, индекс); None - все сигналы расчета
+            с: Начало интервала времени, с (None - с начала)
+            по: Конец интервала времени, с (None - до конца)
+
+        Returns:
+            Траектории: при сигналах None - представления memmap без копирования
+        """
+        запись = self.расчеты[имя]
+        сегмент = self._сегмент(запись["Сегмент"])
+        число_точек, число_сигналов = запись["Точек"], запись["Сигналов"]
+        начало = запись["Смещение"]
+
+        время = сегмент[начало:начало + число_точек]
+        матрица = сегмент[начало + число_точек:начало + число_точек * (число_сигналов + 1)]
+        матрица = матрица.reshape(число_сигналов, число_точек)
+
+        первая = 0 if с is None else int(np.searchsorted(время, с, side="left"))
+        последняя = число_точек if по is None else int(np.searchsorted(время, по, side="right"))
+
+        все_сигналы = self.наборы_сигналов[запись["Набор"]]
+        if сигналы is None:
+            return Траектории(время[первая:последняя], матрица[:, первая:последняя], все_сигналы)
+
+        позиции = {сигнал: номер for номер, сигнал in enumerate(все_сигналы)}
+        сигналы = [tuple(сигнал) for сигнал in сигналы]
+        строки = [позиции[сигнал] for сигнал in сигналы]
+        return Траектории(время[первая:последняя], матрица[строки, первая:последняя], сигналы)
+
+    def сканировать(self, сигнал, расчеты=None, с=None, по=None):
+        """
+        Один сигнал по всем (или выбранным) расчетам
+
+        Yields:
+            tuple: (имя, время, значения) - значения только этого сигнала
+        """
+        сигнал = tuple(сигнал)
+        for имя in (self.расчеты if расчеты is None else расчеты):
+            запись = self.расчеты[имя]
+            if сигнал not in self.наборы_сигналов[запись["Набор"]]:
+                continue
+            траектории = self.прочитать(имя, [сигнал], с, по)
+            yield имя, траектории.время, траектории.значения[0]
+
+    def закрыть(self):
+        """Сбрасывает текущий сегмент на диск и освобождает memmap"""
+        self._закрыть_запись()
+        self._сегменты.clear()
+
+
+def _синтетические_траектории(число_сигналов, число_точек, seed):
+    """Затухающие колебания: быстрее, чем расчет в имитаторе, для объема бенчмарка"""
+    случайные = np.random.default_rng(seed)
+    время = np.linspace(0.0, (число_точек - 1) * 0.01, число_точек)
+    частоты = случайные.uniform(0.8, 1.5, (число_сигналов, 1)) * 2 * np.pi
+    значения = 40 + 30 * np.exp(-0.3 * время) * np.sin(частоты * время)
+    сигналы = [("Generator", "Delta", номер) for номер in range(число_сигналов)]
+    return Траектории(время, np.ascontiguousarray(значения), сигналы)
+
+
+def измерить_пропускную_способность(число_расчетов=200, число_сигналов=100, число_точек=2001):
+    """
+    Бенчмарк: запись расчетов, полное чтение и сканирование одного сигнала
+    по всем расчетам (memmap) против загрузки каждого расчета целиком
+
+    Returns:
+        dict: Время и МБ/с для каждой операции
+    """
+    размер_мб = число_расчетов * число_сигналов * число_точек * 8 / 1024 ** 2
+
+    print("\n" + "="*60)
+    print(f"ХРАНИЛИЩЕ: {число_расчетов} расчетов x {число_сигналов} сигналов x "
+          f"{число_точек} точек ({размер_мб:.0f} МБ)")
+    print("="*60)
+
+    траектории = [
+        _синтетические_траектории(число_сигналов, число_точек, seed)
+        for seed in range(число_расчетов)
+    ]
+    сводка = {}
+
+    with tempfile.TemporaryDirectory() as папка:
+        начало = time.perf_counter()
+        хранилище = ХранилищеТраекторий(os.path.join(папка, "хранилище"))
+        for номер, расчет in enumerate(траектории):
+            хранилище.добавить(f"Расчет {номер}", расчет)
+        хранилище.закрыть()
+        сводка["Запись"] = time.perf_counter() - начало
+
+        # Прежний способ: файл на расчет, читается целиком
+        начало = time.perf_counter()
+        for номер, расчет in enumerate(траектории):
+            np.save(os.path.join(папка, f"расчет_{номер}.npy"), расчет.значения)
+        сводка["Запись файлов расчетов"] = time.perf_counter() - начало
+        del траектории
+
+        хранилище = ХранилищеТраекторий(os.path.join(папка, "хранилище"))
+        начало = time.perf_counter()
+        сумма = sum(float(хранилище.прочитать(имя).значения.sum()) for имя in хранилище.расчеты)
+        сводка["Полное чтение"] = time.perf_counter() - начало
+
+        сигнал = ("Generator", "Delta", число_сигналов // 2)
+        начало = time.perf_counter()
+        максимумы = [значения.max() for _, _, значения in хранилище.сканировать(сигнал)]
+        сводка["Один сигнал (memmap)"] = time.perf_counter() - начало
+
+        начало = time.perf_counter()
+        максимумы_файлов = [
+            np.load(os.path.join(папка, f"расчет_{номер}.npy"))[сигнал[2]].max()
+            for номер in range(число_расчетов)
+        ]
+        сводка["Один сигнал (файлы целиком)"] = time.perf_counter() - начало
+        хранилище.закрыть()
+
+    assert np.allclose(максимумы, максимумы_файлов) and np.isfinite(сумма)
+    # Для одного сигнала - скорость получения полезных данных (1/число_сигналов объема)
+    for операция, время in сводка.items():
+        объем = размер_мб / число_сигналов if операция.startswith("Один сигнал") else размер_мб
+        print(f"  {операция:<28} {время:6.3f} с   {объем / время:8.0f} МБ/с")
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    from пример_имитатор_RastrWin import ИмитаторRastr
+    from пример_траектории_numpy import получить_траектории, сигналы_таблицы
+
+    print("="*60)
+    print("ПРИМЕР: Хранилище траекторий")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as папка:
+        хранилище = ХранилищеТраекторий(папка, емкость_сегмента=10_000)
+        rastr = ИмитаторRastr()
+        генераторы = rastr.Tables.Item("Generator")
+        P = генераторы.Cols("P")
+        сигналы = сигналы_таблицы("Generator", "Delta", range(генераторы.Count))
+
+        for номер in range(4):
+            fw = rastr.FWDynamic()
+            fw.Run()
+            хранилище.добавить(f"Утяжеление {номер}", получить_траектории(rastr, сигналы),
+                               {"Система_устойчива": fw.SyncLossCause == 0})
+            for строка in range(генераторы.Count):
+                P.SetZ(строка, P.Z(строка) * 1.1)
+        хранилище.закрыть()
+
+        # Новый процесс анализа открывает хранилище по индексу
+        хранилище = ХранилищеТраекторий(папка)
+        print(f"\nРасчетов: {len(хранилище.расчеты)}, сегментов: "
+              f"{len([ф for ф in os.listdir(папка) if ф.endswith('.npy')])}")
+        for имя, время, значения in хранилище.сканировать(("Generator", "Delta", 0), с=0.0, по=1.0):
+            устойчив = хранилище.расчеты[имя]["Метаданные"]["Система_устойчива"]
+            print(f"  {имя}: устойчива={устойчив}, точек {len(время)}, "
+                  f"максимум угла до 1 с: {значения.max():.1f}°")
+        хранилище.закрыть()
+
+    измерить_пропускную_способность()
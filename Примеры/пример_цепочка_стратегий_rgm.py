@@ -0,0 +1,276 @@
+"""
+ПРИМЕР: Цепочка стратегий rgm с обучением по статистике сходимости
+
+В пример_расчета_режима перечислены параметры rgm: "", "p", "z", "c", "r".
+Несошедшиеся режимы обычно пересчитывают вручную с другими параметрами.
+Здесь rgm запускается по цепочке стратегий до первой сошедшейся. Для
+каждой пары (схема, класс сценария) запоминается, какая стратегия сошлась
+и сколько времени заняла, и цепочка переупорядочивается так, чтобы первой
+шла самая дешевая из сходящихся. Статистику можно хранить в JSON между
+запусками.
+
+Стратегии без контроля ("c") и без подготовки данных ("r") могут дать
+режим по непроверенным данным, поэтому по умолчанию они не продвигаются
+в начало цепочки и запускаются только после отказа всех остальных.
+"""
+
+import json
+import os
+import time
+
+# Параметры rgm (см. пример_расчета_режима в пример_COM_соединение.py)
+СТРАТЕГИИ_RGM = ("", "p", "z", "c", "r")
+
+# Стратегии, пропускающие контроль или подготовку данных
+РИСКОВАННЫЕ_СТРАТЕГИИ = ("c", "r")
+
+
+class ЦепочкаСтратегийRgm:
+    """
+    Запуск rgm по цепочке стратегий с переупорядочиванием по статистике
+
+    Первыми идут стратегии, уже сходившиеся для пары (схема, класс), по
+    ожидаемой стоимости до успеха: среднее время попытки, деленное на
+    оценку вероятности сходимости (успехов + 1) / (попыток + 2). За ними -
+    еще не опробованные, затем не сходившиеся ни разу. Неопробованная
+    стратегия проверяется раньше известных не чаще, чем раз в
+    исследовать_каждые расчетов. Рискованные стратегии (РИСКОВАННЫЕ_СТРАТЕГИИ)
+    без разрешить_рискованные всегда стоят в конце в исходном порядке.
+
+    Пример:
+        цепочка = ЦепочкаСтратегийRgm(rastr, путь_статистики="rgm_статистика.json")
+        kod = цепочка.rgm("base.rst", "Отключение ветви")
+        print(цепочка.последний_расчет)
+        цепочка.сохранить()
+    """
+
+    def __init__(self, rastr, стратегии=СТРАТЕГИИ_RGM, путь_статистики=None, обучать=True,
+                 исследовать_каждые=20, разрешить_рискованные=False):
+        """
+        Args:
+            rastr: Объект RasterWin (COM или имитатор)
+            стратегии: Параметры rgm в исходном порядке
+            путь_статистики: JSON-файл со статистикой (None - только в памяти)
+            обучать: False - всегда исходный порядок (статистика все равно копится)
+            исследовать_каждые: Раз в столько расчетов пары (схема, класс)
+                неопробованная стратегия запускается первой; None - только
+                после отказа известных
+            разрешить_рискованные: Продвигать "c" и "r" по статистике наравне
+                с остальными
+        """
+        self.rastr = rastr
+        self.стратегии = tuple(стратегии)
+        self.путь_статистики = путь_статистики
+        self.обучать = обучать
+        self.исследовать_каждые = исследовать_каждые
+        self.разрешить_рискованные = разрешить_рискованные
+        self.последний_расчет = None
+        self._расчетов = {}  # "схема|класс" -> число расчетов в этом запуске
+
+        # "схема|класс" -> {стратегия: {"Попыток", "Успехов", "Время"}}
+        self.статистика = {}
+        if путь_статистики and os.path.exists(путь_статистики):
+            with open(путь_статистики, "r", encoding="utf-8") as f:
+                self.статистика = json.load(f)
+
+    @staticmethod
+    def _ключ(схема, класс_сценария):
+        return f"{схема}|{класс_сценария}"
+
+    def _оценка(self, данные):
+        """Ожидаемое время до успеха при запуске стратегии первой"""
+        вероятность = (данные["Успехов"] + 1) / (данные["Попыток"] + 2)
+        return данные["Время"] / данные["Попыток"] / вероятность
+
+    def порядок(self, схема, класс_сценария):
+        """
+        Порядок стратегий для схемы и класса сценария
+
+        Returns:
+            list: Параметры rgm в порядке запуска
+        """
+        if not self.обучать:
+            return list(self.стратегии)
+
+        ключ = self._ключ(схема, класс_сценария)
+        статистика = self.статистика.get(ключ, {})
+        рискованные = [] if self.разрешить_рискованные else [
+            с for с in self.стратегии if с in РИСКОВАННЫЕ_СТРАТЕГИИ
+        ]
+        обучаемые = [с for с in self.стратегии if с not in рискованные]
+
+        сходившиеся = sorted(
+            (с for с in обучаемые if статистика.get(с, {}).get("Успехов")),
+            key=lambda с: self._оценка(статистика[с]),
+        )
+        неопробованные = [с for с in обучаемые if с not in статистика]
+        не_сходившиеся = sorted(
+            (с for с in обучаемые if с in статистика and с not in сходившиеся),
+            key=lambda с: self._оценка(статистика[с]),
+        )
+
+        if (неопробованные and сходившиеся and self.исследовать_каждые
+                and self._расчетов.get(ключ, 0) % self.исследовать_каждые == self.исследовать_каждые - 1):
+            # Ограниченное исследование: одна неопробованная стратегия первой
+            return неопробованные[:1] + сходившиеся + неопробованные[1:] + не_сходившиеся + рискованные
+        return сходившиеся + неопробованные + не_сходившиеся + рискованные
+
+    def rgm(self, схема, класс_сценария):
+        """
+        Расчет режима по цепочке до первой сошедшейся стратегии
+
+        Args:
+            схема: Имя схемы (например, файл модели)
+            класс_сценария: Класс сценария, например "Утяжеление" или "Отключение ветви"
+
+        Returns:
+            int: 0 - режим сбалансирован, иначе код последней попытки
+        """
+        ключ = self._ключ(схема, класс_сценария)
+        статистика = self.статистика.setdefault(ключ, {})
+        попытки = []
+        kod = 1
+
+        порядок = self.порядок(схема, класс_сценария)
+        self._расчетов[ключ] = self._расчетов.get(ключ, 0) + 1
+        for стратегия in порядок:
+            начало = time.perf_counter()
+            kod = self.rastr.rgm(стратегия)
+            время = time.perf_counter() - начало
+
+            данные = статистика.setdefault(стратегия, {"Попыток": 0, "Успехов": 0, "Время": 0.0})
+            данные["Попыток"] += 1
+            данные["Время"] += время
+            if kod == 0:
+                данные["Успехов"] += 1
+            попытки.append((стратегия, kod, время))
+            if kod == 0:
+                break
+
+        self.последний_расчет = {
+            "Стратегия": попытки[-1][0] if kod == 0 else None,
+            "Попыток": len(попытки),
+            "Время": sum(время for _, _, время in попытки),
+        }
+        return kod
+
+    def сохранить(self, путь=None):
+        """Записывает статистику в JSON"""
+        путь = путь or self.путь_статистики
+        if путь is None:
+            raise ValueError("Не задан путь для сохранения статистики")
+        with open(путь, "w", encoding="utf-8") as f:
+            json.dump(self.статистика, f, ensure_ascii=False, indent=2)
+
+    def сводка(self):
+        """
+        Returns:
+            dict: {"схема|класс": {"Порядок": [...], стратегия: "успехов/попыток, среднее время"}}
+        """
+        сводка = {}
+        for ключ, статистика in self.статистика.items():
+            схема, класс_сценария = ключ.split("|", 1)
+            строка = {"Порядок": self.порядок(схема, класс_сценария)}
+            for стратегия, данные in статистика.items():
+                строка[стратегия or '""'] = (
+                    f"{данные['Успехов']}/{данные['Попыток']}, "
+                    f"{данные['Время'] / данные['Попыток'] * 1000:.0f} мс"
+                )
+            сводка[ключ] = строка
+        return сводка
+
+
+def подготовить_сценарий(rastr, номер, класс_сценария):
+    """Изменения схемы для условных классов сценариев"""
+    генераторы = rastr.Tables.Item("Generator")
+    P = генераторы.Cols("P")
+    if класс_сценария == "Утяжеление":
+        for строка in range(генераторы.Count):
+            P.SetZ(строка, P.Z(строка) * 1.01)
+    elif класс_сценария == "Отключение ветви":
+        ветви = rastr.Tables.Item("vetv")
+        ветви.Cols("sta").SetZ(номер % ветви.Count, 1)
+        ветви.Cols("sta").SetZ((номер - 1) % ветви.Count, 0)
+    elif класс_сценария == "После расхождения":
+        # Предыдущий расчет разошелся и оставил в таблице узлов негодное приближение
+        for строка in range(генераторы.Count):
+            P.SetZ(строка, P.Z(строка) * 2.0)
+        rastr.rgm("")
+        for строка in range(генераторы.Count):
+            P.SetZ(строка, P.Z(строка) / 2.0)
+
+
+def сравнить_с_фиксированной_цепочкой(число_сценариев=90, время_итерации=0.002,
+                                      время_подготовки=0.01):
+    """
+    Бенчмарк: фиксированный порядок СТРАТЕГИИ_RGM и обучаемая цепочка
+
+    Args:
+        число_сценариев: Количество сценариев (классы чередуются)
+        время_итерации: Стоимость одной итерации rgm, с
+        время_подготовки: Стоимость подготовки данных rgm, с
+
+    Returns:
+        dict: Время расчетов и число запусков rgm для каждого способа
+    """
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    классы = ("Утяжеление", "Отключение ветви", "После расхождения")
+
+    print("\n" + "="*60)
+    print(f"ЦЕПОЧКА СТРАТЕГИЙ RGM: {число_сценариев} сценариев, классы: {', '.join(классы)}")
+    print("="*60)
+
+    сводка = {}
+    for способ, обучать in (("Фиксированная", False), ("Обучаемая", True)):
+        rastr = ИмитаторRastr(число_узлов=200, время_итерации=время_итерации,
+                              время_подготовки=время_подготовки)
+        цепочка = ЦепочкаСтратегийRgm(rastr, обучать=обучать)
+        rastr.rgm("p")
+        время = 0.0
+        попыток = 0
+
+        for номер in range(число_сценариев):
+            класс_сценария = классы[номер % len(классы)]
+            подготовить_сценарий(rastr, номер, класс_сценария)
+            цепочка.rgm("base.rst", класс_сценария)
+            время += цепочка.последний_расчет["Время"]
+            попыток += цепочка.последний_расчет["Попыток"]
+
+        сводка[способ] = {"Время": время, "Попыток": попыток}
+        print(f"  {способ:<14} время rgm: {время:5.2f} с   запусков rgm: {попыток}")
+        if обучать:
+            for ключ, строка in цепочка.сводка().items():
+                print(f"    {ключ}: {строка}")
+
+    return сводка
+
+
+# Пример использования
+if __name__ == "__main__":
+    import tempfile
+
+    from пример_имитатор_RastrWin import ИмитаторRastr
+
+    print("="*60)
+    print("ПРИМЕР: Цепочка стратегий rgm")
+    print("="*60)
+
+    путь = os.path.join(tempfile.gettempdir(), "rgm_статистика.json")
+    if os.path.exists(путь):
+        os.remove(путь)
+
+    rastr = ИмитаторRastr(время_подготовки=0.005, время_итерации=0.001)
+    цепочка = ЦепочкаСтратегийRgm(rastr, путь_статистики=путь)
+    rastr.rgm("p")
+    for номер in range(8):
+        подготовить_сценарий(rastr, номер, "После расхождения")
+        kod = цепочка.rgm("base.rst", "После расхождения")
+        print(f"  Сценарий {номер + 1}: код {kod}, {цепочка.последний_расчет}")
+
+    цепочка.сохранить()
+    print(f"\nСтатистика сохранена: {путь}")
+    print(f"Порядок после перезапуска: "
+          f"{ЦепочкаСтратегийRgm(rastr, путь_статистики=путь).порядок('base.rst', 'После расхождения')}")
+
+    сравнить_с_фиксированной_цепочкой()
@@ -5,7 +5,9 @@
 через бинарный поиск (дихотомию).
 """
 
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 def проверить_устойчивость_системы(параметр_нагрузки):
@@ -90,7 +92,48 @@ def найти_последний_устойчивый_режим_линейно
     return последняя_устойчивая
 
 
-def найти_последний_устойчивый_режим_бинарно(мин_нагрузка, макс_нагрузка, точность=1.0):
+def сузить_интервал_бинарно(нижняя_граница, верхняя_граница, точность, функция_проверки):
+    """
+    Сужает интервал [устойчиво, неустойчиво] делением пополам
+    
+    Границы уже должны быть проверены: нижняя устойчива, верхняя нет.
+    
+    Args:
+        нижняя_граница: Заведомо устойчивая нагрузка
+        верхняя_граница: Заведомо неустойчивая нагрузка
+        точность: Требуемая точность поиска
+        функция_проверки: Функция(нагрузка) -> bool
+        
+    Returns:
+        tuple: (последняя устойчивая нагрузка, число итераций)
+    """
+    итерация = 0
+    
+    # Бинарный поиск
+    while (верхняя_граница - нижняя_граница) > точность:
+        итерация += 1
+        
+        # Средняя точка
+        средняя_нагрузка = (нижняя_граница + верхняя_граница) / 2.0
+        
+        print(f"\nИтерация {итерация}:")
+        print(f"  Диапазон: [{нижняя_граница:.2f}, {верхняя_граница:.2f}] МВт")
+        print(f"  Средняя точка: {средняя_нагрузка:.2f} МВт")
+        
+        устойчива = функция_проверки(средняя_нагрузка)
+        
+        if устойчива:
+            print(f"  ✅ УСТОЙЧИВА → перемещаем нижнюю границу")
+            нижняя_граница = средняя_нагрузка
+        else:
+            print(f"  ❌ НЕУСТОЙЧИВА → перемещаем верхнюю границу")
+            верхняя_граница = средняя_нагрузка
+    
+    return нижняя_граница, итерация
+
+
+def найти_последний_устойчивый_режим_бинарно(мин_нагрузка, макс_нагрузка, точность=1.0,
+                                             функция_проверки=None):
     """
     Поиск последнего устойчивого режима бинарным поиском (быстро и эффективно)
     
@@ -100,10 +143,15 @@ def найти_последний_устойчивый_режим_бинарно
         мин_нагрузка: Минимальное значение нагрузки
         макс_нагрузка: Максимальное значение нагрузки
         точность: Требуемая точность поиска
+        функция_проверки: Функция(нагрузка) -> bool, по умолчанию
+            проверить_устойчивость_системы
         
     Returns:
         float: Последнее значение нагрузки, при котором система устойчива
     """
+    if функция_проверки is None:
+        функция_проверки = проверить_устойчивость_системы
+    
     print("\n" + "="*60)
     print("БИНАРНЫЙ ПОИСК ПОСЛЕДНЕГО УСТОЙЧИВОГО РЕЖИМА")
     print("="*60)
@@ -115,49 +163,287 @@ def найти_последний_устойчивый_режим_бинарно
     # Проверяем границы
     print(f"\nПроверка границ:")
     print(f"  Нижняя граница ({нижняя_граница} МВт): ", end="")
-    if проверить_устойчивость_системы(нижняя_граница):
+    if функция_проверки(нижняя_граница):
         print("✅ УСТОЙЧИВА")
     else:
         print("❌ НЕУСТОЙЧИВА (это не должно быть!)")
         return None
     
     print(f"  Верхняя граница ({верхняя_граница} МВт): ", end="")
-    if проверить_устойчивость_системы(верхняя_граница):
+    if функция_проверки(верхняя_граница):
         print("✅ УСТОЙЧИВА (значит весь диапазон устойчив)")
         return верхняя_граница
     else:
         print("❌ НЕУСТОЙЧИВА")
     
-    итерация = 0
+    нижняя_граница, итерация = сузить_интервал_бинарно(
+        нижняя_граница, верхняя_граница, точность, функция_проверки
+    )
     
-    # Бинарный поиск
-    while (верхняя_граница - нижняя_граница) > точность:
-        итерация += 1
+    результат = нижняя_граница
+    print(f"\n✅ Результат: Последний устойчивый режим = {результат:.2f} МВт")
+    print(f"   Итераций выполнено: {итерация}")
+    print(f"   Точность: {точность:.2f} МВт")
+    
+    return результат
+
+
+def найти_последний_устойчивый_режим_экспоненциально(начальная_нагрузка, начальный_шаг=10.0,
+                                                     точность=1.0, макс_нагрузка=None,
+                                                     функция_проверки=None, макс_удвоений=30):
+    """
+    Экспоненциальный ("галопирующий") поиск последнего устойчивого режима
+    
+    Начинает с заведомо устойчивой нагрузки и удваивает шаг, пока не
+    получит неустойчивый режим. Найденный интервал затем сужается
+    бинарным поиском. Число расчетов растет как логарифм расстояния до
+    границы, а верхнюю границу заранее знать не нужно.
+    
+    Args:
+        начальная_нагрузка: Заведомо устойчивая нагрузка
+        начальный_шаг: Первый шаг увеличения нагрузки
+        точность: Требуемая точность поиска
+        макс_нагрузка: Необязательный предел (дальше него не идем)
+        функция_проверки: Функция(нагрузка) -> bool, по умолчанию
+            проверить_устойчивость_системы
+        макс_удвоений: Предел числа шагов разгона (защита от бесконечного
+            цикла, если проверка всегда возвращает "устойчиво")
         
-        # Средняя точка
-        средняя_нагрузка = (нижняя_граница + верхняя_граница) / 2.0
+    Returns:
+        float: Последнее значение нагрузки, при котором система устойчива
+    """
+    if начальный_шаг <= 0:
+        raise ValueError(f"Начальный шаг должен быть положительным: {начальный_шаг}")
+    if функция_проверки is None:
+        функция_проверки = проверить_устойчивость_системы
+    
+    print("\n" + "="*60)
+    print("ЭКСПОНЕНЦИАЛЬНЫЙ ПОИСК ПОСЛЕДНЕГО УСТОЙЧИВОГО РЕЖИМА")
+    print("="*60)
+    
+    print(f"\nПроверка начальной точки ({начальная_нагрузка} МВт): ", end="")
+    if функция_проверки(начальная_нагрузка):
+        print("✅ УСТОЙЧИВА")
+    else:
+        print("❌ НЕУСТОЙЧИВА (это не должно быть!)")
+        return None
+    
+    нижняя_граница = начальная_нагрузка
+    шаг = начальный_шаг
+    проверок = 1
+    
+    # Разгон: удваиваем шаг, пока не получим неустойчивый режим
+    for _ in range(макс_удвоений):
+        верхняя_граница = нижняя_граница + шаг
+        if макс_нагрузка is not None and верхняя_граница >= макс_нагрузка:
+            верхняя_граница = макс_нагрузка
         
-        print(f"\nИтерация {итерация}:")
-        print(f"  Диапазон: [{нижняя_граница:.2f}, {верхняя_граница:.2f}] МВт")
-        print(f"  Средняя точка: {средняя_нагрузка:.2f} МВт")
+        print(f"\nРазгон: шаг {шаг:.2f} МВт → {верхняя_граница:.2f} МВт")
+        проверок += 1
         
-        устойчива = проверить_устойчивость_системы(средняя_нагрузка)
+        if not функция_проверки(верхняя_граница):
+            print("  ❌ НЕУСТОЙЧИВА → граница найдена, переходим к бинарному поиску")
+            break
         
-        if устойчива:
-            print(f"  ✅ УСТОЙЧИВА → перемещаем нижнюю границу")
-            нижняя_граница = средняя_нагрузка
-        else:
-            print(f"  ❌ НЕУСТОЙЧИВА → перемещаем верхнюю границу")
-            верхняя_граница = средняя_нагрузка
+        print("  ✅ УСТОЙЧИВА → удваиваем шаг")
+        нижняя_граница = верхняя_граница
+        шаг *= 2.0
+        
+        if макс_нагрузка is not None and нижняя_граница >= макс_нагрузка:
+            print(f"\n✅ Весь диапазон до {макс_нагрузка:.2f} МВт устойчив")
+            return макс_нагрузка
+    else:
+        print(f"\n⚠️ За {макс_удвоений} удвоений шага неустойчивый режим не найден")
+        print(f"   Возвращаем последнюю проверенную устойчивую нагрузку: {нижняя_граница:.2f} МВт")
+        return нижняя_граница
+    
+    результат, итераций = сузить_интервал_бинарно(
+        нижняя_граница, верхняя_граница, точность, функция_проверки
+    )
+    проверок += итераций
+    
+    print(f"\n✅ Результат: Последний устойчивый режим = {результат:.2f} МВт")
+    print(f"   Проверок выполнено: {проверок}")
+    
+    return результат
+
+
+def точки_деления_как_в_бисекции(нижняя_граница, верхняя_граница, глубина):
+    """
+    Делит интервал на 2**глубина равных частей так же, как это сделал бы
+    бинарный поиск за "глубина" итераций
+    
+    Точки считаются последовательным делением пополам, поэтому значения
+    совпадают с серединами бинарного поиска до последнего бита.
+    
+    Args:
+        нижняя_граница: Левая граница интервала
+        верхняя_граница: Правая граница интервала
+        глубина: Сколько уровней бисекции проверяется за один раунд
+        
+    Returns:
+        list: Внутренние точки интервала (2**глубина - 1 штук) по возрастанию
+    """
+    точки = [нижняя_граница, верхняя_граница]
+    for _ in range(глубина):
+        новые_точки = [точки[0]]
+        for левая, правая in zip(точки, точки[1:]):
+            новые_точки.append((левая + правая) / 2.0)
+            новые_точки.append(правая)
+        точки = новые_точки
+    return точки[1:-1]
+
+
+def найти_последний_устойчивый_режим_k_ично(мин_нагрузка, макс_нагрузка, точность=1.0,
+                                            число_рабочих=4, функция_проверки=None,
+                                            исполнитель=None):
+    """
+    Параллельный k-ичный поиск последнего устойчивого режима
+    
+    За один раунд интервал делится на k+1 частей, и все k точек проверяются
+    одновременно на пуле расчетных рабочих. Интервал сужается в k+1 раз
+    за раунд вместо 2 раз у бинарного поиска.
+    
+    k выбирается как 2**d - 1 (не больше числа рабочих): тогда проверяемые
+    точки - это ровно следующие d уровней бинарного поиска, и результат
+    совпадает с найти_последний_устойчивый_режим_бинарно.
+    
+    ВАЖНО: Один объект Astra.Rastr однопоточный. Для реальных расчетов
+    передайте исполнитель, у которого каждый рабочий имеет свой экземпляр
+    RasterWin (например, пул процессов).
+    
+    Args:
+        мин_нагрузка: Минимальное значение нагрузки (заведомо устойчиво)
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+        число_рабочих: Количество одновременно выполняемых проверок
+        функция_проверки: Функция(нагрузка) -> bool, по умолчанию
+            проверить_устойчивость_системы
+        исполнитель: Готовый concurrent.futures.Executor (необязательно)
+        
+    Returns:
+        float: Последнее значение нагрузки, при котором система устойчива
+    """
+    if функция_проверки is None:
+        функция_проверки = проверить_устойчивость_системы
+    
+    print("\n" + "="*60)
+    print(f"ПАРАЛЛЕЛЬНЫЙ K-ИЧНЫЙ ПОИСК (рабочих: {число_рабочих})")
+    print("="*60)
+    
+    # Сколько уровней бисекции помещается в один раунд: k = 2**d - 1 <= число_рабочих
+    максимальная_глубина = max(1, int(math.log2(число_рабочих + 1)))
+    
+    собственный_исполнитель = исполнитель is None
+    if собственный_исполнитель:
+        исполнитель = ThreadPoolExecutor(max_workers=число_рабочих)
+    
+    try:
+        нижняя_граница = мин_нагрузка
+        верхняя_граница = макс_нагрузка
+        
+        # Обе границы проверяем одновременно
+        print(f"\nПроверка границ: {нижняя_граница} и {верхняя_граница} МВт")
+        нижняя_устойчива, верхняя_устойчива = исполнитель.map(
+            функция_проверки, [нижняя_граница, верхняя_граница]
+        )
+        
+        if not нижняя_устойчива:
+            print("  ❌ Нижняя граница НЕУСТОЙЧИВА (это не должно быть!)")
+            return None
+        if верхняя_устойчива:
+            print("  ✅ Верхняя граница УСТОЙЧИВА (значит весь диапазон устойчив)")
+            return верхняя_граница
+        
+        раунд = 0
+        всего_проверок = 2
+        
+        while (верхняя_граница - нижняя_граница) > точность:
+            раунд += 1
+            
+            # Сколько делений пополам осталось бинарному поиску
+            осталось_уровней = math.ceil(
+                math.log2((верхняя_граница - нижняя_граница) / точность)
+            )
+            глубина = min(максимальная_глубина, осталось_уровней)
+            точки = точки_деления_как_в_бисекции(нижняя_граница, верхняя_граница, глубина)
+            
+            print(f"\nРаунд {раунд}:")
+            print(f"  Диапазон: [{нижняя_граница:.2f}, {верхняя_граница:.2f}] МВт")
+            print(f"  Точки ({len(точки)}): " + ", ".join(f"{т:.2f}" for т in точки))
+            
+            результаты = list(исполнитель.map(функция_проверки, точки))
+            всего_проверок += len(точки)
+            
+            # Граница - между последней устойчивой и первой неустойчивой точкой
+            for точка, устойчива in zip(точки, результаты):
+                if устойчива:
+                    нижняя_граница = точка
+                else:
+                    верхняя_граница = точка
+                    break
+            
+            print(f"  → Новый диапазон: [{нижняя_граница:.2f}, {верхняя_граница:.2f}] МВт")
+    finally:
+        if собственный_исполнитель:
+            исполнитель.shutdown()
     
     результат = нижняя_граница
     print(f"\n✅ Результат: Последний устойчивый режим = {результат:.2f} МВт")
-    print(f"   Итераций выполнено: {итерация}")
-    print(f"   Точность: {точность:.2f} МВт")
+    print(f"   Раундов выполнено: {раунд}")
+    print(f"   Проверок выполнено: {всего_проверок}")
     
     return результат
 
 
+def сравнить_время_поиска(мин_нагрузка, макс_нагрузка, точность=1.0, число_рабочих=7):
+    """
+    Бенчмарк: сравнивает время бинарного и параллельного k-ичного поиска
+    
+    Оба поиска используют одну и ту же имитацию проверить_устойчивость_системы
+    (с задержкой time.sleep), поэтому разница во времени показывает выигрыш
+    от параллельных проверок.
+    
+    Args:
+        мин_нагрузка: Минимальное значение нагрузки
+        макс_нагрузка: Максимальное значение нагрузки
+        точность: Требуемая точность поиска
+        число_рабочих: Количество рабочих для k-ичного поиска
+        
+    Returns:
+        dict: Время и результаты обоих поисков
+    """
+    начало = time.perf_counter()
+    результат_бинарный = найти_последний_устойчивый_режим_бинарно(
+        мин_нагрузка, макс_нагрузка, точность
+    )
+    время_бинарный = time.perf_counter() - начало
+    
+    начало = time.perf_counter()
+    результат_k_ичный = найти_последний_устойчивый_режим_k_ично(
+        мин_нагрузка, макс_нагрузка, точность, число_рабочих=число_рабочих
+    )
+    время_k_ичный = time.perf_counter() - начало
+    
+    print("\n" + "="*60)
+    print("СРАВНЕНИЕ ВРЕМЕНИ ПОИСКА")
+    print("="*60)
+    print(f"  Бинарный поиск:          {время_бинарный:.2f} с → {результат_бинарный}")
+    print(f"  K-ичный ({число_рабочих} рабочих):    {время_k_ичный:.2f} с → {результат_k_ичный}")
+    print(f"  Ускорение: {время_бинарный / время_k_ичный:.1f}x")
+    if результат_бинарный == результат_k_ичный:
+        print("  ✅ Результаты совпадают")
+    else:
+        print("  ❌ Результаты различаются!")
+    
+    return {
+        "Время_бинарный": время_бинарный,
+        "Время_k_ичный": время_k_ичный,
+        "Результат_бинарный": результат_бинарный,
+        "Результат_k_ичный": результат_k_ичный,
+    }
+
+
 def пример_с_корректировкой_генераторов():
     """
     Пример более сложного цикла с корректировкой мощности генераторов
@@ -196,7 +482,7 @@ def пример_с_корректировкой_генераторов():
             print(f"  ✅ Система УСТОЙЧИВА")
             print(f"\n✅ Результат: Последний устойчивый режим найден!")
             print(f"   Общая нагрузка: {общая_нагрузка:.2f} МВт")
-            for имя, параметры in генераторов.items():
+            for имя, параметры in генераторы.items():
                 print(f"   {имя}: {параметры['P_текущая']} МВт")
             break
         else:
@@ -244,6 +530,13 @@ if __name__ == "__main__":
     # Метод 3: С корректировкой генераторов
     пример_с_корректировкой_генераторов()
     
+    # Метод 4: Экспоненциальный поиск (верхняя граница не нужна)
+    результат4 = найти_последний_устойчивый_режим_экспоненциально(мин, начальный_шаг=10.0,
+                                                                  точность=1.0)
+    
+    # Метод 5: Параллельный k-ичный поиск (сравнение с бинарным)
+    сравнить_время_поиска(мин, макс, точность=1.0, число_рабочих=7)
+    
     print("\n" + "="*60)
     print("✅ ВСЕ ПРИМЕРЫ ЗАВЕРШЕНЫ")
     print("="*60)
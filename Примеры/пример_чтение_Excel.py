@@ -6,7 +6,6 @@
 """
 
 from pathlib import Path
-from openpyxl import load_workbook
 
 
 def читать_параметры_расчета(путь_к_файлу, лист="Параметры"):
@@ -20,6 +19,8 @@ def читать_параметры_расчета(путь_к_файлу, ли
     Returns:
         dict: Словарь с параметрами расчета
     """
+    from openpyxl import load_workbook
+
     if not Path(путь_к_файлу).exists():
         print(f"❌ Файл не найден: {путь_к_файлу}")
         return None
@@ -81,6 +82,8 @@ def читать_генераторы(путь_к_файлу, лист="Гене
     Returns:
         list: Список словарей с данными генераторов
     """
+    from openpyxl import load_workbook
+
     if not Path(путь_к_файлу).exists():
         print(f"❌ Файл не найден: {путь_к_файлу}")
         return []
@@ -136,6 +139,8 @@ def читать_настройки_расчета(путь_к_файлу):
     Returns:
         dict: Словарь с настройками
     """
+    from openpyxl import load_workbook
+
     if not Path(путь_к_файлу).exists():
         print(f"❌ Файл не найден: {путь_к_файлу}")
         return {}